@@ -0,0 +1,78 @@
+"""event loop stall benchmark: inline from_records vs aiter_records
+
+   A ticker task records the longest gap between its turns while a large
+   batch is validated.
+
+   usage: PYTHONPATH=. python benchmarks/bench_aio.py
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from typedclass import Typed, Field, Boolean, Decimal, Integer
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    customer = Field(is_required=True)
+    paid = Field(Boolean, default=False)
+    total = Field(Decimal(2))
+
+
+RECORDS = [
+    dict(id=str(n), customer=f"c{n}", paid="1", total="9.99")
+    for n in range(100000)
+]
+
+
+async def stall(validate):
+    """return (longest gap between ticker turns, total seconds)"""
+    gaps = []
+
+    async def ticker():
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await validate()
+    total = time.perf_counter() - start
+    await asyncio.sleep(0)  # the ticker's turn after the batch
+    task.cancel()
+    return max(gaps), total
+
+
+async def inline():
+    Order.from_records(RECORDS)
+
+
+async def chunked():
+    async for _ in Order.aiter_records(RECORDS, chunk_size=500):
+        pass
+
+
+async def executor():
+    with ThreadPoolExecutor(1) as pool:
+        async for _ in Order.aiter_records(
+                RECORDS, chunk_size=500, executor=pool):
+            pass
+
+
+def run():
+    return {
+        name: asyncio.run(stall(validate))
+        for name, validate in (
+            ("inline", inline), ("aiter_records", chunked),
+            ("aiter_records.executor", executor))
+    }
+
+
+if __name__ == "__main__":
+    for name, (gap, total) in run().items():
+        print(f"{name:24} max stall {gap * 1000:8.2f}ms"
+              f"  total {total:.3f}s")
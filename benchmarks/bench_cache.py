@@ -0,0 +1,44 @@
+"""coercion cache benchmark: repeated values with and without Field(cache=)
+
+   usage: PYTHONPATH=. python benchmarks/bench_cache.py
+"""
+import timeit
+
+from typedclass import Typed, Field, Decimal, Integer, Set, String
+
+
+class Plain(Typed):
+    status = Field(Set("new", "paid", "shipped"))
+    currency = Field(String(min=3, max=3))
+    price = Field(Decimal(2))
+    quantity = Field(Integer)
+
+
+class Cached(Typed):
+    status = Field(Set("new", "paid", "shipped"), cache=64)
+    currency = Field(String(min=3, max=3), cache=64)
+    price = Field(Decimal(2), cache=1024)
+    quantity = Field(Integer, cache=1024)
+
+
+ROWS = [
+    dict(status=("new", "paid", "shipped")[n % 3], currency="USD",
+         price=f"{n % 50}.99", quantity=n % 10)
+    for n in range(1000)
+]
+
+
+def run(number=20):
+    results = {}
+    for cls in (Plain, Cached):
+        results[cls.__name__] = min(timeit.repeat(
+            lambda: cls.from_records(ROWS), number=number, repeat=5,
+        )) / number / len(ROWS)
+    return results
+
+
+if __name__ == "__main__":
+    results = run()
+    for name, seconds in results.items():
+        print(f"{name:10} {seconds * 1e6:8.3f} us/record")
+    print(f"speedup    {results['Plain'] / results['Cached']:8.2f}x")
@@ -0,0 +1,57 @@
+"""binary codec benchmark: to_bytes/from_bytes vs JSON
+
+   usage: PYTHONPATH=. python benchmarks/bench_codec.py
+"""
+import json
+import timeit
+
+from typedclass import (
+    Typed, Field, List, Boolean, Decimal, ISODate, ISODateTime, Integer, Set)
+
+
+class Item(Typed):
+    sku = Field(is_required=True)
+    quantity = Field(Integer, default=1)
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    customer = Field(is_required=True)
+    paid = Field(Boolean, default=False)
+    total = Field(Decimal(2))
+    day = Field(ISODate)
+    created = Field(ISODateTime)
+    status = Field(Set("new", "paid", "shipped"))
+    items = Field(List(Item))
+    scores = Field(List(Integer))
+
+
+ORDER = Order(
+    id=12345, customer="someone", paid=True, total="1234.56",
+    day="2020-01-02", created="2020-01-02T03:04:05", status="paid",
+    items=[dict(sku=f"sku{n}", quantity=n) for n in range(5)],
+    scores=list(range(20)))
+
+
+def run(number=20000):
+    text = ORDER.to_json()
+    data = ORDER.to_bytes()
+
+    def from_json():
+        return Order.from_dict(json.loads(text))
+
+    return {
+        "size.json": len(text.encode()),
+        "size.bytes": len(data),
+        "encode.to_json": timeit.timeit(ORDER.to_json, number=number),
+        "encode.to_bytes": timeit.timeit(ORDER.to_bytes, number=number),
+        "decode.from_dict(json)": timeit.timeit(from_json, number=number),
+        "decode.from_bytes": timeit.timeit(
+            lambda: Order.from_bytes(data), number=number),
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:24} {value:10.3f}" if isinstance(value, float)
+              else f"{name:24} {value:10}")
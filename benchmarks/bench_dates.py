@@ -0,0 +1,32 @@
+"""date parsing benchmark: strptime vs ISODate/ISODateTime
+
+   usage: PYTHONPATH=. python benchmarks/bench_dates.py
+"""
+from datetime import datetime
+import timeit
+
+from typedclass import ISODate, ISODateTime
+
+
+DATE = "2020-02-03"
+DATETIME = "2020-02-03 04:05:06"
+
+CASES = {
+    "date strptime": lambda: datetime.strptime(DATE, "%Y-%m-%d").date(),
+    "ISODate": lambda parse=ISODate(): parse(DATE),
+    "datetime strptime":
+        lambda: datetime.strptime(DATETIME, "%Y-%m-%d %H:%M:%S"),
+    "ISODateTime": lambda parse=ISODateTime(): parse(DATETIME),
+}
+
+
+def run(number=100000):
+    return {
+        name: min(timeit.repeat(case, number=number, repeat=5)) / number
+        for name, case in CASES.items()
+    }
+
+
+if __name__ == "__main__":
+    for name, seconds in run().items():
+        print(f"{name:20} {seconds * 1e9:8.1f} ns/value")
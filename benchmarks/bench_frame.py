@@ -0,0 +1,66 @@
+"""frame benchmark: a list of instances vs a TypedFrame
+
+   Measures the memory held per record and the time to aggregate one
+   field.
+
+   usage: PYTHONPATH=. python benchmarks/bench_frame.py
+"""
+import gc
+import timeit
+import tracemalloc
+
+from typedclass import Typed, Field, Integer, Boolean, Set
+from typedclass.frame import TypedFrame
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    customer = Field(is_required=True)
+    status = Field(Set("new", "paid", "shipped"), default="new")
+    paid = Field(Boolean, default=False)
+    quantity = Field(Integer)
+
+
+def records(count):
+    statuses = ("new", "paid", "shipped")
+    return [
+        dict(id=n, customer=f"customer{n % 100}", status=statuses[n % 3],
+             paid=n % 2 == 0, quantity=n % 7)
+        for n in range(count)
+    ]
+
+
+def measure(build):
+    """bytes allocated by build()"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def run(count=100000, number=10):
+    rows = records(count)
+    instances, list_bytes = measure(
+        lambda: [Order(**row) for row in rows])
+    frame, frame_bytes = measure(lambda: TypedFrame(Order, instances))
+    return {
+        "list bytes/record": list_bytes / count,
+        "frame bytes/record": frame_bytes / count,
+        "list sum (s)": timeit.timeit(
+            lambda: sum(order.quantity for order in instances),
+            number=number) / number,
+        "frame sum (s)": timeit.timeit(
+            lambda: frame.sum("quantity"), number=number) / number,
+    }
+
+
+if __name__ == "__main__":
+    results = run()
+    for name, value in results.items():
+        print(f"{name:20} {value:12.6f}")
+    reduction = 1 - (
+        results["frame bytes/record"] / results["list bytes/record"])
+    print(f"frame vs list: {reduction:.1%} smaller")
@@ -0,0 +1,54 @@
+"""typedfunction benchmark: per-call DynamicTyped vs compiled arguments
+
+   usage: PYTHONPATH=. python benchmarks/bench_function.py
+"""
+from functools import wraps
+import timeit
+
+from typedclass import Field, Integer, Boolean, typedfunction
+from typedclass.decorator import DynamicTyped
+
+
+FIELDS = dict(
+    user_id=Field(Integer, is_required=True),
+    name=Field(is_required=True),
+    active=Field(Boolean, default=True),
+    limit=Field(Integer, default=10),
+)
+
+
+def generic(**field_kwargs):
+    """the wrapper used before arguments were compiled"""
+    _typed = DynamicTyped(**field_kwargs)
+
+    def inner(func):
+        @wraps(func)
+        def _inner(*args, **kwargs):
+            normalized = _typed(*args, **kwargs)
+            return func(**normalized.as_dict(serialize=False))
+        return _inner
+    return inner
+
+
+def service(user_id, name, active=True, limit=10):
+    return user_id
+
+
+def run(number=100000):
+    functions = {
+        "plain": service,
+        "generic": generic(**FIELDS)(service),
+        "compiled": typedfunction(**FIELDS)(service),
+    }
+    return {
+        name: timeit.timeit(
+            lambda: function(1, "someone", limit="5"), number=number)
+        for name, function in functions.items()
+    }
+
+
+if __name__ == "__main__":
+    results = run()
+    for name, seconds in results.items():
+        print(f"{name:10} {seconds:.3f}s")
+    print(f"speedup: {results['generic'] / results['compiled']:.1f}x")
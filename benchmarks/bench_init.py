@@ -0,0 +1,73 @@
+"""construction benchmark: compiled constructor vs the generic loop
+
+   usage: PYTHONPATH=. python benchmarks/bench_init.py
+"""
+import timeit
+
+from typedclass import Typed, Field, Integer, Boolean
+from typedclass.typed import RequiredAttributeError
+
+
+def generic_init(self, *args, **kwargs):
+    """the field-walking constructor used before compiled constructors"""
+    self.__dict__["_v"] = {}
+    if self._k:
+        self._v[self._k] = {}
+
+    for value, field in zip(args, self._f):
+        kwargs[field.name] = value
+
+    for name in kwargs.keys():
+        try:
+            self._lookup_field(name)
+        except AttributeError:
+            if self._k:
+                self._v[self._k][name] = kwargs[name]
+            else:
+                raise
+
+    for field in self._f:
+        if field.is_required:
+            if field.default == Field.NO_DEFAULT:
+                if field.name not in kwargs:
+                    raise RequiredAttributeError(field.name)
+        if field.default != Field.NO_DEFAULT:
+            if field.name not in kwargs:
+                kwargs[field.name] = field.default
+
+    for field in self._f:
+        if field.name in kwargs:
+            self._setfield(field, kwargs[field.name])
+            field.after_init(self)
+
+    self.__after_init__()
+
+
+class Compiled(Typed):
+    id = Field(Integer, is_required=True)
+    name = Field(is_required=True)
+    email = Field()
+    active = Field(Boolean, default=True)
+    role = Field(default="user")
+
+
+class Generic(Compiled):
+    __init__ = generic_init
+
+
+ROW = dict(id=1234, name="someone", email="someone@example.com")
+
+
+def run(number=100000):
+    results = {}
+    for cls in (Generic, Compiled):
+        results[cls.__name__] = min(timeit.repeat(
+            lambda: cls(**ROW), number=number, repeat=5)) / number
+    return results
+
+
+if __name__ == "__main__":
+    results = run()
+    for name, seconds in results.items():
+        print(f"{name:10} {seconds * 1e6:8.3f} us/instance")
+    print(f"speedup    {results['Generic'] / results['Compiled']:8.2f}x")
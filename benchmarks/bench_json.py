@@ -0,0 +1,52 @@
+"""serialization benchmark: json.dumps(as_dict()) vs to_json()
+
+   usage: PYTHONPATH=. python benchmarks/bench_json.py
+"""
+import json
+import timeit
+
+from typedclass import Typed, Field, Integer, Boolean, Decimal, List, String
+
+
+class Line(Typed):
+    sku = Field(is_required=True)
+    quantity = Field(Integer)
+    price = Field(Decimal(2))
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    customer = Field()
+    paid = Field(Boolean, default=False)
+    lines = Field(List(Line))
+    tags = Field(List(String))
+
+
+ORDER = Order(
+    id=1, customer="someone", paid=True,
+    lines=[dict(sku=f"sku{n}", quantity=n, price="9.99") for n in range(5)],
+    tags=["a", "b", "c"],
+)
+
+
+def as_dict():
+    return json.dumps(ORDER.as_dict())
+
+
+def to_json():
+    return ORDER.to_json()
+
+
+def run(number=20000):
+    results = {}
+    for function in (as_dict, to_json):
+        results[function.__name__] = min(timeit.repeat(
+            function, number=number, repeat=5)) / number
+    return results
+
+
+if __name__ == "__main__":
+    results = run()
+    for name, seconds in results.items():
+        print(f"{name:10} {seconds * 1e6:8.3f} us/object")
+    print(f"speedup    {results['as_dict'] / results['to_json']:8.2f}x")
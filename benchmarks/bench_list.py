@@ -0,0 +1,30 @@
+"""List benchmark: building a unique list of n items
+
+   usage: PYTHONPATH=. python benchmarks/bench_list.py
+"""
+import timeit
+
+from typedclass import Typed, Field, List, Integer
+
+
+class Unique(Typed):
+    ids = Field(List(Integer, allow_dups=False))
+
+
+class Plain(Typed):
+    ids = Field(List(Integer))
+
+
+def run(sizes=(1000, 10000, 50000)):
+    results = {}
+    for size in sizes:
+        ids = list(range(size))
+        for cls in (Plain, Unique):
+            results[f"{cls.__name__} n={size}"] = min(timeit.repeat(
+                lambda: cls(ids=ids), number=1, repeat=3))
+    return results
+
+
+if __name__ == "__main__":
+    for name, seconds in run().items():
+        print(f"{name:20} {seconds * 1e3:10.2f} ms")
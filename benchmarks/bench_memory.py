@@ -0,0 +1,74 @@
+"""memory benchmark: default vs compact instance layout, and List values
+
+   usage: PYTHONPATH=. python benchmarks/bench_memory.py
+"""
+import gc
+import tracemalloc
+
+from typedclass import Typed, Field, Integer, Boolean, List, String
+
+
+class Default(Typed):
+    id = Field(Integer, is_required=True)
+    name = Field(is_required=True)
+    email = Field()
+    active = Field(Boolean, default=True)
+    role = Field(default="user")
+
+
+class Compact(Typed, compact=True):
+    id = Field(Integer, is_required=True)
+    name = Field(is_required=True)
+    email = Field()
+    active = Field(Boolean, default=True)
+    role = Field(default="user")
+
+
+class LegacyList:
+    """the earlier _List layout: spec settings copied into __dict__"""
+
+    def __init__(self, spec, value):
+        self.type = spec.type
+        self.is_nested = spec.is_nested
+        self.min = spec.min
+        self.max = spec.max
+        self.allow_dups = spec.allow_dups
+        self.encoder = spec.encoder
+        self.store = [spec.type(item) for item in value]
+
+
+def measure(build, count):
+    """bytes allocated per object (values themselves are shared)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def run(count=100000):
+    name, email = "someone", "someone@example.com"
+    tags = ["a", "b", "c"]
+    spec, frozen = List(String), List(String, frozen=True)
+    return {
+        "Default": measure(
+            lambda: Default(id=1, name=name, email=email), count),
+        "Compact": measure(
+            lambda: Compact(id=1, name=name, email=email), count),
+        "LegacyList": measure(lambda: LegacyList(spec, tags), count),
+        "List": measure(lambda: spec(tags), count),
+        "FrozenList": measure(lambda: frozen(tags), count),
+    }
+
+
+if __name__ == "__main__":
+    results = run()
+    for name, size in results.items():
+        print(f"{name:10} {size:8.1f} bytes/object")
+    for name, baseline in (("Compact", "Default"), ("List", "LegacyList"),
+                           ("FrozenList", "LegacyList")):
+        reduction = 1 - results[name] / results[baseline]
+        print(f"{name} vs {baseline}: {reduction:.1%} smaller")
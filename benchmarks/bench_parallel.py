@@ -0,0 +1,49 @@
+"""batch validation benchmark: from_records vs validate_parallel
+
+   usage: PYTHONPATH=. python benchmarks/bench_parallel.py [workers]
+"""
+import os
+import pickle
+import sys
+import time
+
+from typedclass import Typed, Field, Boolean, Decimal, ISODate, Integer
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    customer = Field(is_required=True)
+    paid = Field(Boolean, default=False)
+    total = Field(Decimal(2))
+    day = Field(ISODate)
+
+
+RECORDS = [
+    dict(id=str(n), customer=f"c{n}", paid="1", total="9.99",
+         day="2020-01-02")
+    for n in range(200000)
+]
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def run(workers=None, chunk_size=5000):
+    workers = workers or os.cpu_count()
+    instances = Order.from_records(RECORDS[:1000])
+    return {
+        "from_records": timed(lambda: Order.from_records(RECORDS)),
+        f"validate_parallel.{workers}": timed(
+            lambda: Order.validate_parallel(RECORDS, workers, chunk_size)),
+        "pickle.bytes_per_instance":
+            len(pickle.dumps(instances)) / len(instances),
+    }
+
+
+if __name__ == "__main__":
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    for name, value in run(workers).items():
+        print(f"{name:28} {value:.3f}")
@@ -0,0 +1,58 @@
+"""bulk construction benchmark: per-record kwargs vs from_records vs
+   construct_records (trusted values)
+
+   usage: PYTHONPATH=. python benchmarks/bench_records.py
+"""
+import timeit
+
+from typedclass import Typed, Field, Integer, Boolean
+
+
+class Record(Typed):
+    id = Field(Integer, is_required=True)
+    name = Field(is_required=True)
+    email = Field()
+    active = Field(Boolean, default=True)
+    role = Field(default="user")
+
+
+ROWS = [
+    dict(id=n, name=f"user{n}", email=f"user{n}@example.com", extra=n)
+    for n in range(10000)
+]
+
+
+def per_record():
+    """what from_dict did for a list: a filtered kwargs dict per record"""
+    return [
+        Record(**{f.name: row[f.name] for f in Record._f if f.name in row})
+        for row in ROWS
+    ]
+
+
+def bulk():
+    return Record.from_records(ROWS)
+
+
+CACHED = [item.as_dict(serialize=False) for item in bulk()]
+
+
+def trusted():
+    return Record.construct_records(CACHED)
+
+
+def run(number=10):
+    results = {}
+    for function in (per_record, bulk, trusted):
+        results[function.__name__] = min(timeit.repeat(
+            function, number=number, repeat=5)) / number / len(ROWS)
+    return results
+
+
+if __name__ == "__main__":
+    results = run()
+    for name, seconds in results.items():
+        print(f"{name:10} {seconds * 1e6:8.3f} us/record")
+    for name in ("bulk", "trusted"):
+        speedup = results["per_record"] / results[name]
+        print(f"speedup    {speedup:8.2f}x ({name})")
@@ -0,0 +1,86 @@
+"""startup benchmark: import time and the cost of defining many models
+
+   usage: PYTHONPATH=. python benchmarks/bench_startup.py [BASELINE]
+
+   BASELINE is a checkout of another typedclass version (for instance
+   "git worktree add /tmp/baseline <commit>"); if it is given, the same
+   measurements are made with it, in a fresh interpreter, and shown next
+   to these.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+from typedclass import Typed, Field, Integer, Boolean, Decimal, ISODate
+
+
+def import_time(runs=10):
+    """seconds to import typedclass in a fresh interpreter (best of runs)"""
+    def best(code):
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], check=True)
+            times.append(time.perf_counter() - start)
+        return min(times)
+    return best("import typedclass") - best("pass")
+
+
+def define(count):
+    """define count models of eight fields each"""
+    models = []
+    for n in range(count):
+        attrs = dict(
+            id=Field(Integer, is_required=True),
+            name=Field(is_required=True),
+            email=Field(),
+            active=Field(Boolean, default=True),
+            balance=Field(Decimal(2), default="0"),
+            joined=Field(ISODate),
+            age=Field(Integer),
+            role=Field(default="user"),
+        )
+        models.append(type(Typed)(f"Model{n}", (Typed,), attrs))
+    return models
+
+
+def run(count=2000):
+    start = time.perf_counter()
+    models = define(count)
+    defined = time.perf_counter() - start
+    start = time.perf_counter()
+    for model in models:
+        model(id=1, name="someone")
+    first = time.perf_counter() - start
+    return {
+        "import (s)": import_time(),
+        f"define {count} models (s)": defined,
+        "first instance of each (s)": first,
+        "define + first instance (s)": defined + first,
+    }
+
+
+def baseline(path):
+    """the results of run() with the typedclass checked out at path"""
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(path))
+    output = subprocess.run(
+        [sys.executable, __file__, "--json"], env=env, check=True,
+        capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--json"]:
+        print(json.dumps(run()))
+        sys.exit()
+    results = run()
+    if len(sys.argv) > 1:
+        base = baseline(sys.argv[1])
+        print(f"{'':32} {'baseline':>9} {'current':>9}")
+        for name, seconds in results.items():
+            print(f"{name:32} {base[name]:9.4f} {seconds:9.4f}")
+    else:
+        for name, seconds in results.items():
+            print(f"{name:32} {seconds:.4f}")
@@ -0,0 +1,77 @@
+"""multi-thread scaling benchmark: construction, mutation, serialization
+
+   Each thread builds, changes and serializes its own instances; the
+   result is the total throughput for each thread count and its ratio to
+   one thread. With the GIL the ratio stays near 1; on a free-threaded
+   build it shows how construction scales across cores.
+
+   usage: PYTHONPATH=. python benchmarks/bench_threads.py [max_threads]
+"""
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+import threading
+import time
+
+from typedclass import Typed, Field, List, Boolean, Decimal, Integer
+
+
+class Item(Typed):
+    sku = Field(is_required=True)
+    quantity = Field(Integer, default=1)
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    customer = Field(is_required=True)
+    paid = Field(Boolean, default=False)
+    total = Field(Decimal(2))
+    items = Field(List(Item))
+
+
+RECORD = dict(id="1", customer="someone", paid="1", total="9.99",
+              items=[dict(sku="a", quantity="2")])
+
+
+def work(count, barrier):
+    barrier.wait()
+    for _ in range(count):
+        order = Order(**RECORD)
+        order.total = "10.5"
+        order.to_json()
+
+
+def throughput(threads, count):
+    barrier = threading.Barrier(threads + 1)
+    with ThreadPoolExecutor(threads) as pool:
+        futures = [pool.submit(work, count, barrier) for _ in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        for future in futures:
+            future.result()
+        return threads * count / (time.perf_counter() - start)
+
+
+def run(max_threads=None, count=20000):
+    max_threads = max_threads or os.cpu_count()
+    Order(**RECORD).to_json()  # compile outside the timing
+    counts, threads = [], 1
+    while threads <= max_threads:
+        counts.append(threads)
+        threads *= 2
+    single = throughput(1, count)
+    result = {}
+    for threads in counts:
+        ops = single if threads == 1 else throughput(threads, count)
+        result[threads] = dict(ops_per_sec=ops, scaling=ops / single)
+    return result
+
+
+if __name__ == "__main__":
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'on' if gil else 'off'},"
+          f" {os.cpu_count()} cpus")
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    for threads, values in run(limit).items():
+        print(f"{threads:3} threads {values['ops_per_sec']:12,.0f} ops/s"
+              f"  x{values['scaling']:.2f}")
@@ -0,0 +1,257 @@
+"""benchmark suite: throughput and memory of the library's hot paths
+
+   Each case is timed with timeit (best of several repeats) and reported
+   as operations per second; memory is measured with tracemalloc. Cases
+   named "dataclass..." and "plain..." are stdlib baselines for the case
+   next to them. The results are written as JSON, so runs of different
+   versions can be compared; a case that needs a feature the version
+   under test doesn't have is skipped (and listed as such). The results
+   of the version before the optimizations are in baseline.json:
+
+   usage: PYTHONPATH=. python benchmarks/suite.py [-o results.json]
+              [-k substring] [-n number] [--compare baseline.json]
+"""
+import argparse
+import dataclasses
+import datetime
+import gc
+import json
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+from typedclass import (
+    Typed, Field, List, Boolean, Decimal, ISODate, ISODateTime, Integer, Json,
+    Set, String, typedfunction)
+
+
+class Item(Typed):
+    sku = Field(is_required=True)
+    quantity = Field(Integer, default=1)
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    customer = Field(is_required=True)
+    paid = Field(Boolean, default=False)
+    total = Field(Decimal(2))
+    item = Field(Item)
+
+
+try:
+    class CachedOrder(Order, cached=True):
+        pass
+except TypeError:  # a version without cached classes
+    CachedOrder = None
+
+try:
+    class CompactOrder(Typed, compact=True):
+        id = Field(Integer, is_required=True)
+        customer = Field(is_required=True)
+        paid = Field(Boolean, default=False)
+        total = Field(Decimal(2))
+except TypeError:  # a version without compact classes
+    CompactOrder = None
+
+
+@dataclasses.dataclass
+class DataOrder:
+    id: int
+    customer: str
+    paid: bool = False
+    total: float = 0.0
+
+
+@dataclasses.dataclass(slots=True)
+class SlotsOrder:
+    id: int
+    customer: str
+    paid: bool = False
+    total: float = 0.0
+
+
+def service(id, customer, paid=False):
+    return id
+
+
+checked_service = typedfunction(
+    id=Field(Integer, is_required=True),
+    customer=Field(is_required=True),
+    paid=Field(Boolean, default=False),
+)(service)
+
+
+def cases():
+    """return a dict of name: function to time
+
+       Some functions need features that not every version has; run()
+       skips the ones that fail.
+    """
+    order = Order(id=1, customer="someone", total="9.99")
+    data = DataOrder(id=1, customer="someone", total=9.99)
+    binary = order.to_bytes() if hasattr(order, "to_bytes") else None
+    record = dict(id=1, customer="someone", paid=True, total="9.99")
+    nested = dict(record, item=dict(sku="a", quantity=2))
+    nested_order = Order(**nested)
+    cached_order = CachedOrder and CachedOrder(**nested)
+    items = [f"sku{n}" for n in range(100)]
+    dups, unique = List(String), List(String, allow_dups=False)
+    types = dict(
+        Boolean=(Boolean(), "1"),
+        Decimal=(Decimal(2), "9.99"),
+        Integer=(Integer(), "123"),
+        ISODate=(ISODate(), "2020-01-02"),
+        ISODateTime=(ISODateTime(), "2020-01-02 03:04:05"),
+        Json=(Json(), '{"a": 1}'),
+        Set=(Set("new", "paid", "shipped"), "paid"),
+        String=(String(), "someone"),
+    )
+
+    def set_field():
+        order.customer = "other"
+
+    def set_dataclass():
+        data.customer = "other"
+
+    def append(spec):
+        def function():
+            value = spec([])
+            for item in items:
+                value.append(item)
+        return function
+
+    result = {
+        "construct.keyword": lambda: Order(id=1, customer="someone"),
+        "construct.positional": lambda: Order(1, "someone"),
+        "construct.compact": lambda: CompactOrder(id=1, customer="someone"),
+        "dataclass.construct": lambda: DataOrder(id=1, customer="someone"),
+        "field.get": lambda: order.customer,
+        "dataclass.get": lambda: data.customer,
+        "field.set": set_field,
+        "dataclass.set": set_dataclass,
+        "as_dict": lambda: order.as_dict(),
+        "dataclass.asdict": lambda: dataclasses.asdict(data),
+        "from_dict": lambda: Order.from_dict(record),
+        "from_records.100": lambda: Order.from_records([record] * 100),
+        "to_json": lambda: order.to_json(),
+        "to_bytes": lambda: order.to_bytes(),
+        "from_bytes": lambda: Order.from_bytes(binary),
+        "nested.construct": lambda: Order(**nested),
+        "nested.as_dict": lambda: nested_order.as_dict(),
+        "nested.as_dict.cached": lambda: cached_order.as_dict(),
+        "nested.copy": lambda: nested_order.copy(),
+        "nested.replace": lambda: nested_order.replace(paid=False),
+        "nested.rebuild": lambda: Order(
+            **dict(nested_order.as_dict(serialize=False), paid=False)),
+        "nested.to_json.cached": lambda: cached_order.to_json(),
+        "list.construct.100": lambda: dups(items),
+        "list.construct.100.unique": lambda: unique(items),
+        "list.append.100": append(dups),
+        "list.append.100.unique": append(unique),
+        "typedfunction": lambda: checked_service(1, "someone", paid="1"),
+        "plain.function": lambda: service(1, "someone", paid=True),
+    }
+    for name, (field_type, value) in types.items():
+        result[f"type.{name}"] = lambda t=field_type, v=value: t(v)
+    return result
+
+
+def memory(count=10000):
+    """bytes allocated per instance"""
+    builders = {
+        "Typed": lambda: Order(id=1, customer="someone"),
+        "Typed.compact": lambda: CompactOrder(id=1, customer="someone"),
+        "dataclass": lambda: DataOrder(id=1, customer="someone"),
+        "dataclass.slots": lambda: SlotsOrder(id=1, customer="someone"),
+    }
+    if CompactOrder is None:
+        del builders["Typed.compact"]
+    result = {}
+    for name, build in builders.items():
+        for _ in range(100):
+            build()  # compile before measuring
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [build() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del objects
+        result[name] = (after - before) / count
+    return result
+
+
+def revision():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], capture_output=True,
+            text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(number=10000, repeat=5, match=""):
+    throughput, skipped = {}, {}
+    for name, function in cases().items():
+        if match in name:
+            try:
+                function()
+            except Exception as err:  # a feature this version lacks
+                skipped[name] = f"{type(err).__name__}: {err}"
+                continue
+            seconds = min(timeit.repeat(
+                function, number=number, repeat=repeat)) / number
+            throughput[name] = dict(
+                ops_per_sec=1 / seconds, seconds_per_op=seconds)
+    return dict(
+        meta=dict(
+            python=platform.python_version(),
+            implementation=platform.python_implementation(),
+            platform=platform.platform(),
+            revision=revision(),
+            time=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            number=number,
+            repeat=repeat,
+        ),
+        throughput=throughput,
+        skipped=skipped,
+        memory=memory() if match in "memory" else {},
+    )
+
+
+def compare(results, baseline):
+    """print the change in throughput from a previous run"""
+    for name, result in results["throughput"].items():
+        if old := baseline["throughput"].get(name):
+            change = result["ops_per_sec"] / old["ops_per_sec"] - 1
+            print(f"{name:28} {change:+8.1%}", file=sys.stderr)
+        else:
+            print(f"{name:28} {'new':>8}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="file for the JSON results")
+    parser.add_argument("-k", "--match", default="",
+                        help="run the cases whose names contain this")
+    parser.add_argument("-n", "--number", type=int, default=10000,
+                        help="calls per timing")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    args = parser.parse_args()
+
+    results = run(args.number, match=args.match)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as fp:
+            fp.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare) as fp:
+            compare(results, json.load(fp))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from typedclass import Typed, Field, Integer, typedfunction
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+
+
+def records(count):
+    return [{"id": str(index)} for index in range(count)]
+
+
+async def arecords(count):
+    for record in records(count):
+        await asyncio.sleep(0)
+        yield record
+
+
+async def collect(iterator):
+    return [[order.id for order in chunk] async for chunk in iterator]
+
+
+@pytest.mark.parametrize("source", (records, arecords))
+def test_aiter_records(source):
+    result = asyncio.run(collect(Order.aiter_records(source(7), 3)))
+    assert result == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_executor():
+    async def main():
+        with ThreadPoolExecutor(2) as pool:
+            return await collect(Order.aiter_records(
+                arecords(7), 2, executor=pool))
+    assert asyncio.run(main()) == [[0, 1], [2, 3], [4, 5], [6]]
+
+
+def test_errors():
+    data = records(5)
+    data[3]["id"] = "x"
+    errors = []
+    result = asyncio.run(collect(Order.aiter_records(data, 2, errors)))
+    assert result == [[0, 1], [2], [4]]
+    assert [(index, record) for index, record, _ in errors] == [
+        (3, data[3])]
+    with pytest.raises(ValueError):
+        asyncio.run(collect(Order.aiter_records(data, 2)))
+
+
+def test_yields_to_loop():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        await collect(Order.aiter_records(records(10), 2))
+        task.cancel()
+    asyncio.run(main())
+    assert len(ticks) >= 4
+
+
+@pytest.mark.parametrize("after_init", (None, lambda instance: None))
+def test_async_typedfunction(after_init):
+    @typedfunction(a=Field(Integer, after_init=after_init))
+    async def service(a):
+        await asyncio.sleep(0)
+        return a
+
+    assert asyncio.iscoroutinefunction(service)
+    assert service.__name__ == "service"
+    assert asyncio.run(service("1")) == 1
+    call = service("x")  # checked when awaited
+    with pytest.raises(ValueError):
+        asyncio.run(call)
@@ -0,0 +1,153 @@
+import gc
+
+import pytest
+
+from typedclass import Typed, Field, Kwargs, List, Integer, Decimal
+
+
+class Address(Typed):
+    city = Field()
+
+
+class Tag(Typed):
+    name = Field()
+
+
+class Profile(Typed, cached=True):
+    id = Field(Integer, is_required=True)
+    balance = Field(Decimal(2))
+    address = Field(Address)
+    tags = Field(List(Tag))
+    scores = Field(List(Integer))
+    extra = Kwargs()
+
+
+class CompactProfile(Typed, compact=True, cached=True):
+    id = Field(Integer)
+    address = Field(Address)
+
+
+def make():
+    return Profile(id=1, balance="2", address={"city": "a"},
+                   tags=[{"name": "x"}], scores=[1, 2])
+
+
+def test_cached():
+    profile = make()
+    result = profile.as_dict()
+    assert result == dict(
+        id=1, balance="2.00", address={"city": "a"},
+        tags='[{"name": "x"}]', scores="[1, 2]", extra={})
+    assert profile.as_dict() is result
+    text = profile.to_json()
+    assert profile.to_json() is text
+    assert profile.as_dict(serialize=False)["balance"] == \
+        Decimal(2)("2")
+
+
+def test_setattr_invalidates():
+    profile = make()
+    result, text = profile.as_dict(), profile.to_json()
+    profile.balance = "3"
+    assert profile.as_dict() is not result
+    assert profile.as_dict()["balance"] == "3.00"
+    assert '"balance":"3.00"' in profile.to_json() != text
+
+
+def test_delattr_invalidates():
+    profile = make()
+    profile.as_dict()
+    del profile.balance
+    assert "balance" not in profile.as_dict()
+
+
+@pytest.mark.parametrize("change", (
+    lambda profile: setattr(profile.address, "city", "b"),
+    lambda profile: delattr(profile.address, "city"),
+    lambda profile: profile.tags.append({"name": "y"}),
+    lambda profile: setattr(profile.tags[0], "name", "y"),
+    lambda profile: profile.tags.pop(),
+    lambda profile: profile.scores.append(3),
+    lambda profile: profile.scores.extend([3]),
+    lambda profile: profile.scores.insert(0, 3),
+    lambda profile: profile.scores.remove(1),
+    lambda profile: profile.scores.clear(),
+    lambda profile: profile.scores.__setitem__(0, 5),
+    lambda profile: profile.scores.__delitem__(0),
+))
+def test_nested_change_invalidates(change):
+    profile = make()
+    result = profile.as_dict()
+    text = profile.to_json()
+    change(profile)
+    assert profile.as_dict() != result
+    assert profile.to_json() != text
+
+
+def test_new_nested_value_watched():
+    profile = make()
+    profile.as_dict()
+    profile.address = Address(city="b")
+    assert profile.as_dict()["address"] == {"city": "b"}
+    profile.address.city = "c"
+    assert profile.as_dict()["address"] == {"city": "c"}
+
+
+def test_shared_nested_value():
+    address = Address(city="a")
+    first, second = Profile(id=1, address=address), Profile(id=2,
+                                                            address=address)
+    first.as_dict(), second.as_dict()
+    address.city = "b"
+    assert first.as_dict()["address"] == {"city": "b"}
+    assert second.as_dict()["address"] == {"city": "b"}
+
+
+def test_owners_are_weak():
+    address = Address(city="a")
+    Profile(id=1, address=address).as_dict()
+    gc.collect()
+    address.city = "b"  # the profile is gone: nothing to notify
+    assert all(ref() is None for ref, _ in address._o)
+
+
+def test_compact():
+    profile = CompactProfile(id=1, address={"city": "a"})
+    result = profile.as_dict()
+    assert profile.as_dict() is result
+    profile.address.city = "b"
+    assert profile.as_dict() == dict(id=1, address={"city": "b"})
+
+
+def test_uncached_unchanged():
+    address = Address(city="a")
+    assert address.as_dict() is not address.as_dict()
+    assert not Address._a and not Address._w  # nesting changes no class
+    assert address._o is None
+
+
+def test_compact_nested():
+    class Point(Typed, compact=True):
+        x = Field(Integer)
+
+    class Shape(Typed, cached=True):
+        point = Field(Point)
+
+    shape = Shape(point={"x": 1})
+    assert shape.as_dict() == dict(point={"x": 1})
+    shape.point.x = 2
+    assert shape.as_dict() == dict(point={"x": 2})
+    del shape.point.x
+    assert shape.as_dict() == dict(point={})
+    assert not Point._w
+
+
+def test_frozen_list_items_watched():
+    class Frozen(Typed, cached=True):
+        tags = Field(List(Tag, frozen=True))
+
+    frozen = Frozen(tags=[{"name": "x"}])
+    assert frozen.to_json() == '{"tags":[{"name":"x"}]}'
+    frozen.tags[0].name = "y"
+    assert frozen.as_dict() == dict(tags='[{"name": "y"}]')
+    assert frozen.to_json() == '{"tags":[{"name":"y"}]}'
@@ -0,0 +1,175 @@
+import datetime
+import subprocess
+import sys
+
+import pytest
+
+from typedclass import (
+    Typed, Field, Kwargs, List, Boolean, Decimal, ISODate, ISODateTime,
+    Integer, Json, Set, String)
+
+
+class Item(Typed):
+    sku = Field(is_required=True)
+    quantity = Field(Integer, default=1)
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    customer = Field(default=None)
+    paid = Field(Boolean, default=False)
+    total = Field(Decimal(2))
+    day = Field(ISODate)
+    at = Field(ISODateTime)
+    status = Field(Set("new", "paid"), default=None)
+    meta = Field(Json)
+    item = Field(Item)
+    items = Field(List(Item))
+    scores = Field(List(Integer, allow_dups=False))
+    tags = Field(List(String, frozen=True))
+    times = Field(List(ISODateTime))
+    extra = Kwargs()
+
+
+class CompactOrder(Typed, compact=True):
+    id = Field(Integer)
+    customer = Field(default=None)
+
+
+class Custom(Typed):
+    value = Field(lambda value: int(value) * 2)
+
+
+def roundtrip(instance):
+    return instance.from_bytes(instance.to_bytes())
+
+
+def full():
+    return Order(
+        id=5, customer="sömeone", paid="1", total="-12.345",
+        day="2020-01-02", at="2020-01-02T03:04:05.123456+05:30",
+        status="paid", meta={"a": [1, None]}, item={"sku": "x"},
+        items=[{"sku": "a", "quantity": 2}, {"sku": "b"}],
+        scores=[3, 1, 2], tags=["t"], times=["2021-02-03T04:05:06"],
+        more=1)
+
+
+def test_roundtrip():
+    order = full()
+    other = roundtrip(order)
+    assert other.as_dict() == order.as_dict()
+    assert other.to_json() == order.to_json()
+    assert other.at == order.at and other.at.utcoffset() == \
+        order.at.utcoffset()
+    assert other.times[0].tzinfo is None
+    assert str(other.total) == str(order.total) == "-12.34"
+    with pytest.raises(ValueError):
+        other.scores.append(1)  # still unique
+    with pytest.raises(TypeError):
+        other.tags.append("x")  # still frozen
+
+
+def test_missing_and_none():
+    order = Order(id=1, customer=None)
+    other = roundtrip(order)
+    assert other.as_dict() == order.as_dict()
+    assert other.customer is None and other.status is None
+    with pytest.raises(AttributeError):
+        other.total
+
+
+def test_smaller_than_json():
+    order = full()
+    assert len(order.to_bytes()) < len(order.to_json().encode()) * 0.7
+
+
+def test_long_text():
+    order = Order(id=1, customer="x" * 300, tags=["y" * 70000])
+    assert roundtrip(order).as_dict() == order.as_dict()
+
+
+def test_buffers():
+    data = full().to_bytes()
+    for buffer in (bytearray(data), memoryview(data)):
+        assert Order.from_bytes(buffer).as_dict() == full().as_dict()
+    with pytest.raises(ValueError):
+        Order.from_bytes(data[:-3])
+    with pytest.raises(ValueError):
+        Order.from_bytes(data + b"\0")
+
+
+def test_compact():
+    order = CompactOrder(id=1, customer="x")
+    assert roundtrip(order).as_dict() == dict(id=1, customer="x")
+
+
+def test_no_binary_form():
+    custom = Custom(value="2")
+    assert custom.value == 4
+    assert roundtrip(custom).value == 8  # coerced again from JSON
+
+
+class SpecialItem(Item):
+    note = Field()
+
+
+def test_nested_subclass():
+    with pytest.raises(ValueError):
+        Order(id=1, item=SpecialItem(sku="x", note="y")).to_bytes()
+    with pytest.raises(ValueError):
+        Order(id=1, items=[SpecialItem(sku="x")]).to_bytes()
+
+
+def test_many_fields():
+    cls = type(Typed)("Wide", (Typed,), {
+        f"f{index}": Field(Integer) for index in range(70)})
+    wide = cls(**{f"f{index}": index for index in range(0, 70, 3)})
+    assert roundtrip(wide).as_dict() == wide.as_dict()
+
+
+@pytest.mark.parametrize("values", (
+    dict(id=2 ** 70),
+    dict(id=2 ** 63 - 1, total="-" + "9" * 20 + ".5"),
+    dict(id="99999999999999999999", total="1e24", customer="x"),
+    dict(id=1, scores=[1, 2 ** 64]),
+))
+def test_overflow(values):
+    order = Order(**dict(dict(item={"sku": "x"}), **values))
+    other = roundtrip(order)
+    assert other.as_dict() == order.as_dict()
+    naive = datetime.datetime(2020, 1, 1)
+    assert roundtrip(Order(id=1, at=naive)).at == naive
+
+
+class Dates(Typed):
+    day = Field(ISODate)
+    days = Field(List(ISODate))
+
+
+@pytest.mark.parametrize("day", (
+    datetime.date(2020, 1, 2),
+    datetime.datetime(2020, 1, 2, 3, 4, 5),
+    datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc),
+))
+def test_date_holding_datetime(day):
+    other = roundtrip(Dates(day=day, days=[datetime.date(2021, 1, 1), day]))
+    assert other.day == day and other.day.__class__ is day.__class__
+    assert other.days == [datetime.date(2021, 1, 1), day]
+    assert other.days[1].__class__ is day.__class__
+
+
+@pytest.mark.parametrize("scores", (
+    [], [1, 127], [-128, 200], [40000], [-2 ** 31, 2 ** 31], [2 ** 62]))
+def test_integer_lists(scores):
+    order = Order.construct(id=1, scores=scores)
+    assert roundtrip(order).scores == scores
+
+
+def test_imported_on_first_use():
+    code = (
+        "import sys, typedclass\n"
+        "assert 'typedclass.codec' not in sys.modules\n"
+        "class A(typedclass.Typed):\n"
+        "    a = typedclass.Field(typedclass.Integer)\n"
+        "assert A.from_bytes(A(a=1).to_bytes()).a == 1\n")
+    subprocess.run([sys.executable, "-c", code], check=True)
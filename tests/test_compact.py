@@ -0,0 +1,75 @@
+import pytest
+
+from typedclass import Typed, Field, Kwargs, Integer
+from typedclass import RequiredAttributeError, ReadOnlyFieldError
+
+
+class Case1(Typed, compact=True):
+    a = Field(Integer, is_required=True)
+    b = Field(default="B")
+    c = Field(is_readonly=True)
+    d = Kwargs()
+
+
+class Case2(Case1):
+    e = Field()
+    b = Field(default="BB")
+
+
+def test_no_dict():
+    case = Case1(a=1)
+    assert not hasattr(case, "__dict__")
+    assert Case1._c and Case2._c
+
+
+def test_init():
+    case = Case1("10", x=1)
+    assert case.a == 10
+    assert case.b == "B"
+    assert case.d == dict(x=1)
+    assert not hasattr(case, "c")
+
+
+def test_required():
+    with pytest.raises(RequiredAttributeError):
+        Case1()
+
+
+def test_set_and_delete():
+    case = Case1(a=1)
+    case.a = "2"
+    assert case.a == 2
+    with pytest.raises(ValueError):
+        case.a = "two"
+    with pytest.raises(ReadOnlyFieldError):
+        case.c = "C"
+    del case.b
+    assert not hasattr(case, "b")
+    with pytest.raises(AttributeError):
+        case.undefined = 1
+
+
+def test_as_dict():
+    case = Case1(a=1, c="C", x=1)
+    assert case.as_dict() == dict(a=1, b="B", c="C", d=dict(x=1))
+    assert dict(case._v) == dict(a=1, b="B", c="C", d=dict(x=1))
+
+
+def test_inherited():
+    case = Case2(a=1, e="E")
+    assert case.as_dict() == dict(a=1, b="BB", e="E", d={})
+    assert not hasattr(case, "__dict__")
+
+
+def test_non_compact_super():
+    class Case3(Typed):
+        a = Field()
+
+    with pytest.raises(TypeError):
+        class Case4(Case3, compact=True):
+            b = Field()
+
+
+def test_from_dict():
+    case = Case1.from_dict({"a": 5, "z": 1})
+    assert case.a == 5
@@ -0,0 +1,64 @@
+import decimal
+
+from typedclass import Typed, Field, Kwargs, List, Integer, Decimal
+
+
+class Item(Typed):
+    id = Field(Integer, is_required=True)
+
+
+class Case1(Typed):
+    a = Field(Integer, is_required=True)
+    b = Field(Decimal(2), default="1.5")
+    c = Field(Item)
+    d = Field(List(Item))
+    e = Kwargs()
+
+
+def test_construct():
+    case = Case1.construct(a=1, c={"id": 2}, d=[{"id": 3}, Item(id=4)], x=5)
+    assert case.a == 1
+    assert case.b == decimal.Decimal("1.50")
+    assert case.c.id == 2
+    assert [item.id for item in case.d] == [3, 4]
+    assert case.e == dict(x=5)
+
+
+def test_construct_trusts_values():
+    case = Case1.construct(a="not validated")
+    assert case.a == "not validated"
+    assert not hasattr(case, "c")
+
+
+def test_construct_list_is_mutable():
+    case = Case1.construct(a=1, d=[])
+    case.d.append({"id": 1})
+    assert case.as_dict()["d"] == '[{"id": 1}]'
+
+
+def test_construct_round_trip():
+    case = Case1(a=1, c={"id": 2}, d=[{"id": 3}], x=5)
+    copy = Case1.construct(**case.as_dict(serialize=False))
+    assert copy.as_dict() == case.as_dict()
+
+
+def test_construct_skips_hooks():
+
+    class Case3(Typed):
+        a = Field(after_init=lambda self: 1 / 0)
+
+        def __after_init__(self):
+            raise Exception()
+
+    assert Case3.construct(a="A").a == "A"
+
+
+class Case2(Typed, compact=True):
+    a = Field(Integer)
+    b = Field(default="B")
+
+
+def test_construct_records():
+    result = Case2.construct_records([{"a": 1}, {"a": 2, "b": "C"}])
+    assert [item.as_dict() for item in result] == [
+        dict(a=1, b="B"), dict(a=2, b="C")]
@@ -0,0 +1,150 @@
+import copy
+
+import pytest
+
+from typedclass import Typed, Field, Kwargs, List, Integer, Decimal, String
+
+
+class Address(Typed):
+    city = Field()
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    total = Field(Decimal(2))
+    address = Field(Address)
+    scores = Field(List(Integer, allow_dups=False))
+    tags = Field(List(String, frozen=True))
+    extra = Kwargs()
+
+
+class CompactOrder(Typed, compact=True):
+    id = Field(Integer, is_required=True)
+    scores = Field(List(Integer))
+    extra = Kwargs()
+
+
+class Tracked(Typed, tracked=True):
+    id = Field(Integer)
+    scores = Field(List(Integer))
+
+
+def make(cls=Order, **values):
+    return cls(id=1, scores=[1, 2], **values)
+
+
+def test_copy():
+    order = make(total="2", address={"city": "a"}, tags=["x"], more=1)
+    other = copy.copy(order)
+    assert other.as_dict() == order.as_dict()
+    assert other.address is order.address
+    assert other.tags is order.tags
+    assert other.scores is not order.scores
+    assert other.scores.store is order.scores.store
+
+
+def test_copy_no_validation(monkeypatch):
+    order = make(total="2")
+    monkeypatch.setattr(Order._n["total"], "coerce", None)
+    assert order.copy().total == order.total
+
+
+@pytest.mark.parametrize("change", (
+    lambda value: value.append(3),
+    lambda value: value.pop(),
+    lambda value: value.__setitem__(0, 5),
+    lambda value: value.__delitem__(0),
+    lambda value: value.clear(),
+))
+def test_copy_on_write(change):
+    order = make()
+    other = order.copy()
+    change(other.scores)
+    assert order.scores == [1, 2]
+    assert other.scores != [1, 2]
+    change(order.scores)
+    assert order.scores == other.scores
+
+
+def test_copy_on_write_unique():
+    order = make()
+    other = order.copy()
+    other.scores.append(3)
+    order.scores.append(3)
+    assert order.scores == other.scores == [1, 2, 3]
+
+
+def test_copy_kwargs():
+    order = make(more=1)
+    other = order.copy()
+    other.extra["more"] = 2
+    assert order.extra == {"more": 1}
+
+
+def test_compact():
+    order = make(CompactOrder, more=1)
+    other = order.copy()
+    other.scores.append(3)
+    assert order.as_dict() == dict(id=1, scores="[1, 2]", extra={"more": 1})
+    assert other.replace(id="2", less=0).as_dict() == dict(
+        id=2, scores="[1, 2, 3]", extra={"more": 1, "less": 0})
+
+
+def test_deepcopy():
+    order = make(address={"city": "a"}, tags=["x"], more=[1])
+    other = copy.deepcopy(order)
+    assert other.as_dict() == order.as_dict()
+    assert other.address is not order.address
+    assert other.extra["more"] is not order.extra["more"]
+    other.scores.append(3)
+    with pytest.raises(TypeError):
+        other.tags.append("y")
+    assert order.scores == [1, 2]
+
+
+def test_replace():
+    order = make(total="2", address={"city": "a"})
+    other = order.replace(total="3.5", address={"city": "b"}, more=1)
+    assert other.total == Decimal(2)("3.5")
+    assert other.address.city == "b"
+    assert other.extra == {"more": 1}
+    assert order.as_dict()["total"] == "2.00"
+    assert order.extra == {}
+
+
+def test_replace_validates():
+    order = make()
+    with pytest.raises(ValueError):
+        order.replace(id="x")
+    with pytest.raises(ValueError):
+        order.replace(id=None)
+    with pytest.raises(AttributeError):
+        Address(city="a").replace(town="b")
+
+
+def test_replace_hooks():
+    calls = []
+
+    class Hooked(Typed):
+        a = Field(after_init=lambda self: calls.append("a"))
+        b = Field()
+
+        def __after_init__(self):
+            calls.append("init")
+
+    hooked = Hooked(a="x", b="y")
+    calls.clear()
+    hooked.replace(b="z")
+    assert calls == ["init"]
+    hooked.replace(a="z")
+    assert calls == ["init", "a", "init"]
+
+
+def test_tracked():
+    tracked = make(Tracked)
+    tracked.id = 2
+    other = tracked.replace(id=3)
+    assert other.changed_fields() == []
+    other.scores.append(3)
+    assert other.changed_fields() == ["scores"]
+    assert tracked.changed_fields() == ["id"]
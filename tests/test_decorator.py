@@ -0,0 +1,168 @@
+import decimal
+import logging
+
+import pytest
+
+from typedclass import (
+    Typed, Field, Kwargs, Decimal, Integer, Set, typedfunction,
+    DynamicTyped, NoneValueError, RequiredAttributeError)
+from typedclass import decorator
+
+
+class Item(Typed):
+    id = Field(Integer, is_required=True)
+
+
+@typedfunction(a=Field(Integer, is_required=True), b=Field(Decimal(2)))
+def simple(a, b=None):
+    return a, b
+
+
+def test_simple():
+    assert simple(1, "2") == (1, decimal.Decimal("2.00"))
+    assert simple(b="2", a="1") == (1, decimal.Decimal("2.00"))
+    assert simple(1) == (1, None)
+    assert simple.__name__ == "simple"
+
+
+def test_errors():
+    with pytest.raises(RequiredAttributeError):
+        simple(b="1")
+    with pytest.raises(ValueError) as err:
+        simple("one")
+    assert "for field 'a'" in str(err.value)
+    with pytest.raises(NoneValueError):
+        simple(None)
+    with pytest.raises(TypeError):
+        simple(1, 2, 3)
+    with pytest.raises(TypeError):
+        simple(1, c=3)
+
+
+@typedfunction(a=Field(Integer), b=Field(Integer, default="5"),
+               c=Field(Integer, default=None), d=Field(Item))
+def signature(a, /, b, *args, c, d=None, e=6, **kwargs):
+    return a, b, args, c, d, e, kwargs
+
+
+def test_signature():
+    assert signature(1, 2, 3, c=4, x=5) == (1, 2, (3,), 4, None, 6, dict(x=5))
+    assert signature("1") == (1, 5, (), None, None, 6, {})
+    a, b, args, c, d, e, kwargs = signature(1, d={"id": "2"}, e="e")
+    assert d.id == 2
+    assert e == "e"
+    with pytest.raises(RequiredAttributeError):
+        signature()  # no field or function default
+    with pytest.raises(RequiredAttributeError):
+        signature(a=1)  # positional-only; "a" goes to kwargs
+
+
+def test_function_default_not_validated():
+    @typedfunction(a=Field(Integer))
+    def function(a="not an integer"):
+        return a
+    assert function() == "not an integer"
+    assert function("1") == 1
+
+
+def test_field_in_kwargs():
+    @typedfunction(a=Field(Integer), b=Field(Integer, default=2))
+    def function(a, **kwargs):
+        return a, kwargs
+    assert function(1, b="3", c=4) == (1, dict(b=3, c=4))
+    assert function(1) == (1, dict(b=2))
+
+
+def test_kwargs_parameter():
+    @typedfunction(a=Field(Integer), extra=Kwargs())
+    def function(a, extra):
+        return a, extra
+    assert function(1, b=2) == (1, dict(b=2))
+    assert function(a=1) == (1, {})
+
+
+def test_serialize():
+    @typedfunction(a=Field(Decimal(2)), b=Field(Item))(True)
+    def function(a, b):
+        return a, b
+    assert function("1", {"id": 2}) == ("1.00", {"id": 2})
+
+
+def test_after_init_hook():
+    seen = []
+
+    @typedfunction(a=Field(Integer, after_init=lambda self: seen.append(1)))
+    def function(a):
+        return a
+    assert function("1") == 1
+    assert seen == [1]
+
+
+def test_dynamic_interned():
+    first = DynamicTyped(a=Field(Integer), b=Field(Set("x", "y")))
+    second = DynamicTyped(a=Field(Integer), b=Field(Set("x", "y")))
+    assert first is second
+    assert DynamicTyped(a=Field(Integer), b=Field(Set("x"))) is not first
+    assert DynamicTyped(a=Field(Integer, default=1)) is not \
+        DynamicTyped(a=Field(Integer, default=True))
+    assert DynamicTyped(a=Field(Integer), c=Kwargs()) is not \
+        DynamicTyped(a=Field(Integer))
+
+
+def test_dynamic_fields_not_mutated():
+    field = Field(Integer)
+    cls = DynamicTyped(a=field)
+    assert field.name is None
+    assert field.type is Integer
+    assert cls._n["a"] is not field
+    assert DynamicTyped(b=field)(b="1").b == 1
+    assert cls(a="2").a == 2
+
+
+def test_dynamic_unhashable():
+    field = Field(Integer, default={1})  # a set can't be fingerprinted
+    assert DynamicTyped(a=field) is not DynamicTyped(a=field)
+
+
+class Service:
+    def __init__(self):
+        self.log = logging.getLogger(__name__)
+        self.service = self  # a reference cycle
+
+    def normalize(self, instance, value):
+        return value
+
+
+def test_dynamic_bound_hook():
+    service = Service()
+    first = DynamicTyped(a=Field(Integer, before_set=service.normalize))
+    assert first is DynamicTyped(
+        a=Field(Integer, before_set=service.normalize))
+    assert first is not DynamicTyped(
+        a=Field(Integer, before_set=Service().normalize))
+
+    @typedfunction(a=Field(Integer, before_set=service.normalize))
+    def function(a):
+        return a
+    assert function("1") == 1
+
+
+def test_dynamic_eviction(monkeypatch):
+    monkeypatch.setattr(decorator, "INTERN_SIZE", 2)
+    DynamicTyped.cache_clear()
+    first = DynamicTyped(a=Field())
+    DynamicTyped(b=Field())
+    assert DynamicTyped(a=Field()) is first
+    DynamicTyped(c=Field())  # evicts b, the least recently used
+    info = DynamicTyped.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 2)
+    assert DynamicTyped(a=Field()) is first
+    DynamicTyped(b=Field())
+    assert DynamicTyped.cache_info().misses == 4
+
+
+def test_star_import():
+    namespace = {}
+    exec("from typedclass import *", namespace)
+    assert namespace["typedfunction"] is typedfunction
+    assert namespace["DynamicTyped"] is DynamicTyped
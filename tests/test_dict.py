@@ -1,4 +1,7 @@
-from typedclass import Typed, Field
+import pytest
+
+from typedclass import Typed, Field, Integer, Kwargs
+from typedclass import ExtraAttributeError, RequiredAttributeError
 
 
 class Case1(Typed):
@@ -15,3 +18,63 @@ def test_from_dict():
     t = Case1.from_dict({"a": "bar", "b": "what?"})
     assert t.a == "bar"
     assert not hasattr(t, "b")
+
+
+class Case2(Typed):
+    a = Field(Integer, is_required=True)
+    b = Field(default="B")
+    c = Kwargs()
+
+
+def test_from_records():
+    records = [{"a": 1, "z": 0}, (2, "BB"), {"a": 3, "b": None}]
+    result = Case2.from_records(records[:2])
+    assert [item.as_dict() for item in result] == [
+        dict(a=1, b="B", c={}),
+        dict(a=2, b="BB", c={}),
+    ]
+
+
+def test_from_records_generator():
+    result = Case2.from_records({"a": n} for n in range(3))
+    assert [item.a for item in result] == [0, 1, 2]
+
+
+def test_from_records_raise():
+    with pytest.raises(RequiredAttributeError):
+        Case2.from_records([{"a": 1}, {"b": "B"}])
+
+
+def test_from_records_errors():
+    errors = []
+    records = [{"a": 1}, {"b": "B"}, {"a": "x"}, (1, 2, 3), {"a": 2}]
+    result = Case2.from_records(records, errors=errors)
+    assert [item.a for item in result] == [1, 2]
+    assert [(index, type(err)) for index, _, err in errors] == [
+        (1, RequiredAttributeError),
+        (2, ValueError),
+        (3, ExtraAttributeError),
+    ]
+    assert errors[0][1] is records[1]
+
+
+class Case3(Typed, compact=True):
+    a = Field(Integer)
+
+
+def test_from_records_compact():
+    result = Case3.from_records([{"a": 1}, [2]])
+    assert [item.a for item in result] == [1, 2]
+
+
+class Case4(Typed):
+    a = Field()
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("a", "custom")
+        super().__init__(*args, **kwargs)
+
+
+def test_from_records_custom_init():
+    result = Case4.from_records([{}, {"a": "A", "z": 1}])
+    assert [item.a for item in result] == ["custom", "A"]
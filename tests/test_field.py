@@ -0,0 +1,135 @@
+import pytest
+
+from typedclass import Typed, Field, Kwargs, Integer, Json, Set
+from typedclass import List, String
+from typedclass import NoneValueError, ReadOnlyFieldError
+
+
+class Case1(Typed):
+    a = Field(Integer)
+    b = Field(is_readonly=True, default="B")
+    c = Field(default=None)
+    d = Field(is_required=True)
+    e = Kwargs()
+
+
+def test_class_access():
+    assert isinstance(Case1.a, Field)
+    assert isinstance(Case1.e, Kwargs)
+
+
+def test_get():
+    case = Case1(a="10", d="D", x=1)
+    assert case.a == 10
+    assert case.b == "B"
+    assert case.c is None
+    assert case.e == dict(x=1)
+
+
+def test_get_unset():
+    case = Case1(d="D")
+    with pytest.raises(AttributeError) as error:
+        case.a
+    assert error.value.args[0] == "a"
+    assert not hasattr(case, "a")
+
+
+def test_get_undefined():
+    case = Case1(d="D")
+    with pytest.raises(AttributeError):
+        case.undefined
+
+
+def test_set():
+    case = Case1(d="D")
+    case.a = "20"
+    assert case.a == 20
+    case.c = None
+    assert case.c is None
+
+
+def test_set_readonly():
+    case = Case1(d="D")
+    with pytest.raises(ReadOnlyFieldError):
+        case.b = "BB"
+
+
+def test_set_none():
+    case = Case1(d="D")
+    with pytest.raises(NoneValueError):
+        case.a = None
+
+
+def test_set_undefined():
+    case = Case1(d="D")
+    with pytest.raises(AttributeError):
+        case.undefined = 1
+    with pytest.raises(AttributeError):
+        case.as_dict = 1
+
+
+def test_delete():
+    case = Case1(a=1, d="D")
+    del case.a
+    assert not hasattr(case, "a")
+    with pytest.raises(AttributeError):
+        del case.d
+
+
+def test_hooks():
+    calls = []
+
+    class Case2(Typed):
+        a = Field(
+            before_set=lambda self, value: value.upper(),
+            after_set=lambda self: calls.append(self.a),
+        )
+
+    case = Case2(a="x")
+    assert case.a == "x"
+    case.a = "y"
+    assert case.a == "Y"
+    assert calls == ["Y"]
+
+
+def pair(value):
+    return tuple(value)
+
+
+class Case3(Typed):
+    a = Field(Integer, cache=2)
+    b = Field(pair, cache=2)
+    c = Field(Set("x", "y"), cache=10)
+
+
+def test_cache():
+    assert Case1.a.cache_info() is None
+    for value in ("1", "1", 1, "2", "1", "3"):
+        case = Case3(a=value)
+    assert case.a == 3
+    info = Case3.a.cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (1, 5, 2)
+
+
+def test_cache_errors():
+    with pytest.raises(ValueError):
+        Case3(a="x")
+    with pytest.raises(ValueError):
+        Case3(c="z")
+    case = Case3(c="x")
+    with pytest.raises(ValueError):
+        case.c = "z"
+
+
+def test_cache_unhashable():
+    case = Case3(b=(1, 2))
+    assert case.b == (1, 2)
+    case.b = [1, 2]
+    assert case.b == (1, 2)
+
+
+@pytest.mark.parametrize("field_type", [Json, List(String)])
+def test_cache_mutable(field_type):
+    with pytest.raises(TypeError):
+        class Mutable(Typed):
+            a = Field(field_type, cache=2)
@@ -0,0 +1,151 @@
+import pytest
+
+from typedclass import (
+    Typed, Field, Kwargs, List, Boolean, Decimal, Integer, Set, String,
+    ReadOnlyFieldError)
+from typedclass.frame import TypedFrame
+
+
+class Item(Typed):
+    id = Field(Integer, is_required=True)
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    status = Field(Set("new", "paid", "shipped"), default="new")
+    paid = Field(Boolean)
+    customer = Field(String, is_readonly=True)
+    total = Field(Decimal(2))
+    items = Field(List(Item))
+    extra = Kwargs()
+
+
+RECORDS = [
+    dict(id=1, status="paid", paid=True, customer="ann", total="1.5"),
+    dict(id=2, customer="bob", total="2", items=[{"id": 7}]),
+    dict(id=3, status="paid", paid=False, customer="ann", note="x"),
+]
+
+
+@pytest.fixture
+def frame():
+    return TypedFrame(Order, RECORDS)
+
+
+def test_columns(frame):
+    assert len(frame) == 3
+    assert frame.column("id") == [1, 2, 3]
+    assert frame.column("status") == ["paid", "new", "paid"]
+    assert frame.column("paid") == [True, None, False]
+    assert frame.column("customer")[0] is frame.column("customer")[2]
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        TypedFrame(Order, [dict(id="one")])
+    with pytest.raises(ValueError):
+        TypedFrame(Order, [dict(id=1, status="lost")])
+
+
+def test_instances(frame):
+    frame.append(Order(id=4, status="shipped"))
+    assert frame[-1].status == "shipped"
+
+
+def test_row(frame):
+    row = frame[1]
+    assert row.id == 2
+    assert row.status == "new"
+    assert row.items[0].id == 7
+    with pytest.raises(AttributeError):
+        row.paid
+    assert frame[2].extra == dict(note="x")
+    assert row == Order(**RECORDS[1])
+    assert row.as_dict() == Order(**RECORDS[1]).as_dict()
+
+
+def test_row_to_typed(frame):
+    order = frame[:1].to_typed()[0]
+    assert isinstance(order, Order)
+    assert order.as_dict() == Order(**RECORDS[0]).as_dict()
+
+
+class Helpers(Typed):
+    values = Field()
+    to_typed = Field()
+
+
+def test_row_field_names():
+    row = TypedFrame(Helpers, [dict(values="v", to_typed="t")])[0]
+    assert (row.values, row.to_typed) == ("v", "t")
+    assert row.as_dict() == dict(values="v", to_typed="t")
+
+
+def test_row_set(frame):
+    row = frame[0]
+    row.id = "10"
+    assert frame.column("id")[0] == 10
+    with pytest.raises(ValueError):
+        row.status = "lost"
+    with pytest.raises(ReadOnlyFieldError):
+        row.customer = "cy"
+    del row  # views hold no values of their own
+    assert frame[0].status == "paid"
+
+
+def test_large_integer():
+    frame = TypedFrame(Item, [dict(id=1), dict(id=2 ** 70)])
+    assert frame.column("id") == [1, 2 ** 70]
+    assert frame.sum("id") == 1 + 2 ** 70
+    assert frame.where(id=2 ** 70).column("id") == [2 ** 70]
+    assert frame[1:].column("id") == [2 ** 70]
+    assert frame.take([0]).column("id") == [1]
+
+
+def test_index(frame):
+    with pytest.raises(IndexError):
+        frame[3]
+    assert [row.id for row in frame[1:]] == [2, 3]
+    assert [row.id for row in frame] == [1, 2, 3]
+
+
+def test_where(frame):
+    assert frame.where(status="paid").column("id") == [1, 3]
+    assert frame.where(status="paid", paid=True).column("id") == [1]
+    assert frame.where(id=lambda value: value > 1).column("id") == [2, 3]
+    assert frame.where(paid=False).column("id") == [3]
+    assert len(frame.where(status="lost")) == 0
+    assert frame.where(total=1).column("id") == []
+    assert frame.where(total=2).column("id") == [2]
+    assert frame.where(customer=lambda value: value.count("b")).column(
+        "id") == [2]
+
+
+def test_filter(frame):
+    result = frame.filter(lambda row: row.customer == "ann")
+    assert result.column("id") == [1, 3]
+    assert result[1].extra == dict(note="x")
+
+
+def test_aggregates(frame):
+    assert frame.sum("id") == 6
+    assert frame.min("id") == 1
+    assert frame.max("id") == 3
+    assert frame.mean("id") == 2
+    assert frame.count("paid") == 2
+    assert frame.sum("total") == Decimal(2)("3.5")
+    assert frame.counts("status") == dict(paid=2, new=1)
+    assert frame.counts("customer") == dict(ann=2, bob=1)
+
+
+def test_empty():
+    frame = TypedFrame(Item)
+    assert len(frame) == 0
+    assert frame.sum("id") == 0
+    assert frame.min("id") is None
+    assert frame.mean("id") is None
+
+
+def test_to_typed(frame):
+    orders = frame.to_typed()
+    assert [order.id for order in orders] == [1, 2, 3]
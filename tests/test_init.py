@@ -1,6 +1,6 @@
 import pytest
 
-from typedclass import Typed, Field, Kwargs
+from typedclass import Typed, Field, Kwargs, Integer, compiler, typed
 from typedclass import ExtraAttributeError, DuplicateAttributeError
 from typedclass import RequiredAttributeError, NoneValueError
 
@@ -148,3 +148,143 @@ class Case11(Typed, Case10):
 def test_non_typed_class_with_fields():
     case = Case11(f=1, g=2)
     assert case.as_dict() == dict(f="1", g="2")
+
+
+class Case12(Typed):
+    a = Field(after_init=lambda self: self.calls.append("a"))
+    b = Field(is_required=True)
+
+    def __init__(self, *args, **kwargs):
+        self.__dict__["calls"] = []
+        super().__init__(*args, **kwargs)
+
+    def __after_init__(self):
+        self.calls.append("done")
+
+
+class Case13(Case12):
+    c = Field(default="C")
+
+
+def test_custom_init():
+    case = Case12(1, 2)
+    assert case.as_dict() == dict(a="1", b="2")
+    assert case.calls == ["a", "done"]
+
+
+def test_custom_init_inherited():
+    case = Case13(b=2, c=3)
+    assert case.as_dict() == dict(b="2", c="3")
+    assert case.calls == ["done"]
+
+
+def test_required_before_set():
+    with pytest.raises(RequiredAttributeError):
+        Case12(a=1)
+
+
+def test_compiled_init():
+    assert Case1.__init__ is Case1._init
+    assert Case12.__init__ is not Case12._init
+    assert Case13.__init__ is Case12.__init__
+
+
+def test_lazy_compile():
+    class Lazy(Typed):
+        a = Field(Integer)
+
+    assert isinstance(Lazy.__dict__["_init"], compiler.Lazy)
+    assert Lazy.__dict__["__init__"] is Lazy.__dict__["_init"]
+    for _ in range(compiler.COMPILE_AFTER):
+        assert Lazy(a="1").a == 1
+    assert isinstance(Lazy.__dict__["_init"], compiler.Lazy)
+    assert Lazy(a="2").a == 2  # compiled by this call
+    assert Lazy.__dict__["__init__"] is Lazy.__dict__["_init"]
+    assert callable(Lazy.__dict__["_init"])
+
+
+def test_lazy_compile_through_super():
+    class Parent(Typed):
+        a = Field(Integer)
+
+    class Child(Parent):
+        b = Field(Integer)
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+
+    child = Child(a=1, b=2)  # compiles Parent's and Child's _init
+    assert child.as_dict() == dict(a=1, b=2)
+    assert "__init__" not in vars(Parent) or \
+        vars(Parent)["__init__"] is vars(Parent)["_init"]
+    assert vars(Child)["__init__"] is not vars(Child)["_init"]
+    assert Parent(a=3).a == 3
+
+
+class Item(Typed):
+    id = Field(Integer, is_required=True)
+
+
+HOOKED = []
+
+
+class Case14(Typed, compact=True, tracked=True):
+    a = Field(Integer, default=None)
+    b = Field(Item, after_init=lambda self: HOOKED.append(self.b.id))
+    c = Kwargs()
+
+
+@pytest.mark.parametrize("cls, args, kwargs", (
+    (Case1, (), {}),
+    (Case1, ("x",), {}),
+    (Case1, ("x", "y"), {}),
+    (Case1, ("x",), {"a": "y"}),
+    (Case1, (), {"b": 1}),
+    (Case2, (), {"b": None}),
+    (Case2, (), {"a": None}),
+    (Case2, (1,), {}),
+    (Case3, (1,), {"x": 2, "b": 3}),
+    (Case9, (1, 2, 3, 4, 5), {}),
+    (Case14, (), {}),
+    (Case14, ("1", {"id": "2"}), {"x": 3}),
+    (Case14, (None,), {"b": Item(id=1)}),
+    (Case14, (), {"a": None, "b": None}),
+    (Case14, (), {"a": "x"}),
+    (Case14, (), {"b": {}}),
+    (Case14, (), {"b": 5}),
+))
+def test_generic_init(cls, args, kwargs):
+    """the constructor of a class before it is compiled works the same"""
+    def build(init):
+        HOOKED.clear()
+        instance = cls.__new__(cls)
+        try:
+            init(instance, *args, **dict(kwargs))
+        except Exception as err:
+            return type(err), err.args
+        result = instance.as_dict()
+        if cls._t:
+            result["changed"] = instance.changed_fields()
+        return result, list(HOOKED)
+
+    assert build(typed._generic_init) == build(compiler.compile_init(cls))
+
+
+def test_shared_compilation():
+    class First(Typed):
+        a = Field(Integer, is_required=True)
+        c = Kwargs()
+
+    class Second(Typed):
+        b = Field(Integer, is_required=True)
+        d = Kwargs()
+
+    first = compiler.compile_init(First)
+    second = compiler.compile_init(Second)
+    assert first.__code__.co_code == second.__code__.co_code
+    instance = Second.__new__(Second)
+    second(instance, b="1", a="2")
+    assert instance.as_dict() == dict(b=1, d=dict(a="2"))
+    with pytest.raises(RequiredAttributeError) as required:
+        first(First.__new__(First), b=1)
+    assert required.value.args[0] == "missing required attribute: a"
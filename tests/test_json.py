@@ -0,0 +1,84 @@
+from datetime import date, datetime
+import io
+import json
+
+from typedclass import Typed, Field, Kwargs, List
+from typedclass import Boolean, Decimal, ISODate, ISODateTime, Integer
+from typedclass import Json, Set
+
+
+class Item(Typed):
+    id = Field(Integer, is_required=True)
+    name = Field()
+
+
+class Case1(Typed):
+    a = Field()
+    b = Field(Integer)
+    c = Field(Boolean)
+    d = Field(Decimal(2))
+    e = Field(ISODate)
+    f = Field(ISODateTime)
+    g = Field(Json)
+    h = Field(Set("x", "y"))
+    i = Field(Item)
+    j = Field(List(Item))
+    k = Field(List(Integer))
+    m = Field(default=None)
+    n = Kwargs()
+
+
+def test_to_json():
+    case = Case1(
+        a='quote " and é', b=1, c=False, d="1.5", e="2020-02-03",
+        f="2020-02-03 04:05:06", g='{"x": [1, 2]}', h="y",
+        i={"id": 1}, j=[{"id": 2, "name": "two"}, Item(id=3)], k=[4, 5],
+        z=[1],
+    )
+    assert json.loads(case.to_json()) == dict(
+        n=dict(z=[1]),
+        a='quote " and é', b=1, c=0, d="1.50", e="2020-02-03",
+        f="2020-02-03T04:05:06", g={"x": [1, 2]}, h="y",
+        i={"id": 1}, j=[{"id": 2, "name": "two"}, {"id": 3}], k=[4, 5],
+        m=None,
+    )
+
+
+def test_to_json_matches_as_dict():
+    case = Case1(a="A", b=2, c=True, e=date(2020, 1, 1),
+                 f=datetime(2020, 1, 1, 10), i=Item(id=1, name="x"))
+    assert json.loads(case.to_json()) == case.as_dict()
+
+
+def test_to_json_empty():
+    assert Item.from_records([{"id": 1}])[0].to_json() == '{"id":1}'
+    assert Case1(m="M").to_json() == '{"n":{},"m":"M"}'
+
+
+def test_to_json_empty_list():
+    assert json.loads(Case1(j=[], k=[]).to_json())["j"] == []
+
+
+def test_dump():
+    fp = io.StringIO()
+    Item(id=7, name="seven").dump(fp)
+    assert fp.getvalue() == '{"id":7,"name":"seven"}'
+
+
+class Case2(Typed, compact=True):
+    a = Field()
+    b = Field(List(Item))
+
+
+def test_to_json_compact():
+    case = Case2(b=[{"id": 1}])
+    assert case.to_json() == '{"b":[{"id":1}]}'
+
+
+class Case3(Item):
+    extra = Field(Integer)
+
+
+def test_to_json_subclass():
+    assert Item(id=1).to_json() == '{"id":1}'
+    assert Case3(id=1, extra=2).to_json() == '{"id":1,"extra":2}'
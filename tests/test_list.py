@@ -1,8 +1,9 @@
 import pytest
 
-from typedclass import Typed, Field, List, String, Integer
+from typedclass import Typed, Field, List, String, Integer, Json
 from typedclass.list import ListTooLongError, ListTooShortError
-from typedclass.list import ListDuplicateItemError
+from typedclass.list import ListValueError
+from typedclass.list import ListDuplicateItemError, ListReadOnlyError
 
 
 class Case1(Typed):
@@ -36,6 +37,20 @@ def test_slice():
     assert c.a[1:-1] == ["2", "3", "4"]
 
 
+def test_not_a_list():
+    with pytest.raises(ValueError):
+        Case1(a=5)
+
+
+def test_not_a_list_from_records():
+    errors = []
+    result = Case1.from_records([{"a": 5}, {"a": [1]}], errors=errors)
+    assert [item.a for item in result] == [["1"]]
+    assert [(index, type(err)) for index, _, err in errors] == [
+        (0, ListValueError),
+    ]
+
+
 class Case2(Typed):
     a = Field(List(String, min=3))
 
@@ -183,3 +198,175 @@ def test_typed_set_setattr(init, key, value, is_valid):
     else:
         with pytest.raises(ListDuplicateItemError):
             c.a[key] = value
+
+
+def test_unique_after_delete():
+    c = Case5([1, 2, 3])
+    del c.a[0]
+    c.a.append(1)
+    del c.a[0:2]
+    c.a.append(2)
+    c.a.append(3)
+    assert c.a == [1, 2, 3]
+    with pytest.raises(ListDuplicateItemError):
+        c.a.append(3)
+
+
+def test_unique_after_set():
+    c = Case5([1, 2, 3])
+    c.a[0] = 4
+    c.a.append(1)
+    with pytest.raises(ListDuplicateItemError):
+        c.a.append(4)
+
+
+def test_unique_large():
+    c = Case5(list(range(20000)))
+    assert len(c.a) == 20000
+    with pytest.raises(ListDuplicateItemError):
+        c.a.append(19999)
+
+
+class Case6(Typed):
+    a = Field(List(Json, allow_dups=False))
+
+
+def test_unique_unhashable():
+    c = Case6([{"x": 1}, [1], '"a"'])
+    c.a.append({"x": 2})
+    with pytest.raises(ListDuplicateItemError):
+        c.a.append({"x": 1})
+    with pytest.raises(ListDuplicateItemError):
+        c.a.append('"a"')
+
+
+def test_extend():
+    c = Case3(a=[1])
+    c.a.extend([2, 3])
+    assert c.a == ["1", "2", "3"]
+    with pytest.raises(ListTooLongError):
+        c.a.extend([4])
+    assert c.a == ["1", "2", "3"]
+
+
+@pytest.mark.parametrize("values", (
+    [3],
+    [4, 4],
+))
+def test_extend_unique(values):
+    c = Case5([1, 2, 3])
+    with pytest.raises(ListDuplicateItemError):
+        c.a.extend(values)
+    assert c.a == [1, 2, 3]
+
+
+def test_insert():
+    c = Case5([1, 3])
+    c.a.insert(1, 2)
+    assert c.a == [1, 2, 3]
+    with pytest.raises(ListDuplicateItemError):
+        c.a.insert(0, 3)
+
+
+def test_pop():
+    c = Case1(a=[1, 2, 3, 4])
+    assert c.a.pop() == "4"
+    assert c.a.pop(0) == "1"
+    assert c.a == ["2", "3"]
+    with pytest.raises(ListTooShortError):
+        Case2(a=[1, 2, 3]).a.pop()
+
+
+def test_pop_unique():
+    c = Case5([1, 2, 3])
+    c.a.pop(0)
+    c.a.append(1)
+    assert c.a == [2, 3, 1]
+
+
+def test_remove():
+    c = Case5([1, 2, 3])
+    c.a.remove("2")
+    assert c.a == [1, 3]
+    c.a.append(2)
+    with pytest.raises(ValueError):
+        c.a.remove(5)
+
+
+def test_clear():
+    c = Case5([1, 2, 3])
+    c.a.clear()
+    assert c.a == []
+    c.a.append(1)
+    with pytest.raises(ListTooShortError):
+        Case2(a=[1, 2, 3]).a.clear()
+
+
+def test_slice_assignment():
+    c = Case5([1, 2, 3, 4])
+    c.a[1:3] = [3, 2, 5]
+    assert c.a == [1, 3, 2, 5, 4]
+    c.a[::2] = ["6", 7, 8]
+    assert c.a == [6, 3, 7, 5, 8]
+    with pytest.raises(ValueError):
+        c.a[::2] = [9]
+    assert c.a == [6, 3, 7, 5, 8]
+
+
+@pytest.mark.parametrize("key, values", (
+    (slice(0, 1), [2]),
+    (slice(0, 2), [4, 4]),
+))
+def test_slice_assignment_unique(key, values):
+    c = Case5([1, 2, 3])
+    with pytest.raises(ListDuplicateItemError):
+        c.a[key] = values
+    assert c.a == [1, 2, 3]
+
+
+def test_slice_assignment_length():
+    c = Case3(a=[1, 2])
+    with pytest.raises(ListTooLongError):
+        c.a[:] = [1, 2, 3, 4]
+    c = Case2(a=[1, 2, 3])
+    with pytest.raises(ListTooShortError):
+        c.a[1:] = []
+
+
+class Case7(Typed):
+    a = Field(List(Integer, allow_dups=False, frozen=True))
+
+
+def test_frozen():
+    c = Case7(a=[1, "2", 3])
+    assert c.a == [1, 2, 3]
+    assert c.a[1:] == (2, 3)
+    assert len(c.a) == 3
+    assert c.as_dict() == {"a": "[1, 2, 3]"}
+    assert c.to_json() == '{"a":[1,2,3]}'
+    with pytest.raises(ListDuplicateItemError):
+        Case7(a=[1, 1])
+
+
+@pytest.mark.parametrize("mutate", (
+    lambda a: a.append(4),
+    lambda a: a.extend([4]),
+    lambda a: a.insert(0, 4),
+    lambda a: a.pop(),
+    lambda a: a.remove(1),
+    lambda a: a.clear(),
+    lambda a: a.__setitem__(0, 4),
+    lambda a: a.__delitem__(0),
+))
+def test_frozen_read_only(mutate):
+    c = Case7(a=[1, 2, 3])
+    with pytest.raises(ListReadOnlyError):
+        mutate(c.a)
+    assert c.a == [1, 2, 3]
+
+
+def test_shared_spec():
+    c, d = Case5([1]), Case5([2])
+    assert c.a.spec is d.a.spec is Case5.a.type
+    assert not hasattr(c.a, "__dict__")
+    assert c.a.allow_dups is False
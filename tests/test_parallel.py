@@ -0,0 +1,45 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from typedclass import Typed, Field, Integer, DynamicTyped
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    customer = Field()
+
+
+def records(count):
+    return ({"id": str(index), "customer": "x"} for index in range(count))
+
+
+def test_validate_parallel():
+    result = Order.validate_parallel(records(25), workers=2, chunk_size=4)
+    assert [order.id for order in result] == list(range(25))
+    assert result[0].as_dict() == dict(id=0, customer="x")
+
+
+def test_errors():
+    data = list(records(10))
+    data[3]["id"] = "x"
+    del data[7]["id"]
+    errors = []
+    result = Order.validate_parallel(data, 2, 3, errors)
+    assert len(result) == 8
+    assert [(index, record) for index, record, _ in errors] == [
+        (3, data[3]), (7, data[7])]
+    assert "missing required attribute: id" in str(errors[1][2])
+    with pytest.raises(ValueError):
+        Order.validate_parallel(data, 2, 3)
+
+
+def test_executor_and_dynamic():
+    cls = DynamicTyped(id=Field(Integer))
+    with ProcessPoolExecutor(2) as pool:
+        from typedclass.parallel import validate_parallel
+        result = validate_parallel(
+            cls, [{"id": "1"}, {"id": "2"}], chunk_size=1, executor=pool)
+        assert pool.submit(int, "3").result() == 3  # still usable
+    assert [item.id for item in result] == [1, 2]
+    assert result[0].__class__ is cls
@@ -0,0 +1,114 @@
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from typedclass import (
+    Typed, Field, Kwargs, List, Integer, Decimal, ISODate, String,
+    DynamicTyped, RequiredAttributeError)
+from typedclass.list import ListTooLongError
+
+
+class Address(Typed):
+    city = Field()
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    total = Field(Decimal(2))
+    day = Field(ISODate, cache=10)
+    address = Field(Address)
+    scores = Field(List(Integer, allow_dups=False))
+    tags = Field(List(String, frozen=True))
+    extra = Kwargs()
+
+
+class CompactOrder(Typed, compact=True, cached=True):
+    id = Field(Integer)
+    total = Field(Decimal(2))
+
+
+class Tracked(Typed, tracked=True):
+    id = Field(Integer)
+    scores = Field(List(Integer))
+
+
+def roundtrip(value):
+    return pickle.loads(pickle.dumps(value))
+
+
+def test_pickle():
+    order = Order(id=1, total="2", day="2020-01-02", address={"city": "a"},
+                  scores=[1, 2], tags=["x"], more=1)
+    other = roundtrip(order)
+    assert other.as_dict() == order.as_dict()
+    other.scores.append(3)
+    with pytest.raises(ValueError):
+        other.scores.append(1)  # still unique
+    with pytest.raises(TypeError):
+        other.tags.append("y")
+
+
+def test_unset():
+    other = roundtrip(Order(id=1))
+    assert other.as_dict() == dict(id=1, extra={})
+    with pytest.raises(AttributeError):
+        other.total
+
+
+def test_compact_cached():
+    order = CompactOrder(id=1, total="2")
+    order.as_dict()
+    other = roundtrip(order)
+    assert other.as_dict() == dict(id=1, total="2.00")
+    other.total = 3
+    assert other.as_dict()["total"] == "3.00"
+
+
+def test_tracked():
+    tracked = Tracked(id=1, scores=[1])
+    tracked.id = 2
+    other = roundtrip(tracked)
+    assert other.changed_fields() == []
+    other.scores.append(2)
+    assert other.changed_fields() == ["scores"]
+
+
+def test_compact_size():
+    orders = [Order(id=index, total="2", scores=[1]) for index in range(100)]
+    default = pickle.dumps([order.__dict__ for order in orders])
+    assert len(pickle.dumps(orders)) < len(default)
+
+
+def test_no_validation(monkeypatch):
+    data = pickle.dumps(Order(id=1, total="2"))
+    monkeypatch.setattr(Order._n["total"], "coerce", None)
+    assert pickle.loads(data).total == Decimal(2)("2")
+
+
+def test_dynamic():
+    cls = DynamicTyped(a=Field(Integer), b=Field(String(max=3), cache=5))
+    item = roundtrip(cls(a="1", b="x"))
+    assert item.__class__ is cls
+    assert item.as_dict() == dict(a=1, b="x")
+    DynamicTyped.cache_clear()
+    other = roundtrip(cls(a="1"))
+    assert other.__class__ is not cls
+    with pytest.raises(ValueError):
+        other.b = "long"
+
+
+def test_dynamic_in_new_process():
+    cls = DynamicTyped(price=Field(Decimal(2)))
+    code = (
+        "import pickle, sys\n"
+        "cls = pickle.loads(sys.stdin.buffer.read())\n"
+        "assert cls(price='1.234').as_dict() == dict(price='1.23')\n")
+    subprocess.run(
+        [sys.executable, "-c", code], input=pickle.dumps(cls), check=True)
+
+
+def test_errors():
+    for err in (RequiredAttributeError("a"), ListTooLongError(2)):
+        assert str(roundtrip(err)) == str(err)
@@ -0,0 +1,99 @@
+import pytest
+
+from typedclass import Typed, Field, Integer, Decimal, profile
+
+
+class Order(Typed):
+    id = Field(Integer, is_required=True)
+    total = Field(Decimal(2))
+
+
+class Other(Typed):
+    count = Field(Integer)
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    yield
+    profile.disable()
+    profile.reset()
+
+
+def calls(kind, key, operation):
+    counters = profile.stats()[kind].get(key, {})
+    return counters.get(operation, {}).get("calls", 0)
+
+
+def test_disabled():
+    Order(id=1)
+    assert calls("fields", "Order.id", "init") == 0
+    assert not profile.is_enabled(Order)
+    assert Order.__dict__["_init"] is not None
+    assert "_setfield" not in Order.__dict__
+
+
+def test_enable_class():
+    profile.enable(Order)
+    Order(id=1, total="1.5")
+    Order.from_records([dict(id=2)])
+    Other(count=1)
+    assert calls("fields", "Order.id", "init") == 2
+    assert calls("fields", "Order.total", "init") == 1
+    assert calls("types", "Integer", "init") == 2
+    assert calls("fields", "Other.count", "init") == 0
+
+
+def test_failures():
+    profile.enable(Order)
+    with pytest.raises(ValueError):
+        Order(id="x")
+    assert profile.stats()["fields"]["Order.id"]["init"] == dict(
+        calls=1, failures=1, time=pytest.approx(0, abs=1))
+
+
+def test_set_and_serialize():
+    profile.enable(Order)
+    order = Order(id=1)
+    order.total = "2"
+    assert calls("fields", "Order.total", "set") == 1
+    assert order.as_dict() == dict(id=1, total="2.00")
+    assert calls("fields", "Order.total", "serialize") == 1
+    assert calls("types", "Decimal", "serialize") == 1
+
+
+def test_enable_all():
+    profile.enable()
+
+    class Later(Typed):
+        a = Field(Integer)
+
+    Other(count=1).count = 2
+    Later(a=1).as_dict()
+    assert calls("fields", "Other.count", "init") == 1
+    assert calls("fields", "Other.count", "set") == 1
+    assert calls("fields", "test_enable_all.<locals>.Later.a", "init") == 1
+
+
+def test_disable():
+    profile.enable()
+    profile.disable(Other)
+    Other(count=1).count = 2
+    Order(id=1)
+    assert calls("fields", "Other.count", "init") == 0
+    assert calls("fields", "Other.count", "set") == 0
+    assert calls("fields", "Order.id", "init") == 1
+    profile.disable()
+    Order(id=1)
+    assert calls("fields", "Order.id", "init") == 1
+    assert not profile.is_enabled(Order)
+    assert Typed.__dict__["_setfield"] is not profile._setfield
+    assert Typed.__dict__["as_dict"] is not profile._as_dict
+
+
+def test_reset():
+    profile.enable(Order)
+    Order(id=1)
+    profile.reset()
+    assert calls("fields", "Order.id", "init") == 0
+    Order(id=1)
+    assert calls("fields", "Order.id", "init") == 1
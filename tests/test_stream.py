@@ -0,0 +1,81 @@
+import io
+import json
+
+import pytest
+
+from typedclass import Typed, Field, Integer
+from typedclass.stream import iter_json
+
+
+class Case1(Typed):
+    a = Field(Integer, is_required=True)
+    b = Field(default="B")
+
+
+RECORDS = [{"a": n, "b": f"é{n}"} for n in range(100)]
+
+
+@pytest.mark.parametrize("data", (
+    json.dumps(RECORDS),
+    json.dumps(RECORDS, indent=4),
+    json.dumps(RECORDS, ensure_ascii=False).encode(),
+))
+def test_iter_json(data):
+    fp = io.BytesIO(data) if isinstance(data, bytes) else io.StringIO(data)
+    result = list(Case1.iter_json(fp))
+    assert [item.as_dict() for item in result] == [
+        dict(a=n, b=f"é{n}") for n in range(100)]
+
+
+@pytest.mark.parametrize("size", (1, 2, 3, 7, 1000))
+def test_iter_json_read_size(size):
+    data = '[1, 22, 333, {"a": [1, 2, "x"]}, "four", null, true]'
+    assert list(iter_json(io.StringIO(data), size)) == json.loads(data)
+
+
+def test_iter_json_split_numbers():
+    data = '[1.5, 2.25e3,-7,0.125E-2, 12e+1 ,3]'
+    for size in range(1, len(data) + 1):
+        assert list(iter_json(io.StringIO(data), size)) == json.loads(data)
+
+
+@pytest.mark.parametrize("data, result", (
+    ("[]", []),
+    (" [ ] ", []),
+    ('{"a": 1}', [{"a": 1}]),
+))
+def test_iter_json_edges(data, result):
+    assert list(iter_json(io.StringIO(data))) == result
+
+
+@pytest.mark.parametrize("data", (
+    "[1, 2",
+    "[1 2]",
+    "[1, 2] 3",
+    "1",
+))
+def test_iter_json_invalid(data):
+    with pytest.raises(ValueError):
+        list(iter_json(io.StringIO(data), 2))
+
+
+def test_iter_json_lazy():
+    fp = io.StringIO(json.dumps([{"a": n} for n in range(100000)]))
+    first = next(Case1.iter_json(fp, chunk_size=10))
+    assert len(first) == 10
+    assert fp.tell() < len(fp.getvalue())
+
+
+def test_iter_ndjson():
+    data = "\n".join(json.dumps(record) for record in RECORDS) + "\n\n"
+    chunks = list(Case1.iter_ndjson(io.StringIO(data), chunk_size=30))
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert chunks[3][9].a == 99
+
+
+def test_iter_errors():
+    data = '[{"a": 1}, {"b": "x"}, {"a": 3}, {"a": "bad"}]'
+    errors = []
+    result = list(Case1.iter_json(io.StringIO(data), errors=errors))
+    assert [item.a for item in result] == [1, 3]
+    assert [index for index, _, _ in errors] == [1, 3]
@@ -0,0 +1,84 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+from typedclass import Typed, Field, Integer, List, compiler, typed
+
+
+def test_shared_field_unchanged():
+    shared = Field(Integer, cache=10)
+
+    class First(Typed):
+        a = shared
+
+    class Second(Typed):
+        b = shared
+
+    assert shared.name is None and shared.type is Integer
+    assert First(a="1").a == 1 and Second(b="2").b == 2
+    assert First._n["a"] is not Second._n["b"]
+    assert First._n["a"].cache_info() is not None
+
+
+def test_mixin_field():
+    class Mixin:
+        a = Field(Integer)
+
+    class First(Mixin, Typed):
+        pass
+
+    class Second(Mixin, Typed):
+        b = Field()
+
+    class Third(Mixin, Typed):
+        a = Field()  # overrides the mixin
+
+    assert First(a="1").a == 1
+    assert Second(a="2", b="x").as_dict() == dict(a=2, b="x")
+    assert Third(a="x").a == "x"
+    assert Mixin.a.name is None
+
+
+def test_compile_once(monkeypatch):
+    calls = []
+    compile_init = typed.compile_init
+
+    def counted(cls):
+        calls.append(cls)
+        return compile_init(cls)
+    monkeypatch.setattr(typed, "compile_init", counted)
+
+    class Order(Typed):
+        id = Field(Integer)
+
+    barrier = threading.Barrier(8)
+
+    def build(index):
+        barrier.wait()
+        for _ in range(compiler.COMPILE_AFTER):
+            Order(id=index)
+        return Order(id=index).id
+
+    with ThreadPoolExecutor(8) as pool:
+        assert sorted(pool.map(build, range(8))) == list(range(8))
+    assert calls == [Order]
+
+
+def test_concurrent_use():
+    class Item(Typed):
+        sku = Field()
+
+    class Order(Typed, cached=True):
+        id = Field(Integer)
+        items = Field(List(Item))
+
+    def work(index):
+        result = []
+        for count in range(200):
+            order = Order(id=index, items=[{"sku": "a"}])
+            order.items.append({"sku": str(count)})
+            order.id = count
+            result.append(order.to_json() == order.copy().to_json())
+        return all(result)
+
+    with ThreadPoolExecutor(8) as pool:
+        assert all(pool.map(work, range(8)))
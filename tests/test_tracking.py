@@ -0,0 +1,160 @@
+import pytest
+
+from typedclass import Typed, Field, Kwargs, List, Integer, Decimal
+
+
+class Address(Typed):
+    city = Field()
+
+
+class Tag(Typed, tracked=True):
+    name = Field()
+
+
+class Account(Typed, tracked=True):
+    id = Field(Integer, is_required=True)
+    balance = Field(Decimal(2))
+    address = Field(Address)
+    tags = Field(List(Tag))
+    scores = Field(List(Integer))
+    extra = Kwargs()
+
+
+class CompactAccount(Typed, compact=True, tracked=True):
+    id = Field(Integer)
+    address = Field(Address)
+
+
+def make():
+    return Account(id=1, balance="2", address={"city": "a"},
+                   tags=[{"name": "x"}], scores=[1, 2])
+
+
+def test_clean():
+    account = make()
+    assert account.changed_fields() == []
+    assert account.diff() == {}
+    assert Account.from_dict(dict(id=1)).changed_fields() == []
+    assert Account.from_records([dict(id=1)])[0].changed_fields() == []
+
+
+def test_set_and_delete():
+    account = make()
+    account.scores = [3]
+    account.balance = "3"
+    del account.address
+    assert account.changed_fields() == ["balance", "address", "scores"]
+    assert account.diff() == dict(
+        balance="3.00", address=None, scores="[3]")
+
+
+def test_diff_serializes_changes_only(monkeypatch):
+    def fail(value):
+        raise AssertionError("unchanged field serialized")
+
+    account = make()
+    monkeypatch.setattr(Account._n["scores"].type, "serialize", fail)
+    monkeypatch.setattr(Address, "as_dict", fail)
+    account.id = 2
+    assert account.diff() == dict(id=2)
+
+
+def test_mark_clean():
+    account = make()
+    account.balance = "3"
+    account.tags[0].name = "y"
+    account.mark_clean()
+    assert account.changed_fields() == []
+    assert account.tags[0].changed_fields() == []
+
+
+@pytest.mark.parametrize("change, name", (
+    (lambda account: setattr(account.address, "city", "b"), "address"),
+    (lambda account: setattr(account.tags[0], "name", "y"), "tags"),
+    (lambda account: account.tags.append({"name": "y"}), "tags"),
+    (lambda account: account.scores.pop(), "scores"),
+    (lambda account: account.scores.__setitem__(0, 5), "scores"),
+))
+def test_nested_change(change, name):
+    account = make()
+    change(account)
+    assert account.changed_fields() == [name]
+
+
+def test_new_nested_value_watched():
+    account = make()
+    account.address = Address(city="b")
+    account.mark_clean()
+    account.address.city = "c"
+    assert account.diff() == dict(address={"city": "c"})
+
+
+def test_nested_tracked():
+    account = make()
+    account.tags[0].name = "y"
+    assert account.tags[0].changed_fields() == ["name"]
+    assert account.tags[0].diff() == dict(name="y")
+
+
+def test_compact():
+    account = CompactAccount(id=1, address={"city": "a"})
+    account.address.city = "b"
+    assert account.changed_fields() == ["address"]
+    account.mark_clean()
+    account.id = 2
+    assert account.diff() == dict(id=2)
+
+
+def test_inherited():
+    class Sub(Account):
+        more = Field()
+
+    sub = Sub(id=1)
+    sub.more = "x"
+    assert sub.changed_fields() == ["more"]
+
+
+def test_not_tracked():
+    with pytest.raises(TypeError):
+        Address(city="a").changed_fields()
+
+
+def test_hooks_leave_instance_clean():
+    class Row(Typed, tracked=True):
+        qty = Field(Integer, after_init=lambda row: setattr(row, "sets", 1))
+        sets = Field(Integer)
+        total = Field(Integer)
+
+        def __after_init__(self):
+            self.total = self.qty * 2
+
+    for row in (Row(qty=3), Row.from_dict(dict(qty=3)), Row(3)):
+        assert (row.sets, row.total) == (1, 6)
+        assert row.changed_fields() == []
+        assert row.diff() == {}
+
+
+def test_detached_values_forgotten():
+    account = make()
+    address, tag = account.address, account.tags[0]
+    account.address = Address(city="b")
+    account.tags.append({"name": "y"})
+    del account.tags[0]
+    account.mark_clean()
+    address.city = "c"
+    tag.name = "z"
+    assert account.changed_fields() == []
+    account.tags[0].name = "w"
+    assert account.changed_fields() == ["tags"]
+
+
+def test_changes_own_only_new_items(monkeypatch):
+    account = make()
+    account.tags.extend([{"name": "y"}, {"name": "z"}])
+    owned = []
+    monkeypatch.setattr(
+        Tag, "_own", lambda tag, owner, name: owned.append(tag.name))
+    account.tags.append({"name": "new"})
+    account.tags[0] = {"name": "first"}
+    account.tags.pop()
+    assert owned == ["new", "first"]
@@ -1,8 +1,9 @@
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
 import decimal
 import pytest
 
-from typedclass import Boolean, Decimal, ISODate, Set, String
+from typedclass import (
+    Boolean, Decimal, ISODate, ISODateTime, Integer, Set, String)
 
 
 @pytest.mark.parametrize("value, result", (
@@ -17,6 +18,21 @@ def test_boolean(value, result):
     assert result == Boolean()(value)
 
 
+@pytest.mark.parametrize("value, result", (
+    (1, 1),
+    ("12", 12),
+    ("007", 7),
+))
+def test_integer(value, result):
+    assert result == Integer()(value)
+
+
+@pytest.mark.parametrize("value", ("-1", "1.0", "", " 1", "1\n", True, None))
+def test_bad_integer(value):
+    with pytest.raises(ValueError):
+        Integer()(value)
+
+
 def test_bad_boolean():
     with pytest.raises(ValueError):
         Boolean()("eek")
@@ -56,6 +72,7 @@ def test_bad_decimal():
 
 @pytest.mark.parametrize("value, result", (
     ("2020-02-03", date(2020, 2, 3)),
+    ("2020-2-3", date(2020, 2, 3)),
     (date(2020, 2, 3), date(2020, 2, 3)),
 ))
 def test_isodate(value, result):
@@ -72,6 +89,36 @@ def test_bad_isodate(value):
         ISODate()(value)
 
 
+UTC = timezone.utc
+
+
+@pytest.mark.parametrize("value, result", (
+    ("2020-02-03 04:05:06", datetime(2020, 2, 3, 4, 5, 6)),
+    ("2020-02-03T04:05:06", datetime(2020, 2, 3, 4, 5, 6)),
+    ("2020-02-03T04:05:06.5", datetime(2020, 2, 3, 4, 5, 6, 500000)),
+    ("2020-02-03T04:05:06.123456", datetime(2020, 2, 3, 4, 5, 6, 123456)),
+    ("2020-02-03T04:05:06Z", datetime(2020, 2, 3, 4, 5, 6, tzinfo=UTC)),
+    ("2020-02-03T04:05:06+02:00", datetime(
+        2020, 2, 3, 4, 5, 6, tzinfo=timezone(timedelta(hours=2)))),
+    ("2020-2-3 4:5:6", datetime(2020, 2, 3, 4, 5, 6)),
+    (datetime(2020, 2, 3), datetime(2020, 2, 3)),
+))
+def test_isodatetime(value, result):
+    assert result == ISODateTime()(value)
+
+
+@pytest.mark.parametrize("value", (
+    ("bad"),
+    ("2020-02-03T25:00:00"),
+    ("Z"),
+    (100),
+    (None),
+))
+def test_bad_isodatetime(value):
+    with pytest.raises(ValueError):
+        ISODateTime()(value)
+
+
 @pytest.mark.parametrize("valid, value, result", (
     (["A", "B", "C"], "A", "A"),
     (["A", "B", "C"], "B", "B"),
@@ -19,5 +19,21 @@ from typedclass.types import Json
 from typedclass.types import Set
 from typedclass.types import String
 
-from typedclass.decorator import typedfunction
-from typedclass.decorator import DynamicTyped
+__all__ = [
+    "Field", "List",
+    "DuplicateAttributeError", "ExtraAttributeError", "Kwargs",
+    "NoneValueError", "ReadOnlyFieldError", "RequiredAttributeError",
+    "Typed",
+    "Boolean", "Decimal", "ISODate", "ISODateTime", "Integer", "Json",
+    "Set", "String",
+    "typedfunction", "DynamicTyped",
+]
+
+
+def __getattr__(name):
+    # typedfunction and DynamicTyped are imported on first use, since the
+    # decorator module's imports aren't needed to define Typed classes
+    if name in ("typedfunction", "DynamicTyped"):
+        from typedclass import decorator
+        return getattr(decorator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,76 @@
+"""Asyncio ingestion
+
+   Validating a large batch inside a coroutine holds the event loop for
+   the whole batch. aiter_records validates records in chunks and gives
+   the loop a turn between chunks, or runs the chunks in an executor:
+
+       async for orders in Order.aiter_records(records, chunk_size=500):
+           await save(orders)
+
+   The records are pulled from records (an async or a plain iterable)
+   one chunk at a time, as the consumer asks for the next chunk, so a
+   slow consumer slows down the reading instead of letting validated
+   instances pile up.
+"""
+import asyncio
+from itertools import islice
+
+from typedclass.parallel import _validate
+
+
+async def _achunks(records, size):
+    if not hasattr(records, "__aiter__"):
+        records = iter(records)
+        while chunk := list(islice(records, size)):
+            yield chunk
+        return
+    chunk = []
+    async for record in records:
+        chunk.append(record)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def aiter_records(cls, records, chunk_size=100, errors=None,
+                        executor=None):
+    """validate records for cls in chunks, yielding a list per chunk
+
+       Each chunk of chunk_size records is validated with from_records
+       (see there for errors; error indexes count from the start of
+       records). Without an executor, chunks are validated in the event
+       loop's thread, with a turn for other tasks before each one; with
+       an executor (a thread or process pool) the loop is free while a
+       chunk is validated, and the next chunk is validated while the
+       consumer handles the current one.
+    """
+    collect = errors is not None
+
+    def take(result):
+        instances, failed = result
+        if collect:
+            errors.extend(failed)
+        return instances
+
+    loop = asyncio.get_running_loop()
+    start, pending = 0, None
+    try:
+        async for chunk in _achunks(records, chunk_size):
+            if executor is None:
+                await asyncio.sleep(0)  # let other tasks run
+                yield take(_validate(cls, start, chunk, collect))
+            else:
+                future = loop.run_in_executor(
+                    executor, _validate, cls, start, chunk, collect)
+                if pending is not None:
+                    yield take(await pending)
+                pending = future
+            start += len(chunk)
+        if pending is not None:
+            yield take(await pending)
+            pending = None
+    finally:
+        if pending is not None:  # the consumer stopped early
+            pending.cancel()
@@ -0,0 +1,511 @@
+"""Compact binary encoding
+
+   Typed.to_bytes and Typed.from_bytes write and read a binary form laid
+   out from a class's fields ("_f"). It is a fraction of the size of the
+   JSON text, and it is decoded without parsing text or validating
+   values:
+
+       data = order.to_bytes()
+       order = Order.from_bytes(data)  # bytes, bytearray or memoryview
+
+   An instance is a fixed-size header followed by a variable part:
+
+       header    a bit mask of the fields that have a (non-None) value and
+                 one of the fields that are None, then every fixed-width
+                 field (zeros when the field has no value) in one struct:
+                 Integer "q", Boolean "?", Decimal "q" (the value scaled
+                 by its precision), ISODate "i" (ordinal), ISODateTime
+                 "q" (microseconds from 0001-01-01) and "i" (UTC offset
+                 in seconds, or a marker for a naive value), Set "B" or
+                 "H" (index in the set's values)
+       escaped   in field order, the values that don't fit their header
+                 code, as text: an Integer or Decimal out of the int64
+                 range, or a datetime held by an ISODate field (the
+                 header has the code's lowest value, or 0 for ISODate)
+       variable  in field order, the other fields that have a value: a
+                 String as a size and UTF-8 bytes, a Json value (or one
+                 of a type with no binary form) as a size and JSON text, a
+                 nested Typed (of exactly the field's class) as its own
+                 encoding and a List as a count and its items (fixed-width
+                 items in one struct; Integer, Decimal and ISODate items
+                 after the code they are packed with, integers with the
+                 narrowest one that fits them all, or "x" and the items
+                 as text if one doesn't fit); then the Kwargs dict, as
+                 JSON text
+
+   A size is one byte, or 255 and four more bytes; numbers are little
+   endian. The encoding has no field names or version, so it can only be
+   read by a class with the same fields as the writer. Values are trusted
+   when decoded, as with construct, except that values of a type with no
+   binary form go through the field's coercion. An aware datetime comes
+   back with a fixed-offset timezone.
+
+   The encoder and decoder are compiled for each class on first use.
+"""
+import json
+import struct
+
+from typedclass.compiler import _Source, _function, _UNSET, _dumps
+from typedclass.compiler import json_encoder
+from typedclass import types
+
+
+_SIZE = struct.Struct("<I")
+_NAIVE = -(2 ** 31)  # the UTC offset of a naive datetime
+_MASKS = {1: "B", 2: "H", 3: "I", 4: "I", 5: "Q", 6: "Q", 7: "Q", 8: "Q"}
+_TEXT = ord("x")  # the code of a list written as text (see _Fixed)
+
+
+def _write_size(out, size):
+    if size < 255:
+        out.append(size)
+    else:
+        out.append(255)
+        out += _SIZE.pack(size)
+
+
+def _read_size(view, offset):
+    size = view[offset]
+    if size < 255:
+        return size, offset + 1
+    return _SIZE.unpack_from(view, offset + 1)[0], offset + 5
+
+
+def _write_text(out, value):
+    data = value.encode()
+    _write_size(out, len(data))
+    out += data
+
+
+def _read_text(view, offset):
+    size, offset = _read_size(view, offset)
+    end = offset + size
+    return str(view[offset:end], "utf-8"), end
+
+
+class _Fixed:
+    """a type packed as struct codes
+
+       encode turns a value into the number to pack (a tuple if there is
+       more than one code); decode takes the numbers back to a value.
+
+       A type with escape = (low, high, dump, load) can have values that
+       don't fit its (single) code: encode gives them a number outside
+       low..high (exclusive). Such a value is written as text (dump) after
+       the header, which holds low in its place, and load reads it back.
+       A list of the type starts with the code its items are packed with,
+       or "x" if they are written as text.
+    """
+
+    def __init__(self, codes, encode=None, decode=None, escape=None):
+        self.codes = codes
+        self.encode = encode
+        self.decode = decode
+        self.escape = escape
+
+    def _format(self, count, codes):
+        if len(codes) == 1:
+            return f"<{count}{codes}"
+        return "<" + codes * count
+
+    def _code(self, numbers):
+        """the code to pack a list's numbers with (see escape)"""
+        return self.codes
+
+    def write_many(self, out, values):
+        count = len(values)
+        numbers = values
+        if self.encode:
+            numbers = [self.encode(value) for value in values]
+        codes = self.codes
+        if self.escape:
+            low, high, dump, _ = self.escape
+            if not all(low < number < high for number in numbers):
+                out.append(_TEXT)
+                for value in values:
+                    _write_text(out, dump(value))
+                return
+            codes = self._code(numbers)
+            out.append(ord(codes))
+        elif len(codes) > 1:
+            numbers = [number for value in numbers for number in value]
+        out += struct.pack(self._format(count, codes), *numbers)
+
+    def read_many(self, view, offset, count):
+        codes = self.codes
+        if self.escape:
+            code, offset = view[offset], offset + 1
+            if code == _TEXT:
+                load = self.escape[3]
+                values = []
+                for _ in range(count):
+                    text, offset = _read_text(view, offset)
+                    values.append(load(text))
+                return values, offset
+            codes = chr(code)
+        packed = struct.Struct(self._format(count, codes))
+        numbers = packed.unpack_from(view, offset)
+        offset += packed.size
+        if not self.decode:
+            return list(numbers), offset
+        if len(codes) == 1:
+            return list(map(self.decode, numbers)), offset
+        width = len(codes)
+        return [
+            self.decode(*numbers[index:index + width])
+            for index in range(0, len(numbers), width)
+        ], offset
+
+
+class _Integer(_Fixed):
+    """a whole number (or one scaled by encode): "q", or text if it is
+       too big for it; a list is packed with the narrowest code that fits
+       its numbers
+    """
+
+    _CODES = ((-2 ** 7, 2 ** 7, "b"), (-2 ** 15, 2 ** 15, "h"),
+              (-2 ** 31, 2 ** 31, "i"))
+
+    def __init__(self, encode=None, decode=None, dump=str, load=int):
+        super().__init__(
+            "q", encode, decode, (-2 ** 63, 2 ** 63, dump, load))
+
+    def _code(self, numbers):
+        if numbers:
+            low, high = min(numbers), max(numbers)
+            for start, stop, code in self._CODES:
+                if start <= low and high < stop:
+                    return code
+        return "q"
+
+
+class _Variable:
+    """a type written (and read) one value at a time"""
+
+    def __init__(self, write, read):
+        self.write = write
+        self.read = read
+
+    def write_many(self, out, values):
+        write = self.write
+        for value in values:
+            write(out, value)
+
+    def read_many(self, view, offset, count):
+        read = self.read
+        values = []
+        for _ in range(count):
+            value, offset = read(view, offset)
+            values.append(value)
+        return values, offset
+
+
+def _nested(cls):
+    def write(out, value):
+        if value.__class__ is not cls:  # its fields can't be read back
+            raise ValueError(
+                f"can't encode a {value.__class__.__qualname__} value as"
+                f" a {cls.__qualname__}")
+        cls._encode(value, out)
+
+    def read(view, offset):
+        return cls._decode(view, offset)
+    return _Variable(write, read)
+
+
+def _json(field_type, coerce):
+    """values as JSON text (coerced when read, unless a Json type)"""
+    encode = json_encoder(field_type)
+    loads = json.loads
+
+    def write(out, value):
+        _write_text(out, encode(value))
+
+    if isinstance(field_type, types.Json):
+        def read(view, offset):
+            text, offset = _read_text(view, offset)
+            return loads(text), offset
+    else:
+        def read(view, offset):
+            text, offset = _read_text(view, offset)
+            return coerce(loads(text)), offset
+    return _Variable(write, read)
+
+
+def _list(spec):
+    element = _codec(spec.type, spec.type)
+    construct = spec.construct
+
+    def write(out, value):
+        items = value.store
+        _write_size(out, len(items))
+        element.write_many(out, items)
+
+    def read(view, offset):
+        count, offset = _read_size(view, offset)
+        items, offset = element.read_many(view, offset, count)
+        return construct(items), offset
+    return _Variable(write, read)
+
+
+def _decimal(precision):
+    new = types.decimal.Decimal
+
+    def encode(value):
+        return int(value.scaleb(precision))
+
+    def decode(number):
+        return new(number).scaleb(-precision)
+    return _Integer(encode, decode, load=new)
+
+
+def _date():
+    """ISODate: the ordinal, or the text of a datetime (which the field
+       accepts as a date)
+    """
+    date, datetime = types.date, types.datetime
+
+    def encode(value):
+        return value.toordinal() if value.__class__ is date else 0
+
+    def dump(value):
+        return value.isoformat()
+
+    def load(text):
+        return (datetime if len(text) > 10 else date).fromisoformat(text)
+    return _Fixed("i", encode, date.fromordinal, (0, 2 ** 31, dump, load))
+
+
+def _datetime():
+    from datetime import datetime, timedelta, timezone
+
+    start = datetime.min
+    second, microsecond = timedelta(seconds=1), timedelta(microseconds=1)
+    zones = {}
+
+    def encode(value):
+        offset = value.utcoffset()
+        if offset is None:
+            seconds = _NAIVE
+        else:
+            seconds, rest = divmod(offset, second)
+            if rest:
+                raise ValueError(f"UTC offset is not whole seconds: {value}")
+        return (value.replace(tzinfo=None) - start) // microsecond, seconds
+
+    def decode(micros, seconds):
+        value = start + timedelta(microseconds=micros)
+        if seconds == _NAIVE:
+            return value
+        if (zone := zones.get(seconds)) is None:
+            zone = zones[seconds] = timezone(timedelta(seconds=seconds))
+        return value.replace(tzinfo=zone)
+    return _Fixed("qi", encode, decode)
+
+
+def _set(field_type, coerce):
+    valid = field_type.valid
+    try:
+        index = {value: number for number, value in enumerate(valid)}
+    except TypeError:  # unhashable values
+        return _json(field_type, coerce)
+    if len(index) != len(valid) or len(valid) > 65536:
+        return _json(field_type, coerce)
+    code = "B" if len(valid) <= 256 else "H"
+    return _Fixed(code, index.__getitem__, valid.__getitem__)
+
+
+def _codec(field_type, coerce):
+    """the _Fixed or _Variable for a field (or List item) type"""
+    from typedclass.list import List
+
+    if isinstance(field_type, type):  # a nested Typed
+        return _nested(field_type)
+    if isinstance(field_type, List):
+        return _list(field_type)
+    if isinstance(field_type, types.Boolean):
+        return _Fixed("?")
+    if isinstance(field_type, types.Integer):
+        return _Integer()
+    if isinstance(field_type, types.Decimal):
+        return _decimal(field_type.precision)
+    if isinstance(field_type, types.ISODateTime):
+        return _datetime()
+    if isinstance(field_type, types.ISODate):
+        return _date()
+    if isinstance(field_type, types.Set):
+        return _set(field_type, coerce)
+    if isinstance(field_type, types.String):
+        return _Variable(_write_text, _read_text)
+    return _json(field_type, coerce)
+
+
+def _layout(cls):
+    """return the header format and a codec per field"""
+    codecs = [_codec(field.type, field.coerce) for field in cls._f]
+    width = max(1, (len(cls._f) + 7) // 8)
+    mask = _MASKS.get(width, f"{width}s")
+    codes = "".join(
+        codec.codes for codec in codecs if isinstance(codec, _Fixed))
+    return struct.Struct(f"<{mask}{mask}{codes}"), codecs
+
+
+def _mask(name, cls):
+    """the expression for mask name as packed in the header"""
+    width = (len(cls._f) + 7) // 8
+    if width > 8:
+        return f"{name}.to_bytes({width}, 'little')"
+    return name
+
+
+def compile_encode(cls):
+    """build an _encode(self, out) that appends self's bytes to out"""
+    header, codecs = _layout(cls)
+    namespace = dict(
+        _UNSET=_UNSET, _header=header, _dumps=_dumps,
+        _write_text=_write_text)
+    src = _Source()
+    src(0, "def _encode(self, out):")
+    if cls._c:
+        def read(name):
+            return f"getattr(self, {src.const(name)}, _UNSET)"
+    else:
+        src(1, "v = self._v")
+
+        def read(name):
+            return f"v.get({src.const(name)}, _UNSET)"
+    src(1, "present = null = 0")
+    escapes = any(getattr(codec, "escape", None) for codec in codecs)
+    if escapes:
+        src(1, "escaped = ()")
+    numbers, variable = [], []
+    for index, (field, codec) in enumerate(zip(cls._f, codecs)):
+        bit = 1 << index
+        src(1, f"value = {read(field.name)}")
+        if isinstance(codec, _Fixed):
+            names = [f"f{index}_{n}" for n in range(len(codec.codes))]
+            numbers.extend(names)
+            zero = " = ".join(names) + " = 0"
+            src(1, "if value is _UNSET:")
+            src(2, zero)
+            src(1, "elif value is None:")
+            src(2, f"null |= {bit}")
+            src(2, zero)
+            src(1, "else:")
+            src(2, f"present |= {bit}")
+            if codec.encode:
+                namespace[f"_e{index}"] = codec.encode
+                src(2, f"{', '.join(names)} = _e{index}(value)")
+            else:
+                src(2, f"{names[0]} = value")
+            if codec.escape:
+                low, high, dump, _ = codec.escape
+                namespace[f"_x{index}"] = dump
+                src(2, f"if not {low} < {names[0]} < {high}:")
+                src(3, f"escaped += (_x{index}(value),)")
+                src(3, f"{names[0]} = {low}")
+        else:
+            variable.append((index, bit))
+            namespace[f"_w{index}"] = codec.write
+            src(1, f"x{index} = value")
+            src(1, "if value is None:")
+            src(2, f"null |= {bit}")
+            src(1, "elif value is not _UNSET:")
+            src(2, f"present |= {bit}")
+    values = [_mask("present", cls), _mask("null", cls)] + numbers
+    src(1, f"out += _header.pack({', '.join(values)})")
+    if escapes:
+        src(1, "for text in escaped:")
+        src(2, "_write_text(out, text)")
+    for index, bit in variable:
+        src(1, f"if present & {bit}:")
+        src(2, f"_w{index}(out, x{index})")
+    if cls._k:
+        src(1, f"value = {read(cls._k)}")
+        src(1, "_write_text(out, _dumps({} if value is _UNSET else value))")
+    return _function(cls, src, namespace, "_encode")
+
+
+def compile_decode(cls):
+    """build a _decode(view, offset) that returns (instance, offset)"""
+    header, codecs = _layout(cls)
+    namespace = dict(
+        _cls=cls, _header=header, _size=header.size,
+        _read_text=_read_text, _loads=json.loads,
+        _from_bytes=int.from_bytes)
+    src = _Source()
+    src(0, "def _decode(view, offset):")
+    numbers, variable = [], []
+    for index, codec in enumerate(codecs):
+        if isinstance(codec, _Fixed):
+            numbers.extend(f"f{index}_{n}" for n in range(len(codec.codes)))
+    names = ["present", "null"] + numbers
+    src(1, f"{', '.join(names)}, = _header.unpack_from(view, offset)")
+    src(1, "offset += _size")
+    if (len(cls._f) + 7) // 8 > 8:
+        src(1, "present = _from_bytes(present, 'little')")
+        src(1, "null = _from_bytes(null, 'little')")
+    src(1, "v = {}")
+    for index, (field, codec) in enumerate(zip(cls._f, codecs)):
+        bit = 1 << index
+        name = src.const(field.name)
+        if not isinstance(codec, _Fixed):
+            variable.append((index, name, bit))
+            continue
+        names = [f"f{index}_{n}" for n in range(len(codec.codes))]
+        src(1, f"if present & {bit}:")
+        indent = 2
+        if codec.escape:
+            namespace[f"_l{index}"] = codec.escape[3]
+            src(2, f"if {names[0]} == {codec.escape[0]}:")
+            src(3, "text, offset = _read_text(view, offset)")
+            src(3, f"v[{name}] = _l{index}(text)")
+            src(2, "else:")
+            indent = 3
+        if codec.decode:
+            namespace[f"_d{index}"] = codec.decode
+            src(indent, f"v[{name}] = _d{index}({', '.join(names)})")
+        else:
+            src(indent, f"v[{name}] = {names[0]}")
+        src(1, f"elif null & {bit}:")
+        src(2, f"v[{name}] = None")
+    for index, name, bit in variable:
+        namespace[f"_r{index}"] = codecs[index].read
+        src(1, f"if present & {bit}:")
+        src(2, f"v[{name}], offset = _r{index}(view, offset)")
+        src(1, f"elif null & {bit}:")
+        src(2, f"v[{name}] = None")
+    if cls._k:
+        src(1, "text, offset = _read_text(view, offset)")
+        src(1, f"v[{src.const(cls._k)}] = _loads(text)")
+    src(1, "new = _cls.__new__(_cls)")
+    if cls._c:
+        src(1, "new._restore(v)")
+    else:
+        src(1, "new.__dict__['_v'] = v")
+        if cls._t:
+            src(1, "new._watch()")
+    src(1, "return new, offset")
+    return _function(cls, src, namespace, "_decode")
+
+
+def to_bytes(instance):
+    out = bytearray()
+    try:
+        instance.__class__._encode(instance, out)
+    except struct.error as err:
+        raise ValueError(f"can't encode a value: {err}") from err
+    return bytes(out)
+
+
+def from_bytes(cls, data):
+    view = memoryview(data)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    try:
+        instance, end = cls._decode(view, 0)
+    except (struct.error, IndexError) as err:
+        raise ValueError(f"truncated data: {err}") from err
+    if end != len(view):
+        raise ValueError(f"{len(view) - end} extra bytes after the value")
+    return instance
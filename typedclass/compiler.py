@@ -0,0 +1,630 @@
+"""Code generation for per-class Typed operations
+
+   The generic Typed machinery has to discover, for every call, which
+   fields exist, which are required, which have defaults and which have
+   hooks. All of that is fixed once a class is created, so the functions
+   built here unroll those decisions into straight-line code for exactly
+   one field set.
+"""
+from _thread import RLock  # (the threading module is slow to import)
+from collections.abc import Mapping
+from functools import lru_cache
+import json
+
+from typedclass.field import Field
+
+
+_UNSET = object()
+
+
+def _merge(fields, args, kwargs):
+    """convert positional args to kwargs (in field order)"""
+    from typedclass.typed import ExtraAttributeError, DuplicateAttributeError
+
+    if len(args) > len(fields):
+        raise ExtraAttributeError(args[len(fields):])
+    for value, field in zip(args, fields):
+        if field.name in kwargs:
+            raise DuplicateAttributeError(field.name)
+        kwargs[field.name] = value
+
+
+def _undefined(kwargs, names):
+    for name in kwargs:
+        if name not in names:
+            raise AttributeError(f"undefined field name '{name}'")
+
+
+class _Source:
+    """accumulate indented lines of python source
+
+       const(text) returns a placeholder literal for a string that is
+       specific to a class (a field name, say); _function puts the text
+       back into the compiled code. Classes whose fields are laid out the
+       same way (names aside) so generate the same source, and share one
+       compilation.
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.consts = {}
+
+    def __call__(self, indent, line):
+        self.lines.append("    " * indent + line)
+
+    def const(self, text):
+        if (placeholder := self.consts.get(text)) is None:
+            placeholder = self.consts[text] = f"\0{len(self.consts)}"
+        return repr(placeholder)
+
+    def __str__(self):
+        return "\n".join(self.lines) + "\n"
+
+
+def _set_value(src, indent, index, field, store, var="value"):
+    """emit the code that validates var ("value") and stores it
+
+       store(expression) returns the statement that saves expression as
+       the field's value.
+    """
+    if field.default is None:
+        src(indent, f"if {var} is None:")
+        src(indent + 1, store("None"))
+    else:
+        src(indent, f"if {var} is None:")
+        src(indent + 1, f"raise _NoneValueError({src.const(field.name)})")
+    src(indent, "else:")
+    src(indent + 1, "try:")
+    if field.is_nested:
+        src(indent + 2, f"if {var}.__class__ is _t{index}:")
+        src(indent + 3, "pass")
+        src(indent + 2, f"elif isinstance({var}, dict):")
+        src(indent + 3, f"{var} = _t{index}(**{var})")
+        src(indent + 2, f"elif not isinstance({var}, _t{index}):")
+        src(indent + 3, f"raise _InvalidNestedTyped(_t{index})")
+        src(indent + 2, store(var))
+    else:
+        src(indent + 2, store(f"_c{index}({var})"))
+    src(indent + 1, "except ValueError as err:")
+    src(indent + 2, f"_annotate(_f{index}, {var}, err)")
+    src(indent + 2, "raise")
+    if field._after_init:
+        src(indent, f"_f{index}.after_init(self)")
+
+
+def _namespace(cls):
+    from typedclass import typed
+
+    return dict(
+        _cls=cls,
+        _fields=cls._f,
+        _names=frozenset(field.name for field in cls._f),
+        _merge=_merge,
+        _undefined=_undefined,
+        _annotate=typed._annotate,
+        _UNSET=_UNSET,
+        _NoneValueError=typed.NoneValueError,
+        _RequiredAttributeError=typed.RequiredAttributeError,
+        _InvalidNestedTyped=typed.InvalidNestedTyped,
+    )
+
+
+def _prologue(cls, src, namespace, source, extras, unpack=False):
+    """emit the code that sets up storage and the Kwargs dict
+
+       If extras is True, names in source that aren't fields are sent to
+       the Kwargs dict (or rejected); otherwise they are ignored. If unpack
+       is True, a dict under the Kwargs name is merged into (instead of
+       added to) the Kwargs dict. Returns
+       storer(index, name), which makes the store function for a field
+       (see _set_value).
+    """
+    if cls._c:  # compact: store values with the slot descriptors' __set__
+        def storer(index, name):
+            namespace[f"_s{index}"] = cls._m[name].__set__
+            return lambda expr: f"_s{index}(self, {expr})"
+    else:
+        src(1, "v = {}")
+        src(1, "self.__dict__['_v'] = v")
+
+        def storer(index, name):
+            return lambda expr: f"v[{src.const(name)}] = {expr}"
+
+    if cls._k:
+        store = storer("k", cls._k)
+        if extras:
+            src(1, f"if {source}.keys() <= _names:")
+            src(2, "bucket = {}")
+            src(1, "else:")
+            src(2, "bucket = {")
+            src(3, f"name: value for name, value in {source}.items()")
+            src(3, "if name not in _names")
+            src(2, "}")
+            if unpack:
+                kwargs = src.const(cls._k)
+                src(2, f"if isinstance(bucket.get({kwargs}), dict):")
+                src(3, f"bucket.update(bucket.pop({kwargs}))")
+            src(1, store("bucket"))
+        else:
+            src(1, store("{}"))
+    elif extras:
+        src(1, f"if not {source}.keys() <= _names:")
+        src(2, f"_undefined({source}, _names)")
+    return storer
+
+
+def _body(cls, src, namespace, source, extras):
+    """emit the code that sets every field from the mapping in source"""
+    from typedclass import typed
+
+    storer = _prologue(cls, src, namespace, source, extras)
+    for field in cls._f:
+        if field.is_required and field.default is Field.NO_DEFAULT:
+            name = src.const(field.name)
+            src(1, f"if {name} not in {source}:")
+            src(2, f"raise _RequiredAttributeError({name})")
+
+    for index, field in enumerate(cls._f):
+        namespace[f"_f{index}"] = field
+        namespace[f"_t{index}"] = field.type
+        namespace[f"_c{index}"] = field.coerce
+        if cls._p:
+            from typedclass import profile
+            namespace[f"_c{index}"] = profile.timed(cls, field, field.coerce)
+        store = storer(index, field.name)
+        if field.default is Field.NO_DEFAULT:
+            src(1, f"value = {source}.get({src.const(field.name)}, _UNSET)")
+            src(1, "if value is not _UNSET:")
+            _set_value(src, 2, index, field, store)
+        else:
+            namespace[f"_d{index}"] = field.default
+            src(1, f"value = {source}.get({src.const(field.name)}, _d{index})")
+            _set_value(src, 1, index, field, store)
+
+    if cls._t:  # tracked: hear about changes to nested values
+        src(1, "self._watch()")
+    if cls.__after_init__ is not typed.Typed.__after_init__:
+        src(1, "self.__after_init__()")
+    if cls._t:  # changes made by hooks aren't changes to the instance
+        src(1, "self._clean()")
+
+
+@lru_cache(maxsize=1024)
+def _compile(source):
+    return compile(source, "<string>", "exec")
+
+
+_CodeType = type(_compile.__wrapped__.__code__)
+
+
+def _rebind(code, texts):
+    """code with its placeholder constants replaced by texts"""
+    consts = []
+    for const in code.co_consts:
+        if isinstance(const, str):
+            const = texts.get(const, const)
+        elif isinstance(const, _CodeType):
+            const = _rebind(const, texts)
+        consts.append(const)
+    return code.replace(co_consts=tuple(consts))
+
+
+def _function(cls, src, namespace, name):
+    """compile the function in src (with namespace as its globals)
+
+       Compiling is the costly part of building a class's functions, so
+       compiled source is cached: a class laid out like an earlier one
+       only has its placeholders (see _Source) replaced.
+    """
+    code = _compile(str(src))
+    if src.consts:
+        code = _rebind(code, {
+            placeholder: text for text, placeholder in src.consts.items()})
+    exec(code, namespace)
+    function = namespace[name]
+    function.__qualname__ = f"{cls.__qualname__}.{name}"
+    return function
+
+
+def compile_init(cls):
+    """build an __init__ specialized for the fields of cls
+
+       The generated function behaves exactly like the generic Typed
+       constructor: positional args are matched to fields in order,
+       undefined names are collected by Kwargs (or rejected), required
+       fields are checked before any value is set, defaults are applied,
+       and values are set (and after_init hooks run) in field order.
+    """
+    namespace = _namespace(cls)
+    src = _Source()
+    src(0, "def __init__(self, *args, **kwargs):")
+    src(1, "if self.__class__ is not _cls:")
+    src(2, "return self._init(*args, **kwargs)")  # subclass with own __init__
+    src(1, "if args:")
+    src(2, "_merge(_fields, args, kwargs)")
+    _body(cls, src, namespace, "kwargs", extras=True)
+    return _function(cls, src, namespace, "__init__")
+
+
+def _as_mapping(fields, data):
+    """treat a non-dict record as a mapping or as values in field order"""
+    if isinstance(data, Mapping):
+        return data
+    kwargs = {}
+    _merge(fields, data, kwargs)
+    return kwargs
+
+
+def compile_load(cls):
+    """build a _load(self, data) that initializes self from one record
+
+       This is the constructor's logic applied to a record (a mapping, or
+       a sequence of values in field order) without the keyword argument
+       packing; names in a mapping that aren't fields are ignored.
+    """
+    namespace = _namespace(cls)
+    namespace["_as_mapping"] = _as_mapping
+    src = _Source()
+    src(0, "def _load(self, data):")
+    src(1, "if data.__class__ is not dict:")
+    src(2, "data = _as_mapping(_fields, data)")
+    _body(cls, src, namespace, "data", extras=False)
+    return _function(cls, src, namespace, "_load")
+
+
+def compile_construct(cls):
+    """build a _construct(self, data) that trusts the values in data
+
+       Values are stored as they are (no coercion, None checks or hooks),
+       except that a dict for a nested Typed field and a list for a List
+       field are constructed the same way. Missing fields with a default
+       get the (validated) default, and other names go to Kwargs (a dict
+       under the Kwargs name, as produced by as_dict, is unpacked).
+    """
+    from typedclass.list import List, _ListBase
+
+    namespace = _namespace(cls)
+    namespace["_ListBase"] = _ListBase
+    src = _Source()
+    src(0, "def _construct(self, data):")
+    storer = _prologue(
+        cls, src, namespace, "data", extras=True, unpack=True)
+    for index, field in enumerate(cls._f):
+        namespace[f"_f{index}"] = field
+        namespace[f"_t{index}"] = field.type
+        store = storer(index, field.name)
+        src(1, f"value = data.get({src.const(field.name)}, _UNSET)")
+        src(1, "if value is not _UNSET:")
+        if field.is_nested:
+            src(2, "if value.__class__ is dict:")
+            src(3, f"value = _t{index}.construct(**value)")
+        elif isinstance(field.type, List):
+            src(2, "if value is not None and"
+                   " not isinstance(value, _ListBase):")
+            src(3, f"value = _t{index}.construct(value)")
+        src(2, store("value"))
+        if field.default is not Field.NO_DEFAULT:
+            namespace[f"_d{index}"] = field.default
+            src(1, "else:")
+            src(2, f"self._setfield(_f{index}, _d{index})")
+    if cls._t:
+        src(1, "self._watch()")
+    return _function(cls, src, namespace, "_construct")
+
+
+def compile_copy(cls):
+    """build a _copy(self) that returns an unvalidated copy of self
+
+       The values are stored in the copy as they are, except that a List
+       value is replaced by a copy that shares its items until one of the
+       two lists is changed, and the Kwargs dict is copied. Nested Typed
+       values are shared.
+    """
+    from typedclass.list import List
+
+    namespace = dict(_UNSET=_UNSET)
+    src = _Source()
+    src(0, "def _copy(self):")
+    src(1, "new = self.__class__.__new__(self.__class__)")
+    lists = [
+        field.name for field in cls._f if isinstance(field.type, List)]
+    if cls._c:
+        names = [field.name for field in cls._f]
+        if cls._k:
+            names.append(cls._k)
+        for index, name in enumerate(names):
+            namespace[f"_s{index}"] = cls._m[name].__set__
+            src(1, f"value = getattr(self, {src.const(name)}, _UNSET)")
+            src(1, "if value is not _UNSET:")
+            if name in lists:
+                src(2, "if value is not None:")
+                src(3, "value = value._share()")
+            elif name == cls._k:
+                src(2, "value = dict(value)")
+            src(2, f"_s{index}(new, value)")
+    else:
+        src(1, "v = self._v.copy()")
+        for name in lists + ([cls._k] if cls._k else []):
+            src(1, f"value = v.get({src.const(name)})")
+            src(1, "if value is not None:")
+            if name == cls._k:
+                src(2, f"v[{src.const(name)}] = dict(value)")
+            else:
+                src(2, f"v[{src.const(name)}] = value._share()")
+        src(1, "new.__dict__['_v'] = v")
+    src(1, "return new")
+    return _function(cls, src, namespace, "_copy")
+
+
+def compile_encode(cls):
+    """build the _encode of cls (see typedclass.codec, which is imported
+       when the first class is encoded)
+    """
+    from typedclass import codec
+
+    return codec.compile_encode(cls)
+
+
+def compile_decode(cls):
+    """build the _decode of cls (see compile_encode)"""
+    from typedclass import codec
+
+    return codec.compile_decode(cls)
+
+
+class _Name:
+    """a default value that prints as a name (for building signatures)"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+def _serializer(field):
+    """the conversion as_dict(serialize=True) applies to a field's value"""
+    if field.is_nested:
+        convert = field.type.as_dict
+    elif not (convert := getattr(field.type, "serialize", None)):
+        return None
+    return lambda value: convert(value) if value else value
+
+
+def compile_arguments(cls, func, serialize=False):
+    """build a wrapper that validates func's arguments with cls's fields
+
+       cls is a DynamicTyped class. The wrapper has func's parameters (with
+       a marker as every default), so Python binds the arguments; each
+       parameter with a Field is then checked and coerced as the Typed
+       constructor would do it, a missing one taking the Field's default,
+       then func's default (a required Field has to be passed). A Field
+       that isn't a parameter is taken from, and returned to, func's
+       **kwargs; a Kwargs names func's **kwargs or the parameter that
+       receives the dict of undefined names. The values are passed to func
+       as they are (or serialized, like as_dict), with no instance or dict
+       in between. The wrapper of a coroutine function is a coroutine
+       function.
+    """
+    import inspect
+
+    namespace = _namespace(cls)
+    namespace["_func"] = func
+    fields = {field.name: (index, field) for index, field in enumerate(cls._f)}
+    params = list(inspect.signature(func).parameters.values())
+    names = {param.name for param in params}
+    variadic = {
+        param.kind: param.name for param in params
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+    }
+    var_keyword = variadic.get(inspect.Parameter.VAR_KEYWORD)
+    for name in variadic.values():
+        if name in fields:
+            raise TypeError(f"variable argument '{name}' can't be a Field")
+    for name in fields:
+        if name not in names and not var_keyword:
+            raise TypeError(f"field '{name}' is not a parameter")
+    if cls._k and cls._k not in names:
+        raise TypeError(f"Kwargs '{cls._k}' is not a parameter")
+    if cls._k and cls._k != var_keyword:
+        if var_keyword:
+            raise TypeError(f"Kwargs '{cls._k}' and **{var_keyword}")
+        var_keyword = None  # the bucket parameter collects the extras
+
+    src = _Source()
+    wrapper, call = [], []
+
+    def field_value(name, var, target, unset):
+        index, field = fields[name]
+        namespace[f"_f{index}"] = field
+        namespace[f"_t{index}"] = field.type
+        namespace[f"_c{index}"] = field.coerce
+        if serialize and (convert := _serializer(field)):
+            namespace[f"_z{index}"] = convert
+
+            def store(expr):
+                return f"{target} = _z{index}({expr})"
+        else:
+            def store(expr):
+                return f"{target} = {expr}"
+        if field.default is not Field.NO_DEFAULT:
+            namespace[f"_d{index}"] = field.default
+            src(1, f"if {var} is _UNSET:")
+            src(2, f"{var} = _d{index}")
+            _set_value(src, 1, index, field, store, var)
+            return
+        src(1, f"if {var} is _UNSET:")
+        if field.is_required or unset is None:
+            src(2, f"raise _RequiredAttributeError({name!r})")
+        else:
+            src(2, unset)
+        src(1, "else:")
+        _set_value(src, 2, index, field, store, var)
+
+    for position, param in enumerate(params):
+        name, kind = param.name, param.kind
+        if kind is param.VAR_POSITIONAL:
+            call.append(f"*{name}")
+        elif kind is param.VAR_KEYWORD:
+            call.append(f"**{name}")
+        elif kind is param.KEYWORD_ONLY:
+            call.append(f"{name}={name}")
+        else:
+            call.append(name)
+        if kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            wrapper.append(param.replace(annotation=param.empty))
+            continue
+        if name == cls._k:
+            continue  # made the wrapper's **kwargs (below)
+
+        if param.default is not param.empty:
+            namespace[f"_p{position}"] = param.default
+            unset = f"{name} = _p{position}"
+        else:
+            unset = None
+        if name in fields:
+            default = "_UNSET"
+            field_value(name, name, name, unset)
+        elif unset:
+            default = f"_p{position}"
+        else:
+            default = "_UNSET"
+            message = f"{func.__qualname__}() missing argument: '{name}'"
+            src(1, f"if {name} is _UNSET:")
+            src(2, f"raise TypeError({message!r})")
+        wrapper.append(param.replace(
+            default=_Name(default), annotation=param.empty))
+
+    if cls._k and cls._k != var_keyword:
+        wrapper.append(
+            inspect.Parameter(cls._k, inspect.Parameter.VAR_KEYWORD))
+    var = "value"
+    while var in names:
+        var = "_" + var
+    for name in fields:
+        if name not in names:  # passed through func's **kwargs
+            src(1, f"{var} = {var_keyword}.pop({name!r}, _UNSET)")
+            field_value(name, var, f"{var_keyword}[{name!r}]", "pass")
+
+    signature = inspect.Signature(wrapper)
+    if inspect.iscoroutinefunction(func):  # check when awaited, not called
+        src.lines.insert(0, f"async def _arguments{signature}:")
+        src(1, f"return await _func({', '.join(call)})")
+    else:
+        src.lines.insert(0, f"def _arguments{signature}:")
+        src(1, f"return _func({', '.join(call)})")
+    return _function(cls, src, namespace, "_arguments")
+
+
+COMPILE_AFTER = 20  # uses of a generic function before it is compiled
+
+
+class Lazy:
+    """a per-class function compiled on first use
+
+       The metaclass puts a Lazy in every class's namespace; the first
+       lookup compiles the function for that class and replaces the Lazy
+       with it, so later lookups are ordinary method lookups. The same
+       Lazy can be stored under more than one name (as "_init" and
+       "__init__" are); every name that holds it gets the function.
+       Compilation is serialized by a lock, so each function is compiled
+       once however many threads ask for it.
+
+       If generic is given, it is used instead for the first
+       COMPILE_AFTER lookups (unless the class is profiled), so that a
+       class that is hardly used is never compiled.
+    """
+
+    def __init__(self, name, compile, generic=None):
+        self.name = name
+        self.compile = compile
+        self.generic = generic
+        self.uses = 0
+
+    def __get__(self, instance, owner):
+        if self.generic and self.uses < COMPILE_AFTER and not owner._p:
+            self.uses += 1  # (a lost update only delays compilation)
+            return self.generic.__get__(instance, owner)
+        with _compile_lock:  # compile once, even if threads race
+            # find the Lazy's class (owner can be a subclass: super())
+            for cls in owner.__mro__:
+                names = [
+                    name for name, value in cls.__dict__.items()
+                    if value is self]
+                if names:
+                    break
+            else:  # another thread compiled it while this one waited
+                return getattr(
+                    owner if instance is None else instance, self.name)
+            function = self.compile(cls)
+            for name in names:
+                setattr(cls, name, function)
+        return function.__get__(instance, owner)
+
+
+_compile_lock = RLock()
+
+
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def json_encoder(field_type):
+    """return a function that converts a value to JSON text
+
+       A type can supply its own "to_json" method; otherwise the value
+       is passed through the type's "serialize" method (if any) and
+       encoded with the json module.
+    """
+    if to_json := getattr(field_type, "to_json", None):
+        return to_json
+    if serializer := getattr(field_type, "serialize", None):
+        return lambda value: _dumps(serializer(value))
+    return _dumps
+
+
+def compile_json(cls):
+    """build a _json(self, out) that appends cls's JSON text to out
+
+       Nested Typed and List values write themselves into the same list,
+       so the whole object graph is encoded in one pass; the caller joins
+       the pieces.
+    """
+    from typedclass.list import List
+
+    namespace = dict(_UNSET=_UNSET, _dumps=_dumps)
+    src = _Source()
+    src(0, "def _json(self, out):")
+    src(1, "start = len(out)")
+    if cls._c:
+        def read(name):
+            return f"getattr(self, {src.const(name)}, _UNSET)"
+    else:
+        src(1, "v = self._v")
+
+        def read(name):
+            return f"v.get({src.const(name)}, _UNSET)"
+
+    # every member is written with a leading comma; the first one is
+    # replaced with the opening brace once the members are known
+    if cls._k:
+        src(1, f"out.append({src.const(',' + _dumps(cls._k) + ':')})")
+        src(1, f"out.append(_dumps({read(cls._k)}))")
+    for index, field in enumerate(cls._f):
+        src(1, f"value = {read(field.name)}")
+        src(1, "if value is not _UNSET:")
+        src(2, f"out.append({src.const(',' + _dumps(field.name) + ':')})")
+        src(2, "if value is None:")
+        src(3, "out.append('null')")
+        if field.is_nested or isinstance(field.type, List):
+            src(2, "else:")
+            src(3, "value._json(out)")
+        else:
+            namespace[f"_e{index}"] = json_encoder(field.type)
+            src(2, "else:")
+            src(3, f"out.append(_e{index}(value))")
+    src(1, "if len(out) == start:")
+    src(2, "out.append('{}')")
+    src(1, "else:")
+    src(2, "out[start] = '{' + out[start][1:]")
+    src(2, "out.append('}')")
+    return _function(cls, src, namespace, "_json")
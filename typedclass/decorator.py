@@ -1,33 +1,162 @@
+from collections import OrderedDict, namedtuple
+import copyreg
 from functools import wraps
+import inspect
+import threading
+from types import BuiltinFunctionType, FunctionType, MethodType
 
 from typedclass import Typed, Field, Kwargs
+from typedclass.compiler import compile_arguments
+
+
+INTERN_SIZE = 256  # most DynamicTyped classes kept for reuse
+
+CacheInfo = namedtuple("CacheInfo", "hits misses maxsize currsize")
+
+_interned = OrderedDict()
+_intern_lock = threading.Lock()
+_intern_stats = [0, 0]  # hits, misses
+
+_FIELD_SETTINGS = (
+    "type", "default", "is_required", "is_readonly",
+    "_after_init", "_before_set", "_after_set", "cache",
+)
+
+
+class _Same:
+    """wraps an object so that it hashes and compares by identity"""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return id(self.value)
+
+    def __eq__(self, other):
+        return isinstance(other, _Same) and other.value is self.value
+
+
+def _freeze(value, spec=False):
+    """a hashable stand-in for value that compares by structure
+
+       Containers are compared by content; classes, functions and the
+       objects bound to methods by identity. Other objects are compared
+       by identity too, unless spec is set (for a Field type, like
+       String(max=5)): then their __dict__ is compared by content. The
+       result is not checked: hash() raises TypeError for an unhashable
+       value.
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(item, spec) for item in value)
+    if isinstance(value, dict):
+        return dict, tuple(
+            (_freeze(key, spec), _freeze(item, spec))
+            for key, item in value.items())
+    if isinstance(value, MethodType):
+        return MethodType, _Same(value.__self__), value.__func__
+    if isinstance(value, (type, FunctionType, BuiltinFunctionType)) or \
+            not hasattr(value, "__dict__"):
+        return type(value), value  # type keeps 1 and True apart
+    if spec:
+        return type(value), _freeze(vars(value), spec)
+    return type(value), _Same(value)
+
+
+def _fingerprint(field_kwargs):
+    """a key that is equal for structurally equal field specs"""
+    key = []
+    for name, value in field_kwargs.items():
+        if isinstance(value, Field):
+            settings = tuple(
+                _freeze(getattr(value, setting), setting == "type")
+                for setting in _FIELD_SETTINGS)
+        else:
+            settings = ()
+        key.append((name, type(value), settings))
+    return tuple(key)
+
+
+def _intern(key, build):
+    """return the class for key, calling build() if there isn't one"""
+    with _intern_lock:
+        if (cls := _interned.get(key)) is not None:
+            _interned.move_to_end(key)
+            _intern_stats[0] += 1
+            return cls
+        _intern_stats[1] += 1
+    cls = build()
+    with _intern_lock:
+        cls = _interned.setdefault(key, cls)  # another thread may have won
+        _interned.move_to_end(key)
+        while len(_interned) > INTERN_SIZE:
+            _interned.popitem(last=False)
+    return cls
 
 
 def DynamicTyped(**field_kwargs):
-    """build a Typed class from a dict of name/Field kwargs"""
+    """build a Typed class from a dict of name/Field kwargs
 
-    class _Typed(Typed):
-        """dynamic typedclass"""
-        pass
+       The Fields are copied by the metaclass, so the caller's Field
+       objects are left unchanged (and can be shared). Classes are
+       interned: calls with structurally equal specs (the same names,
+       types, defaults, flags and hook functions) return the same class,
+       as long as it is one of the INTERN_SIZE most recently used. Specs
+       that can't be fingerprinted (unhashable settings, say) always build
+       a new class.
 
+       The classes can be pickled: they are rebuilt from their Field
+       specs (so the Field types and hooks have to be picklable).
+    """
+
+    attrs = {"__doc__": "dynamic typedclass"}
     for key, val in field_kwargs.items():
-        if isinstance(val, Field):
-            val.name = key
-            if isinstance(val.type, type):
-                if issubclass(val.type, Typed):
-                    val.is_nested = True
-                else:
-                    val.type = val.type()
-        elif isinstance(val, Kwargs) and getattr(_Typed, "_k"):
+        if isinstance(val, Kwargs) and any(
+                isinstance(attr, Kwargs) for attr in attrs.values()):
             raise Exception("duplicate Kwargs specified")
-        elif isinstance(val, Kwargs):
-            setattr(_Typed, "_k", key)
-        else:
+        elif not isinstance(val, (Field, Kwargs)):
             raise Exception(f"non-Field argument specified: {key}")
-        setattr(_Typed, key, val)
+        attrs[key] = val
+    attrs["_spec"] = tuple(field_kwargs.items())
 
-    _Typed._f = [field for field in field_kwargs.values() if isinstance(field, Field)]
-    return _Typed
+    def build():
+        return type(Typed)("_Typed", (Typed,), attrs)
+
+    try:
+        key = _fingerprint(field_kwargs)
+        hash(key)
+    except Exception:  # unhashable, or a type spec that can't be walked
+        return build()
+    return _intern(key, build)
+
+
+def _cache_info():
+    with _intern_lock:
+        return CacheInfo(*_intern_stats, INTERN_SIZE, len(_interned))
+
+
+def _cache_clear():
+    with _intern_lock:
+        _interned.clear()
+        _intern_stats[:] = [0, 0]
+
+
+DynamicTyped.cache_info = _cache_info
+DynamicTyped.cache_clear = _cache_clear
+
+
+def _dynamic(spec):
+    return DynamicTyped(**dict(spec))
+
+
+def _reduce_class(cls):
+    """pickle a DynamicTyped class by its spec (other classes by name)"""
+    if (spec := cls.__dict__.get("_spec")) is not None:
+        return _dynamic, (spec,)
+    return cls.__qualname__
+
+
+copyreg.pickle(type(Typed), _reduce_class)
 
 
 def typedfunction(**field_kwargs):
@@ -38,17 +167,45 @@ def typedfunction(**field_kwargs):
        function's parameters. By default the values passed to the function are
        not serialized; this can be changed by passing a True to the returned
        decorator before wrapping the function.
+
+       The checks are compiled for the function's signature (see
+       compiler.compile_arguments), so arguments are bound the way the
+       function binds them, including positional-only parameters and the
+       function's own defaults. A function whose signature can't be read,
+       or that doesn't fit its fields (or uses after_init hooks), is
+       checked by building a DynamicTyped instance for each call.
+
+       A coroutine function is wrapped in a coroutine function: the
+       arguments are checked when the call is awaited.
     """
 
     _typed = DynamicTyped(**field_kwargs)
 
-    def serializer(serialize=False):
-        def inner(func):
+    def generic(func, serialize):
+        if inspect.iscoroutinefunction(func):
             @wraps(func)
-            def _inner(*args, **kwargs):
+            async def _inner(*args, **kwargs):
                 normalized = _typed(*args, **kwargs)
-                return func(**normalized.as_dict(serialize=serialize))
+                return await func(**normalized.as_dict(serialize=serialize))
             return _inner
+
+        @wraps(func)
+        def _inner(*args, **kwargs):
+            normalized = _typed(*args, **kwargs)
+            return func(**normalized.as_dict(serialize=serialize))
+        return _inner
+
+    def compiled(func, serialize):
+        if any(field._after_init for field in _typed._f):
+            return None
+        try:
+            return wraps(func)(compile_arguments(_typed, func, serialize))
+        except (TypeError, ValueError):  # no signature, or a mismatch
+            return None
+
+    def serializer(serialize=False):
+        def inner(func):
+            return compiled(func, serialize) or generic(func, serialize)
         if serialize not in (True, False):  # serialize not specified
             func = serialize  # treat serialize as func
             serialize = False
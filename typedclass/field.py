@@ -1,8 +1,23 @@
-from typedclass.types import String
+from typedclass.types import String, _memoize
 
 
 class Field:
-    NO_DEFAULT = type("EMPTY", (), dict())
+    """typed attribute
+
+       A Field is a data descriptor: reading it from an instance returns
+       the instance's value (AttributeError if the value is not set), and
+       assignment runs the before_set hook, the read-only check, type
+       coercion and the after_set hook.
+
+       If cache is not 0, the results of type coercion are kept in an LRU
+       cache of that size, keyed by the raw value, so that repeated input
+       values skip validation; cache_info() returns the hits and misses.
+       Cached values are shared, so only types that produce immutable
+       values (String, Integer, Decimal, Set, ISODate...) can be cached:
+       a cache on a mutable type (List, Json) is a TypeError when the
+       class is created.
+    """
+    NO_DEFAULT = type("EMPTY", (), dict(__qualname__="Field.NO_DEFAULT"))
 
     def __init__(self,
                  field_type=String(),
@@ -12,6 +27,7 @@ class Field:
                  after_init=None,
                  before_set=None,
                  after_set=None,
+                 cache=0,
                  ):
 
         self.type = field_type
@@ -22,8 +38,78 @@ class Field:
         self._after_init = after_init
         self._before_set = before_set
         self._after_set = after_set
+        self.cache = cache
+        self.coerce = field_type
         self.name = None
 
+    def _clone(self):
+        """return a copy of the field, for a class to bind and own"""
+        field = object.__new__(self.__class__)
+        field.__dict__.update(self.__dict__)
+        return field
+
+    def _bind(self):
+        """set up coerce once the field's type is final"""
+        if not self.cache or self.is_nested:
+            self.coerce = self.type
+            return
+        if getattr(self.type, "is_mutable", False):
+            raise TypeError(f"field '{self.name}' cannot be cached: its"
+                            " values are mutable")
+        field_type = self.type
+        cached = _memoize(field_type, self.cache)
+
+        def coerce(value):
+            try:
+                return cached(value)
+            except TypeError:  # unhashable value
+                return field_type(value)
+        coerce.cache_info = cached.cache_info
+        coerce.cache_clear = cached.cache_clear
+        self.coerce = coerce
+
+    def cache_info(self):
+        if cache_info := getattr(self.coerce, "cache_info", None):
+            return cache_info()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["coerce"]  # may hold a cache; rebuilt when unpickled
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._bind()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return instance._v[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, instance, value):
+        value = self.before_set(instance, value)
+        if self.is_readonly:
+            from typedclass.typed import ReadOnlyFieldError
+            raise ReadOnlyFieldError(self.name)
+        watched = instance._w or getattr(instance, "_o", None)
+        old = instance._v.get(self.name) if watched else None
+        instance._setfield(self, value)
+        if watched:
+            instance._replaced(self, old)
+        self.after_set(instance)
+
+    def __delete__(self, instance):
+        if self.is_required:
+            raise AttributeError("cannot delete a required field")
+        watched = instance._w or getattr(instance, "_o", None)
+        old = instance._v.get(self.name) if watched else None
+        del instance._v[self.name]
+        if watched:
+            instance._replaced(self, old)
+
     def parse(self, instance, value):
         return self.type(instance, value)
 
@@ -0,0 +1,350 @@
+"""Columnar container for many records of one Typed class"""
+from array import array
+import sys
+
+from typedclass.list import List
+from typedclass.types import Boolean, Integer, Set, String
+
+
+_UNSET = object()
+
+# states of a value in an _ArrayColumn
+_MISSING, _NONE, _VALUE = 0, 1, 2
+
+
+class _ArrayColumn:
+    """values packed in an array (with a state per row)
+
+       encode and decode convert between field values and array items.
+       If a value doesn't fit the array (a very large Integer), the items
+       are moved to a list.
+    """
+
+    def __init__(self, typecode, encode=int, decode=None):
+        self.typecode = typecode
+        self.values = array(typecode)
+        self.state = bytearray()
+        self.encode = encode
+        self.decode = decode
+        self.missing = 0  # rows that are unset or None
+
+    def empty(self):
+        column = _ArrayColumn(self.typecode, self.encode, self.decode)
+        if isinstance(self.values, list):
+            column.values = []
+        return column
+
+    def append(self, value):
+        if value is _UNSET or value is None:
+            self.values.append(0)
+            self.state.append(_MISSING if value is _UNSET else _NONE)
+            self.missing += 1
+            return
+        value = self.encode(value)
+        try:
+            self.values.append(value)
+        except OverflowError:
+            self.values = list(self.values)
+            self.values.append(value)
+        self.state.append(_VALUE)
+
+    def get(self, index):
+        state = self.state[index]
+        if state == _VALUE:
+            value = self.values[index]
+            return self.decode(value) if self.decode else value
+        return None if state == _NONE else _UNSET
+
+    def set(self, index, value):
+        if self.state[index] != _VALUE:
+            self.missing -= 1
+        if value is _UNSET or value is None:
+            self.values[index] = 0
+            self.state[index] = _MISSING if value is _UNSET else _NONE
+            self.missing += 1
+            return
+        value = self.encode(value)
+        try:
+            self.values[index] = value
+        except OverflowError:
+            self.values = list(self.values)
+            self.values[index] = value
+        self.state[index] = _VALUE
+
+    def present(self):
+        """the (decoded) values of the rows that have one"""
+        if self.missing:
+            values = (
+                value for value, state in zip(self.values, self.state)
+                if state == _VALUE
+            )
+        else:
+            values = self.values
+        return map(self.decode, values) if self.decode else values
+
+    def __len__(self):
+        return len(self.state)
+
+
+class _ObjectColumn:
+    """values kept in a list; intern (if set) is applied to each value"""
+
+    def __init__(self, intern=None):
+        self.values = []
+        self.intern = intern
+
+    def empty(self):
+        return _ObjectColumn(self.intern)
+
+    def append(self, value):
+        if self.intern and isinstance(value, str):
+            value = self.intern(value)
+        self.values.append(value)
+
+    def get(self, index):
+        return self.values[index]
+
+    def set(self, index, value):
+        if self.intern and isinstance(value, str):
+            value = self.intern(value)
+        self.values[index] = value
+
+    def present(self):
+        return (
+            value for value in self.values
+            if value is not _UNSET and value is not None
+        )
+
+    def __len__(self):
+        return len(self.values)
+
+
+def _column(field):
+    """the column that best stores values of field"""
+    field_type = field.type
+    if field.is_nested or isinstance(field_type, List):
+        return _ObjectColumn()
+    if isinstance(field_type, Integer):
+        return _ArrayColumn("q")
+    if isinstance(field_type, Boolean):
+        return _ArrayColumn("b", decode=bool)
+    if isinstance(field_type, Set):
+        valid = field_type.valid
+        try:
+            codes = {value: code for code, value in enumerate(valid)}
+        except TypeError:  # unhashable choices
+            return _ObjectColumn()
+        typecode = "B" if len(valid) <= 256 else "I"
+        return _ArrayColumn(typecode, codes.__getitem__, valid.__getitem__)
+    if isinstance(field_type, String):
+        return _ObjectColumn(sys.intern)
+    return _ObjectColumn()
+
+
+class Row:
+    """view of one row of a TypedFrame
+
+       Fields read like the attributes of a Typed instance (AttributeError
+       if unset). Assignment is validated the way the Typed class would
+       validate it, including hooks and read-only checks. Its own helpers
+       are underscored (or, like as_dict, reserved by Typed) so that they
+       never hide a field.
+    """
+
+    __slots__ = ("_frame", "_index")
+
+    def __init__(self, frame, index):
+        object.__setattr__(self, "_frame", frame)
+        object.__setattr__(self, "_index", index)
+
+    def __getattr__(self, name):
+        try:
+            column = self._frame.columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        value = column.get(self._index)
+        if value is _UNSET:
+            raise AttributeError(name)
+        return value
+
+    def __setattr__(self, name, value):
+        instance = self._to_typed()
+        setattr(instance, name, value)
+        self._frame._set(self._index, instance)
+
+    def __eq__(self, other):
+        if isinstance(other, Row):
+            other = other._to_typed()
+        elif not isinstance(other, self._frame.cls):
+            return NotImplemented
+        return self._to_typed().as_dict() == other.as_dict()
+
+    def __repr__(self):
+        return f"Row({self._index}, {self.as_dict()})"
+
+    def _values(self):
+        """a dict of the row's set values"""
+        result = {}
+        for name, column in self._frame.columns.items():
+            value = column.get(self._index)
+            if value is not _UNSET:
+                result[name] = value
+        return result
+
+    def _to_typed(self):
+        """build a Typed instance from the row (without re-validation)"""
+        return self._frame.cls.construct(**self._values())
+
+    def as_dict(self, serialize=True):
+        return self._to_typed().as_dict(serialize)
+
+
+class TypedFrame:
+    """columnar storage for records of a Typed class
+
+       Each of the class's fields (see "_f") is stored as a column:
+       Integer and Boolean values in arrays, Set values as small integer
+       codes, and String values interned, so that a large collection
+       takes much less memory than a list of instances, and one field can
+       be scanned without touching the others.
+
+       Records are validated by the Typed class when they are added.
+       Indexing returns a Row (a view that reads like an instance), and
+       where/filter and the aggregate methods work on whole columns.
+    """
+
+    def __init__(self, cls, records=()):
+        self.cls = cls
+        self.columns = {field.name: _column(field) for field in cls._f}
+        if cls._k:
+            self.columns[cls._k] = _ObjectColumn()
+        self.extend(records)
+
+    def _empty(self):
+        frame = TypedFrame.__new__(TypedFrame)
+        frame.cls = self.cls
+        frame.columns = {
+            name: column.empty() for name, column in self.columns.items()
+        }
+        return frame
+
+    def append(self, record):
+        """add a Typed instance, or a dict (or values in field order) to
+           validate as one
+        """
+        self.extend((record,))
+
+    def extend(self, records):
+        """add Typed instances or records (see append)"""
+        cls = self.cls
+        for record in records:
+            if isinstance(record, dict):
+                record = cls(**record)
+            elif not isinstance(record, cls):
+                record = cls.from_records((record,))[0]
+            self._add(record)
+
+    def _add(self, instance):
+        values = instance._v
+        for name, column in self.columns.items():
+            column.append(values.get(name, _UNSET))
+
+    def _set(self, index, instance):
+        values = instance._v
+        for name, column in self.columns.items():
+            column.set(index, values.get(name, _UNSET))
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("frame index out of range")
+        return Row(self, index)
+
+    def __iter__(self):
+        return (Row(self, index) for index in range(len(self)))
+
+    def column(self, name):
+        """the values of one field (None where a row has no value)"""
+        column = self.columns[name]
+        return [
+            None if value is _UNSET else value
+            for value in map(column.get, range(len(column)))
+        ]
+
+    def take(self, indexes):
+        """a new frame with the rows at indexes (in that order)"""
+        frame = self._empty()
+        for name, column in self.columns.items():
+            target = frame.columns[name]
+            for index in indexes:
+                target.append(column.get(index))
+        return frame
+
+    def where(self, **conditions):
+        """a new frame with the rows that meet every condition
+
+           Each keyword names a field; its value is either a value the
+           field must equal, or a function of the field's value that
+           returns a true value (as with filter) for matching rows. Rows
+           without a value for a field never match a condition on that
+           field. Each condition scans only its own column.
+        """
+        indexes = range(len(self))
+        for name, condition in conditions.items():
+            get = self.columns[name].get
+            if callable(condition):
+                test = condition
+            else:
+                def test(value):
+                    return bool(value == condition)
+            indexes = [
+                index for index in indexes
+                if (value := get(index)) is not _UNSET and value is not None
+                and test(value)
+            ]
+        return self.take(indexes)
+
+    def filter(self, function):
+        """a new frame with the rows for which function(row) is true"""
+        return self.take([
+            index for index in range(len(self))
+            if function(Row(self, index))
+        ])
+
+    def to_typed(self):
+        """a list of Typed instances (built without re-validation)"""
+        return [row._to_typed() for row in self]
+
+    # --- aggregates (rows without a value are ignored)
+
+    def count(self, name):
+        return sum(1 for _ in self.columns[name].present())
+
+    def sum(self, name):
+        return sum(self.columns[name].present())
+
+    def min(self, name):
+        return min(self.columns[name].present(), default=None)
+
+    def max(self, name):
+        return max(self.columns[name].present(), default=None)
+
+    def mean(self, name):
+        total = count = 0
+        for value in self.columns[name].present():
+            total += value
+            count += 1
+        return total / count if count else None
+
+    def counts(self, name):
+        """a dict of the number of rows with each value of a field"""
+        result = {}
+        for value in self.columns[name].present():
+            result[value] = result.get(value, 0) + 1
+        return result
@@ -1,90 +1,223 @@
 """List Type"""
 import json
 
+from typedclass.compiler import json_encoder
 from typedclass.typed import Typed, InvalidNestedTyped
+from typedclass.typed import _add_owner, _disown, _notify, _MessageError
 
 
-class ListTooShortError(ValueError):
+class ListTooShortError(_MessageError, ValueError):
     def __init__(self, min):
         self.args = (f"length must be at least {min}",)
 
 
-class ListTooLongError(ValueError):
+class ListTooLongError(_MessageError, ValueError):
     def __init__(self, max):
         self.args = (f"length must be no more than {max}",)
 
 
-class ListDuplicateItemError(ValueError):
+class ListValueError(_MessageError, ValueError):
+    def __init__(self):
+        self.args = ("expecting a list",)
+
+
+class ListDuplicateItemError(_MessageError, ValueError):
     def __init__(self, value):
         self.args = (f"{value} already in list",)
 
 
+def _slice_length(key, store):
+    """the number of items in store[key] (without building the slice)"""
+    return len(range(*key.indices(len(store))))
+
+
+def _index(values):
+    """a set of values for membership tests (a list if unhashable)"""
+    try:
+        return set(values)
+    except TypeError:
+        return list(values)
+
+
+def _has(index, value):
+    """value in an index made by _index"""
+    try:
+        return value in index
+    except TypeError:  # unhashable, so not in a set
+        return False
+
+
+def _include(index, value):
+    """add value to an index made by _index (returning the index)"""
+    if isinstance(index, set):
+        try:
+            index.add(value)
+            return index
+        except TypeError:
+            index = list(index)
+    index.append(value)
+    return index
+
+
+class ListReadOnlyError(_MessageError, TypeError):
+    def __init__(self):
+        self.args = ("list is read-only",)
+
+
 class List:
-    """support a list as a Field type"""
-    def __init__(self, element_type, min=0, max=0, allow_dups=True):
+    """support a list as a Field type
+
+       The List is the spec shared by all of its values: each value (a
+       _List) refers to it rather than copying its settings, so it isn't
+       changed after __init__. With frozen=True, values are read-only
+       _FrozenLists backed by a tuple.
+    """
+    is_mutable = True
+
+    def __init__(self, element_type, min=0, max=0, allow_dups=True,
+                 frozen=False):
+        is_nested = False
+        if isinstance(element_type, type):
+            if issubclass(element_type, Typed):
+                is_nested = True
+            else:
+                element_type = element_type()
         self.type = element_type
-        self.is_nested = False
+        self.is_nested = is_nested
         self.min = min
         self.max = max
         self.allow_dups = allow_dups
+        self.frozen = frozen
+        self.encoder = json_encoder(element_type)
 
-        if isinstance(self.type, type):
-            if issubclass(self.type, Typed):
-                self.is_nested = True
-            else:
-                self.type = self.type()
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["encoder"]  # may be a lambda; rebuilt when unpickled
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.encoder = json_encoder(self.type)
 
     def __call__(self, value):
+        if self.frozen:
+            return _FrozenList(self, value)
         return _List(self, value)
 
+    def construct(self, value):
+        """build a _List from trusted (already validated) items"""
+        cls = _FrozenList if self.frozen else _List
+        result = cls.__new__(cls)
+        result.spec = self
+        if self.is_nested:
+            value = [
+                self.type.construct(**item) if item.__class__ is dict
+                else item for item in value
+            ]
+        result._fill(value)
+        return result
+
     def serialize(self, value):
         return value.serialize()
 
 
-class _List:
-    """List instance"""
-    def __init__(self, parent, value):
-        self.type = parent.type
-        self.is_nested = parent.is_nested
-        self.min = parent.min
-        self.max = parent.max
-        self.allow_dups = parent.allow_dups
+class _ListBase:
+    """state and read operations shared by _List and _FrozenList"""
+
+    __slots__ = ("spec", "store")
+
+    type = property(lambda self: self.spec.type)
+    is_nested = property(lambda self: self.spec.is_nested)
+    min = property(lambda self: self.spec.min)
+    max = property(lambda self: self.spec.max)
+    allow_dups = property(lambda self: self.spec.allow_dups)
+
+    def __init__(self, spec, value):
+        self.spec = spec
 
         if isinstance(value, str):
             value = json.loads(value)
-        if not isinstance(value, list):
-            raise Exception("expecting a list")
-        if self.min > 0:
-            if len(value) < self.min:
-                raise ListTooShortError(self.min)
-        if self.max > 0:
-            if len(value) > self.max:
-                raise ListTooLongError(self.max)
-
-        self.store = []
-        for item in value:
-            self.append(item)
+        if not isinstance(value, (list, tuple)):
+            raise ListValueError()
+        if spec.min > 0:
+            if len(value) < spec.min:
+                raise ListTooShortError(spec.min)
+        if spec.max > 0:
+            if len(value) > spec.max:
+                raise ListTooLongError(spec.max)
+
+        value = [self._parse(item) for item in value]
+        self._fill(())
+        self._check_unique(value)
+        self._fill(value)
+
+    def _contains(self, value):
+        return value in self.store
 
     def _parse(self, item):
-        if self.is_nested:
+        spec = self.spec
+        if spec.is_nested:
             if isinstance(item, dict):
-                item = self.type(**item)
-            elif not isinstance(item, self.type):
-                raise InvalidNestedTyped(self.type)
+                item = spec.type(**item)
+            elif not isinstance(item, spec.type):
+                raise InvalidNestedTyped(spec.type)
         else:
-            item = self.type(item)
+            item = spec.type(item)
         return item
 
+    def _check_unique(self, values, replaced=()):
+        """raise ListDuplicateItemError if one of the (parsed) values is
+           already in the list (not counting the replaced values) or is
+           repeated in values
+        """
+        if self.spec.allow_dups:
+            return
+        batch, replaced = _index(()), _index(replaced)
+        for value in values:
+            if _has(batch, value) or (
+                    self._contains(value) and not _has(replaced, value)):
+                raise ListDuplicateItemError(value)
+            batch = _include(batch, value)
+
+    def __copy__(self):
+        return self._share()
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+
+        return self.spec.construct(deepcopy(list(self.store), memo))
+
     def serialize(self):
-        if self.is_nested:
+        spec = self.spec
+        if spec.is_nested:
             value = [item.as_dict() for item in self.store]
-        elif serializer := getattr(self.type, "serialize", None):
+        elif serializer := getattr(spec.type, "serialize", None):
             value = [serializer(item) for item in self.store]
         else:
-            value = self.store.copy()
+            value = list(self.store)
         value = json.dumps(value)
         return value
 
+    def to_json(self):
+        """return the list as JSON text (not as a JSON string)"""
+        out = []
+        self._json(out)
+        return "".join(out)
+
+    def _json(self, out):
+        if self.spec.is_nested:
+            out.append("[")
+            for item in self.store:
+                item._json(out)
+                out.append(",")
+            if self.store:
+                out[-1] = "]"
+            else:
+                out.append("]")
+        else:
+            encoder = self.spec.encoder
+            out.append("[" + ",".join(map(encoder, self.store)) + "]")
+
     def __len__(self):
         return len(self.store)
 
@@ -94,30 +227,242 @@ class _List:
     def __getitem__(self, key):
         return self.store[key]
 
+    def index(self, *args, **kwargs):
+        return self.store.index(*args, **kwargs)
+
+
+class _FrozenList(_ListBase):
+    """read-only List instance"""
+
+    __slots__ = ()
+
+    def _fill(self, values):
+        self.store = tuple(values)
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            other = tuple(other)
+        return self.store == other
+
+    def _share(self):
+        return self  # immutable
+
+    def _own(self, owner, name):
+        pass  # it can't change, so there is nothing to tell its owners
+
+    def _read_only(self, *args, **kwargs):
+        raise ListReadOnlyError()
+
+    __setitem__ = __delitem__ = _read_only
+    append = extend = insert = pop = remove = clear = _read_only
+
+
+class _List(_ListBase):
+    """List instance
+
+       When duplicates aren't allowed, the "_seen" set indexes the stored
+       values so that uniqueness checks don't scan the list. If a value
+       turns out to be unhashable, the index is dropped (set to None) and
+       checks fall back to scanning.
+
+       "_o" holds the (cached) Typed instances to tell about changes (see
+       Typed._own). Nested items that a change adds are owned by them too,
+       and items that it removes no longer are; the other items aren't
+       looked at.
+
+       Copies (see _share) start out sharing the store (and "_seen") of
+       the original; "_shared" is set on both, and whichever is changed
+       first takes a private copy.
+    """
+
+    __slots__ = ("_seen", "_o", "_shared")
+
+    def _fill(self, values):
+        self.store = list(values)
+        self._seen = None
+        self._o = None
+        self._shared = False
+        if not self.spec.allow_dups:
+            self._remember_all(self.store)
+
+    def _own(self, owner, name):
+        self._o = _add_owner(self._o, owner, name)
+
+    def _share(self):
+        """return a copy of self that shares its store until a change"""
+        result = _List.__new__(_List)
+        result.spec = self.spec
+        result.store = self.store
+        result._seen = self._seen
+        result._o = None
+        result._shared = self._shared = True
+        return result
+
+    def _report(self, added=(), removed=()):
+        """tell the owners about a change that added and removed items"""
+        if self.spec.is_nested:
+            for ref, name in list(self._o):
+                if (owner := ref()) is None:
+                    continue
+                for item in removed:
+                    if item not in self.store:  # (not held twice)
+                        _disown(item, owner, name)
+                for item in added:
+                    item._own(owner, name)
+                    item._watch()
+        _notify(self._o)
+
+    def _unshare(self):
+        """take a private copy of a shared store before changing it"""
+        self.store = list(self.store)
+        if self._seen is not None:
+            self._seen = set(self._seen)
+        self._shared = False
+
+    def _contains(self, value):
+        if self._seen is not None:
+            try:
+                return value in self._seen
+            except TypeError:
+                self._seen = None
+        return value in self.store
+
+    def _remember(self, value):
+        if self._seen is not None:
+            try:
+                self._seen.add(value)
+            except TypeError:
+                self._seen = None
+
+    def _remember_all(self, values):
+        self._seen = set()
+        try:
+            self._seen.update(values)
+        except TypeError:
+            self._seen = None
+
+    def _forget(self, value):
+        if self._seen is not None:
+            self._seen.discard(value)
+
+    def _check_length(self, length):
+        if length < self.spec.min:
+            raise ListTooShortError(self.spec.min)
+        if self.spec.max > 0 and length > self.spec.max:
+            raise ListTooLongError(self.spec.max)
+
+    def _replace(self, key, values):
+        """assign parsed values to key (an index or slice)"""
+        removed = self.store[key]
+        if not isinstance(key, slice):
+            removed, values = [removed], [values]
+        self._check_unique(values, removed)
+        self.store[key] = values if isinstance(key, slice) else values[0]
+        if not self.spec.allow_dups:
+            for value in removed:
+                self._forget(value)
+            for value in values:
+                self._remember(value)
+        return removed, values
+
     def __setitem__(self, key, value):
-        value = self._parse(value)
-        if not self.allow_dups:
-            if self.store.count(value) != 0 and self.store[key] != value:
-                raise ListDuplicateItemError(value)
-        self.store[key] = value
+        if self._shared:
+            self._unshare()
+        if isinstance(key, slice):
+            value = list(value)
+            self._check_length(
+                len(self.store) - _slice_length(key, self.store) + len(value))
+            value = [self._parse(item) for item in value]
+        else:
+            value = self._parse(value)
+        removed, added = self._replace(key, value)
+        if self._o:
+            self._report(added, removed)
 
     def __delitem__(self, key):
-        if self.min > 0:
-            # preflight length check (key is an arbitrary slice)
-            temp = [0] * len(self.store)
-            del temp[key]
-            if len(temp) < self.min:
-                raise ListTooShortError(self.min)
+        if self._shared:
+            self._unshare()
+        if isinstance(key, slice):
+            count = _slice_length(key, self.store)
+        else:
+            self.store[key]  # IndexError before the length check
+            count = 1
+        if self.spec.min > 0:
+            self._check_length(len(self.store) - count)
+        removed = self.store[key]
+        if not isinstance(key, slice):
+            removed = [removed]
+        if self._seen is not None:
+            for value in removed:
+                self._forget(value)
         del self.store[key]
+        if self._o:
+            self._report(removed=removed)
 
     def append(self, value):
-        if self.max > 0:
-            if len(self.store) == self.max:
-                raise ListTooLongError(self.max)
+        if self._shared:
+            self._unshare()
+        if self.spec.max > 0:
+            if len(self.store) == self.spec.max:
+                raise ListTooLongError(self.spec.max)
         value = self._parse(value)
-        if not self.allow_dups and value in self.store:
-            raise ListDuplicateItemError(value)
+        if not self.spec.allow_dups:
+            if self._contains(value):
+                raise ListDuplicateItemError(value)
+            self._remember(value)
         self.store.append(value)
+        if self._o:
+            self._report((value,))
 
-    def index(self, *args, **kwargs):
-        return self.store.index(*args, **kwargs)
+    def extend(self, values):
+        if self._shared:
+            self._unshare()
+        values = list(values)
+        self._check_length(len(self.store) + len(values))
+        values = [self._parse(value) for value in values]
+        self._check_unique(values)
+        self.store.extend(values)
+        if not self.spec.allow_dups:
+            for value in values:
+                self._remember(value)
+        if self._o:
+            self._report(values)
+
+    def insert(self, index, value):
+        if self._shared:
+            self._unshare()
+        self._check_length(len(self.store) + 1)
+        value = self._parse(value)
+        self._check_unique((value,))
+        self.store.insert(index, value)
+        if not self.spec.allow_dups:
+            self._remember(value)
+        if self._o:
+            self._report((value,))
+
+    def pop(self, index=-1):
+        if self._shared:
+            self._unshare()
+        self.store[index]  # IndexError before the length check
+        self._check_length(len(self.store) - 1)
+        value = self.store.pop(index)
+        self._forget(value)
+        if self._o:
+            self._report(removed=(value,))
+        return value
+
+    def remove(self, value):
+        if not self.spec.is_nested:
+            value = self.spec.type(value)
+        self.pop(self.store.index(value))
+
+    def clear(self):
+        if self._shared:
+            self._unshare()
+        self._check_length(0)
+        removed = list(self.store)
+        self.store.clear()
+        if self._seen is not None:
+            self._seen.clear()
+        if self._o:
+            self._report(removed=removed)
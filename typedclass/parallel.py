@@ -0,0 +1,72 @@
+"""Batch validation in worker processes
+
+   Validation is CPU-bound Python code, so a single process uses one core
+   however many threads run it. validate_parallel splits the records into
+   chunks, validates each chunk with from_records in a
+   ProcessPoolExecutor, and returns the instances in record order:
+
+       orders = Order.validate_parallel(records, workers=4)
+
+   Records and instances travel between processes by pickle; instances
+   are pickled compactly and aren't validated again (see
+   Typed.__reduce__). The class has to be importable by the workers (a
+   module-level class or a DynamicTyped class), and it only pays off when
+   validating a chunk costs more than pickling it both ways.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+def _chunks(records, size):
+    records = iter(records)
+    while chunk := list(islice(records, size)):
+        yield chunk
+
+
+def _validate(cls, start, chunk, collect):
+    """validate one chunk (in a worker process)"""
+    if not collect:
+        return cls.from_records(chunk), []
+    errors = []
+    result = cls.from_records(chunk, errors)
+    return result, [
+        (start + index, record, err) for index, record, err in errors]
+
+
+def validate_parallel(cls, records, workers=None, chunk_size=1000,
+                      errors=None, executor=None):
+    """build an instance of cls from each record, in worker processes
+
+       This is cls.from_records(records, errors) (see there for records
+       and errors; error indexes count from the start of records) with
+       chunks of chunk_size records validated by up to workers processes
+       (ProcessPoolExecutor's default). At most two chunks per worker
+       are in flight, so records can be a generator over a large input.
+       An executor can be passed in to reuse its processes.
+    """
+    collect = errors is not None
+    result = []
+    pool = executor or ProcessPoolExecutor(workers)
+    try:
+        limit = 2 * getattr(pool, "_max_workers", workers or 1)
+        pending = deque()
+
+        def collect_one():
+            instances, failed = pending.popleft().result()
+            result.extend(instances)
+            if collect:
+                errors.extend(failed)
+
+        start = 0
+        for chunk in _chunks(records, chunk_size):
+            pending.append(pool.submit(_validate, cls, start, chunk, collect))
+            start += len(chunk)
+            if len(pending) >= limit:
+                collect_one()
+        while pending:
+            collect_one()
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+    return result
@@ -0,0 +1,223 @@
+"""Opt-in validation profiling
+
+   Count the calls, cumulative time and failures of each field's
+   validation and serialization, by field and by field type:
+
+       from typedclass import profile
+
+       profile.enable()        # every Typed class (or enable(Order))
+       ...
+       profile.stats()         # see stats for the layout
+       profile.reset()
+       profile.disable()
+
+   Three operations are recorded: "init" (coercion by the constructor,
+   from_dict and from_records), "set" (attribute assignment) and
+   "serialize" (as_dict). Profiling works by recompiling the affected
+   classes with timed coercion functions and by installing timed versions
+   of _setfield and as_dict, so a class that isn't profiled runs exactly
+   the code it would run without this module.
+"""
+import threading
+from time import perf_counter
+
+from typedclass.typed import Typed
+
+
+_ORIGINAL = dict(_setfield=Typed._setfield, as_dict=Typed.as_dict)
+
+_lock = threading.Lock()
+_fields = {}  # (field key, operation) -> _Counter
+_types = {}  # (type name, operation) -> _Counter
+
+
+class _Counter:
+    __slots__ = ("calls", "time", "failures")
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.failures = 0
+
+    def add(self, elapsed, failed):
+        self.calls += 1
+        self.time += elapsed
+        if failed:
+            self.failures += 1
+
+    def as_dict(self):
+        return dict(calls=self.calls, time=self.time, failures=self.failures)
+
+
+def _type_name(field):
+    if hasattr(field.type, "__name__"):
+        return field.type.__name__
+    return field.type.__class__.__name__
+
+
+def _counters(cls, field, operation):
+    """the (field, type) counters for an operation on cls's field"""
+    with _lock:
+        by_field = _fields.setdefault(
+            (f"{cls.__qualname__}.{field.name}", operation), _Counter())
+        by_type = _types.setdefault(
+            (_type_name(field), operation), _Counter())
+    return by_field, by_type
+
+
+def _record(counters, start, failed):
+    elapsed = perf_counter() - start
+    with _lock:
+        for counter in counters:
+            counter.add(elapsed, failed)
+
+
+def timed(cls, field, function, operation="init"):
+    """wrap a function of one value so that its calls are recorded"""
+    counters = _counters(cls, field, operation)
+
+    def _timed(value):
+        start = perf_counter()
+        try:
+            result = function(value)
+        except Exception:
+            _record(counters, start, True)
+            raise
+        _record(counters, start, False)
+        return result
+    return _timed
+
+
+def _setfield(self, field, value):
+    if not self._p:  # a subclass that isn't profiled
+        return _ORIGINAL["_setfield"](self, field, value)
+    counters = _counters(self.__class__, field, "set")
+    start = perf_counter()
+    try:
+        _ORIGINAL["_setfield"](self, field, value)
+    except Exception:
+        _record(counters, start, True)
+        raise
+    _record(counters, start, False)
+
+
+def _as_dict(self, serialize=True):
+    if not self._p:
+        return _ORIGINAL["as_dict"](self, serialize)
+    result = {}
+    if self._k:
+        result[self._k] = self._v[self._k]
+    for field in self._f:
+        if field.name in self._v:
+            value = self._v[field.name]
+            if value and serialize:
+                if field.is_nested:
+                    serializer = field.type.as_dict
+                else:
+                    serializer = getattr(field.type, "serialize", None)
+                if serializer:
+                    counters = _counters(self.__class__, field, "serialize")
+                    start = perf_counter()
+                    try:
+                        value = serializer(value)
+                    except Exception:
+                        _record(counters, start, True)
+                        raise
+                    _record(counters, start, False)
+            result[field.name] = value
+    return result
+
+
+_INSTALLED = dict(_setfield=_setfield, as_dict=_as_dict)
+
+
+def _subclasses(cls):
+    yield cls
+    for sub in cls.__subclasses__():
+        yield from _subclasses(sub)
+
+
+def _recompile(cls):
+    """make cls and its subclasses compile their functions again"""
+    for sub in _subclasses(cls):
+        sub._load = None
+        sub._compile()
+
+
+def _install(cls):
+    cls._p = True
+    for name, function in _INSTALLED.items():
+        if cls is Typed or name not in cls.__dict__:  # not overridden
+            setattr(cls, name, function)
+
+
+def _uninstall(cls):
+    if "_p" in cls.__dict__:
+        if cls is Typed:
+            cls._p = False
+        else:
+            del cls._p
+    for name, function in _INSTALLED.items():
+        if cls.__dict__.get(name) is function:
+            if cls is Typed:
+                setattr(cls, name, _ORIGINAL[name])
+            else:
+                delattr(cls, name)
+
+
+def enable(cls=None):
+    """profile cls and its subclasses (every Typed class if cls is None)
+
+       Classes defined later are profiled if they derive from a profiled
+       class.
+    """
+    if cls is None:
+        disable()
+        cls = Typed
+    _install(cls)
+    _recompile(cls)
+
+
+def disable(cls=None):
+    """stop profiling cls (or every class if cls is None)
+
+       The recorded stats are kept.
+    """
+    if cls is None:
+        for sub in _subclasses(Typed):
+            _uninstall(sub)
+        _recompile(Typed)
+        return
+    _uninstall(cls)
+    if cls._p:  # still profiled through a super-class
+        cls._p = False
+    _recompile(cls)
+
+
+def is_enabled(cls):
+    return bool(cls._p)
+
+
+def stats():
+    """return the counters recorded so far
+
+       The result has a "fields" dict, keyed by "Class.field", and a
+       "types" dict, keyed by the name of the field type. Each maps an
+       operation ("init", "set" or "serialize") to a dict of calls, time
+       (in seconds) and failures.
+    """
+    result = dict(fields={}, types={})
+    with _lock:
+        for kind, counters in (("fields", _fields), ("types", _types)):
+            for (key, operation), counter in counters.items():
+                result[kind].setdefault(key, {})[operation] = \
+                    counter.as_dict()
+    return result
+
+
+def reset():
+    """zero the counters"""
+    with _lock:
+        for counters in (_fields, _types):
+            for counter in counters.values():
+                counter.__init__()
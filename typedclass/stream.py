@@ -0,0 +1,141 @@
+"""Incremental JSON decoding
+
+   Decode JSON documents from a text or binary file a piece at a time so
+   that large exports can be validated without holding the whole decoded
+   payload (and every instance) in memory.
+"""
+import codecs
+import json
+from itertools import islice
+import re
+
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = json.decoder.WHITESPACE.match
+# the rest of a buffer that could be part of the number before it
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z").match
+
+
+class _Reader:
+    """buffered text reader over a text or binary file"""
+
+    def __init__(self, fp, size):
+        self.fp = fp
+        self.size = size
+        self.decode = None
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def more(self):
+        """read another chunk into the buffer; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.size)
+        if not chunk:
+            self.eof = True
+            if self.decode:
+                self.decode.decode(b"", final=True)  # truncated utf-8
+            return False
+        if not isinstance(chunk, str):
+            if self.decode is None:
+                self.decode = codecs.getincrementaldecoder("utf-8-sig")()
+            chunk = self.decode.decode(chunk)
+        # drop what has already been consumed to keep the buffer bounded
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """return the next non-whitespace character ("" at end of file)"""
+        while True:
+            self.pos = _WHITESPACE(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.more():
+                return ""
+
+    def expect(self, chars):
+        char = self.peek()
+        if char == "" or char not in chars:
+            found = repr(char) if char else "end of file"
+            raise ValueError(f"expecting one of {chars!r}, found {found}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.more():
+                    raise
+                continue
+            # a value followed by nothing but (what may be the start of)
+            # the rest of a number may have been split across two reads:
+            # "1" of "12", or "1" of "1.5e3"
+            if not self.eof and _NUMBER_TAIL(self.buffer, end):
+                self.more()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json(fp, size=65536):
+    """yield the items of a JSON array read incrementally from fp
+
+       If the document is a single object, it is yielded by itself.
+    """
+    reader = _Reader(fp, size)
+    if reader.peek() == "{":
+        yield reader.value()
+    else:
+        reader.expect("[")
+        if reader.peek() == "]":
+            reader.pos += 1
+        else:
+            while True:
+                yield reader.value()
+                if reader.expect(",]") == "]":
+                    break
+    if reader.peek() != "":
+        raise ValueError("extra data after JSON document")
+
+
+def iter_ndjson(fp):
+    """yield the value of each (non-blank) line of newline-delimited JSON"""
+    for line in fp:
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_instances(cls, values, chunk_size=None, errors=None):
+    """validate values as cls instances, optionally in lists of chunk_size
+
+       See Typed.from_records for the use of errors; the reported index is
+       the position of the value in the whole stream.
+    """
+    values = iter(values)
+    if not chunk_size:
+        chunk_size, single = 1024, True
+    else:
+        single = False
+
+    offset = 0
+    while chunk := list(islice(values, chunk_size)):
+        if errors is None:
+            instances = cls.from_records(chunk)
+        else:
+            failures = []
+            instances = cls.from_records(chunk, errors=failures)
+            errors.extend(
+                (offset + index, record, err)
+                for index, record, err in failures
+            )
+        offset += len(chunk)
+        if single:
+            yield from instances
+        else:
+            yield instances
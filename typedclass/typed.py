@@ -1,27 +1,74 @@
 """Typed Class System"""
+from collections.abc import MutableMapping
+import weakref
+
+from typedclass.compiler import Lazy, compile_init, compile_json
+from typedclass.compiler import compile_construct, compile_load
+from typedclass.compiler import compile_copy, _merge, _undefined
+from typedclass.compiler import compile_encode, compile_decode
 from typedclass.field import Field
 
 
 class Kwargs:
     """a 'Field' to scoop up remaining keyword arguments"""
 
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance._v[instance._k]
+
+
+_list = None  # typedclass.list (which imports this module)
+
+
+def _import_list():
+    global _list
+    from typedclass import list as _list
+    return _list
+
+
+_codec = None  # typedclass.codec (imported when first used)
+
+
+def _import_codec():
+    global _codec
+    from typedclass import codec as _codec
+    return _codec
+
+
+def _rebuild_error(cls, args):
+    """rebuild a pickled _MessageError without calling its __init__"""
+    err = cls.__new__(cls)
+    err.args = args
+    return err
+
+
+class _MessageError:
+    """mixin for errors whose __init__ builds the message
+
+       They are unpickled from the message itself.
+    """
+
+    def __reduce__(self):
+        return _rebuild_error, (self.__class__, self.args)
 
-class ReservedAttributeError(AttributeError):
+
+class ReservedAttributeError(_MessageError, AttributeError):
     def __init__(self, name):
         self.args = (f"reserved attribute: {name}",)
 
 
-class RequiredAttributeError(AttributeError):
+class RequiredAttributeError(_MessageError, AttributeError):
     def __init__(self, name):
         self.args = (f"missing required attribute: {name}",)
 
 
-class ExtraAttributeError(AttributeError):
+class ExtraAttributeError(_MessageError, AttributeError):
     def __init__(self, name):
-        self.args = (f"extra attribute(s): {', '.join(name)}",)
+        self.args = (f"extra attribute(s): {', '.join(map(str, name))}",)
 
 
-class DuplicateAttributeError(AttributeError):
+class DuplicateAttributeError(_MessageError, AttributeError):
     def __init__(self, name):
         self.args = (f"duplicate attribute: {name}",)
 
@@ -30,38 +77,145 @@ class ReadOnlyFieldError(ValueError):
     """custom exception"""
 
 
-class NoneValueError(ValueError):
+class NoneValueError(_MessageError, ValueError):
     def __init__(self, name):
         self.args = (f"field cannot be null: {name}",)
 
 
-class InvalidNestedTyped(ValueError):
+class InvalidNestedTyped(_MessageError, ValueError):
     def __init__(self, typed_class):
         self.args = (f"expecting {typed_class}",)
 
 
+def _annotate(field, value, err):
+    """add the field's name and type to a coercion error"""
+    if hasattr(field.type, "__name__"):
+        type = field.type.__name__
+    else:
+        type = field.type.__class__.__name__
+    error = (
+        f"invalid <{type}> value ({value}) for field '{field.name}'"
+        f": {str(err)}"
+    )
+    err.args = (error,)
+
+
+class _SlotValues(MutableMapping):
+    """dict-like view of a compact instance's slot values
+
+       Compact instances have no "_v" dict; this view lets code written
+       against "_v" work unchanged (if more slowly) on slot storage.
+    """
+
+    __slots__ = ("instance", "members")
+
+    def __init__(self, instance):
+        self.instance = instance
+        self.members = instance._m
+
+    def __getitem__(self, name):
+        try:
+            return self.members[name].__get__(self.instance)
+        except (KeyError, AttributeError):
+            raise KeyError(name) from None
+
+    def __setitem__(self, name, value):
+        self.members[name].__set__(self.instance, value)
+
+    def __delitem__(self, name):
+        try:
+            self.members[name].__delete__(self.instance)
+        except (KeyError, AttributeError):
+            raise KeyError(name) from None
+
+    def __contains__(self, name):
+        try:
+            self.members[name].__get__(self.instance)
+        except (KeyError, AttributeError):
+            return False
+        return True
+
+    def __iter__(self):
+        return (name for name in self.members if name in self)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+def _add_owner(owners, owner, name):
+    """return owners (or None) with owner, holding a value as name, added
+
+       Owners are kept as (weak reference, field name) pairs.
+    """
+    if owners is None:
+        return [(weakref.ref(owner), name)]
+    if not any(ref() is owner and held == name for ref, held in owners):
+        owners[:] = [item for item in owners if item[0]() is not None]
+        owners.append((weakref.ref(owner), name))
+    return owners
+
+
+def _disown(value, owner, name):
+    """forget owner as holding value (and the items of a List value) as
+       name, once it no longer does
+    """
+    if owners := getattr(value, "_o", None):
+        owners[:] = [
+            (ref, held) for ref, held in owners
+            if ref() is not None and (ref() is not owner or held != name)
+        ]
+    if getattr(value, "spec", None) and value.spec.is_nested:
+        for item in value:
+            _disown(item, owner, name)
+
+
+def _notify(owners):
+    """tell the (live) owners that a value they hold has changed"""
+    for ref, name in owners:
+        if (owner := ref()) is not None:
+            owner._changed(name)
+
+
 class _Model(type):
     """metaclass for typed class
 
        the metaclass digests the fields
+
+       A class created with "compact=True" (and any class derived from
+       it) stores values in one slot per field instead of in "__dict__"
+       and "_v" dicts; unset fields are empty slots.
+
+       A class created with "cached=True" (and any class derived from it)
+       keeps the result of as_dict() and to_json() until the instance, or
+       a Typed or List value nested in it, changes.
+
+       A class created with "tracked=True" (and any class derived from
+       it) records which fields change after an instance is built; see
+       changed_fields, diff and mark_clean.
     """
 
-    def __new__(cls, name, supers, attrs):
+    def __new__(cls, name, supers, attrs, compact=False, cached=False,
+                tracked=False):
 
         fields = {}
+        bound = {}
 
         def add_fields(source):
+            # each class binds its own copy of a Field, so that a Field
+            # object shared by classes (or a mixin's) is never changed
             for key, value in source.items():
                 if isinstance(value, Field):
                     if key in RESERVED:
                         raise ReservedAttributeError(key)
+                    value = value._clone()
                     if isinstance(value.type, type):
                         if issubclass(value.type, Typed):
                             value.is_nested = True
                         else:
                             value.type = value.type()
                     value.name = key
-                    fields[key] = value
+                    value._bind()
+                    fields[key] = bound[key] = value
 
         # grab super-class Fields
         for sup in supers[::-1]:
@@ -69,10 +223,12 @@ class _Model(type):
                 # look in "_f" so we get the super's supers too
                 for fld in sup.__dict__["_f"]:
                     fields[fld.name] = fld
+                    bound.pop(fld.name, None)
             else:
                 add_fields(sup.__dict__)
         # add/overlay Fields from this class
         add_fields(attrs)
+        attrs.update(bound)  # the class's copies are its descriptors
 
         # look for Kwargs
         attrs["_k"] = None
@@ -85,8 +241,89 @@ class _Model(type):
 
         # --- create the "_f" attribute to hold shared field list
         attrs["_f"] = [field for field in fields.values()]
-
-        return super().__new__(cls, name, supers, attrs)
+        attrs["_n"] = dict(fields)
+        attrs["_json"] = Lazy("_json", compile_json)
+        attrs["_construct"] = Lazy("_construct", compile_construct)
+        attrs["_copy"] = Lazy("_copy", compile_copy)
+        attrs["_encode"] = Lazy("_encode", compile_encode)
+        attrs["_decode"] = Lazy("_decode", compile_decode)
+
+        # --- compact classes keep values in slots
+        models = [sup for sup in supers if isinstance(sup, _Model)]
+        attrs["_a"] = cached or any(sup._a for sup in models)
+        attrs["_t"] = tracked or any(sup._t for sup in models)
+        if attrs["_a"]:
+            for method in (_cached_as_dict, _cached_to_json):
+                attrs.setdefault(method.__name__, method)
+        if attrs["_a"] or attrs["_t"]:
+            attrs["_w"] = True
+        attrs["_c"] = compact or any(sup._c for sup in models)
+        if attrs["_c"]:
+            if not all(sup._c or sup is Typed for sup in models):
+                raise TypeError("a compact class can only extend compact"
+                                " (or non-Typed) classes")
+            cls._make_compact(attrs, models)
+
+        new = super().__new__(cls, name, supers, attrs)
+        if attrs["_c"]:
+            names = list(fields) + ([attrs["_k"]] if attrs["_k"] else [])
+            new._m = {name: getattr(new, name) for name in names}
+        if any(isinstance(sup, _Model) for sup in supers):
+            new._compile()
+        return new
+
+    @staticmethod
+    def _make_compact(attrs, models):
+        """replace the Field and Kwargs attrs with slots"""
+        inherited = set()
+        for sup in models:
+            if sup._m:
+                inherited.update(sup._m)
+
+        names = [field.name for field in attrs["_f"]]
+        if attrs["_k"]:
+            names.append(attrs["_k"])
+        for name, value in list(attrs.items()):
+            if isinstance(value, (Field, Kwargs)):
+                del attrs[name]
+        slots = tuple(attrs.get("__slots__", ()))
+        attrs["__slots__"] = slots + tuple(
+            name for name in names if name not in inherited)
+        if not inherited:
+            attrs["_v"] = property(_SlotValues)
+        existing = {
+            name for sup in models for base in sup.__mro__
+            for name in base.__dict__.get("__slots__", ())
+        }
+        extra = ("_o",)  # owners, if an instance is nested in a watched one
+        if attrs["_a"] or attrs["_t"]:
+            extra += ("__weakref__",)
+            extra += ("_s",) if attrs["_a"] else ()
+            extra += ("_d",) if attrs["_t"] else ()
+        attrs["__slots__"] += tuple(
+            name for name in extra if name not in existing)
+
+    def _compile(cls):
+        """install the class's specialized constructor
+
+           The constructor is compiled once the class has been
+           instantiated COMPILE_AFTER times (see compiler.Lazy); until
+           then, _generic_init does the same work field by field, so that
+           defining a class, or making a few instances, costs no code
+           generation. It is always available as "_init". It is also
+           installed as "__init__" unless the class (or a super-class)
+           defines its own "__init__", which will reach "_init" through
+           Typed.__init__.
+        """
+        init = Lazy("_init", compile_init, _generic_init)
+        if cls is not Typed:  # Typed keeps the __init__ that calls _init
+            for sup in cls.__mro__:
+                if "__init__" in sup.__dict__:
+                    if sup is Typed or sup.__dict__["__init__"] is \
+                            sup.__dict__.get("_init"):
+                        cls.__init__ = init
+                    break
+        cls._init = init
 
 
 class Typed(metaclass=_Model):
@@ -98,46 +335,51 @@ class Typed(metaclass=_Model):
               attribute is shared with all instances.
            2. The Typed's "_k" attribute holds the name (or None) of a
               catch-all dict for any unspecified fields.
+           3. Fields are data descriptors; the "_n" attribute maps names
+              to Fields for assignment and deletion.
+           4. Each class gets a constructor compiled for its own fields
+              (see typedclass.compiler) in the "_init" attribute; it is
+              compiled once the class has been instantiated a few times
+              (see compiler.COMPILE_AFTER).
+           5. Per-class functions that aren't needed by every class (such
+              as the "_json" encoder) are compiled on first use.
+           6. Compact classes (class Foo(Typed, compact=True)) keep each
+              value in a slot; "_m" maps names to the slot descriptors and
+              "_v" is a dict-like view of the slots.
+           7. Cached classes ("_a", class Foo(Typed, cached=True)) keep
+              their serialized forms in "_s". Instances of watched
+              classes ("_w": cached and tracked classes) report their
+              changes, and so does any instance (of any class) that a
+              watched instance holds: it keeps its owners (as weak
+              references) in "_o", and tells them about its changes, so
+              that those drop their "_s". Nothing is changed in the
+              classes of the nested instances.
+           8. Tracked classes ("_t", class Foo(Typed, tracked=True)) are
+              watched too, and keep the names of changed fields in "_d".
+           9. Threads: a class's state ("_f", "_n", its Fields and their
+              types) is not changed after the class is created (each
+              class binds its own copies of the Fields it is given), and
+              per-class functions are compiled under a lock. So threads
+              can construct, change and serialize instances at the same
+              time, with no locking, as long as each instance is changed
+              by one thread at a time; an instance (or List value) that
+              is changed by several threads, or cached/tracked values
+              shared between threads, need the caller's lock. Profiling
+              (see typedclass.profile) recompiles classes: enable and
+              disable it while no other thread uses them.
     """
 
-    def __init__(self, *args, **kwargs):
-        self.__dict__["_v"] = {}
-        if self._k:
-            self._v[self._k] = {}
-
-        if len(args) > len(self._f):
-            raise ExtraAttributeError(args[len(self._f):])
-
-        for value, field in zip(args, self._f):
-            if field.name in kwargs:
-                raise DuplicateAttributeError(field.name)
-            kwargs[field.name] = value  # convert args to kwargs
-
-        for name in kwargs.keys():
-            try:
-                self._lookup_field(name)  # look for undefined fields
-            except AttributeError as err:
-                if self._k:
-                    self._v[self._k][name] = kwargs[name]
-                else:
-                    err.args = (f"undefined field name '{name}'",)
-                    raise
+    __slots__ = ()
+    _m = None
+    _load = None
+    _p = False  # profiled (see typedclass.profile)
+    _a = False
+    _t = False
+    _w = False
+    _o = None  # (an instance's owners are set on the instance)
 
-        for field in self._f:
-            if field.is_required:
-                if field.default == Field.NO_DEFAULT:
-                    if field.name not in kwargs:
-                        raise RequiredAttributeError(field.name)
-            if field.default != Field.NO_DEFAULT:
-                if field.name not in kwargs:
-                    kwargs[field.name] = field.default
-
-        for field in self._f:
-            if field.name in kwargs:
-                self._setfield(field, kwargs[field.name])
-                field.after_init(self)
-
-        self.__after_init__()
+    def __init__(self, *args, **kwargs):
+        self._init(*args, **kwargs)
 
     def __after_init__(self):
         pass
@@ -160,49 +402,268 @@ class Typed(metaclass=_Model):
                 result[field.name] = value
         return result
 
+    def to_json(self):
+        """return the instance as JSON text
+
+           Unlike json.dumps(self.as_dict()), nested Typed and List values
+           are written as native JSON (not as embedded JSON strings), and
+           every set value is serialized. The encoder is compiled for the
+           class on first use.
+        """
+        out = []
+        self._json(out)
+        return "".join(out)
+
+    def to_bytes(self):
+        """return the instance in a compact binary form
+
+           See typedclass.codec for the format; from_bytes reads it.
+        """
+        return (_codec or _import_codec()).to_bytes(self)
+
     @classmethod
-    def from_dict(cls, data):
+    def from_bytes(cls, data):
+        """build an instance from the bytes written by to_bytes
 
-        def _from_dict(data):
-            return cls(**{
-                f.name: data[f.name]
-                for f in cls._f
-                if f.name in data  # ignore keys that aren't field names
-            })
+           data is bytes or any buffer (bytearray, memoryview); it is read
+           in place, and the values are not validated again.
+        """
+        return (_codec or _import_codec()).from_bytes(cls, data)
+
+    def dump(self, fp):
+        """write the instance as JSON text to a file"""
+        out = []
+        self._json(out)
+        fp.writelines(out)
+
+    @classmethod
+    def from_dict(cls, data):
 
         if data:
             if isinstance(data, list):
-                result = [_from_dict(item) for item in data]
+                result = cls.from_records(data)
             else:
-                result = _from_dict(data)
+                result = cls.from_records((data,))[0]
         else:
             result = None
         return result
 
-    def __getattribute__(self, name):
-        value = object.__getattribute__(self, name)
-        if isinstance(value, Field):
-            if name not in self._v:
-                raise AttributeError(name)
-            value = self._v[name]
-        if isinstance(value, Kwargs):
-            value = self._v[self._k]
+    @classmethod
+    def from_records(cls, records, errors=None):
+        """build an instance from each record in an iterable
+
+           A record is a dict (keys that aren't field names are ignored)
+           or a sequence of values in field order. The per-class work of
+           resolving fields, defaults and required checks is done once, in
+           a compiled loader, instead of once per record.
+
+           If errors is a list, a record that fails validation is skipped
+           and (index, record, exception) is appended to errors; otherwise
+           the exception is raised.
+        """
+        load = cls._loader()
+        new = cls.__new__
+        result = []
+        if errors is None:
+            for record in records:
+                instance = new(cls)
+                load(instance, record)
+                result.append(instance)
+        else:
+            for index, record in enumerate(records):
+                try:
+                    instance = new(cls)
+                    load(instance, record)
+                except (AttributeError, TypeError, ValueError) as err:
+                    errors.append((index, record, err))
+                else:
+                    result.append(instance)
+        return result
+
+    @classmethod
+    def validate_parallel(cls, records, workers=None, chunk_size=1000,
+                          errors=None):
+        """from_records, with the records validated in worker processes
+
+           See typedclass.parallel.
+        """
+        from typedclass import parallel
 
-        return value
+        return parallel.validate_parallel(
+            cls, records, workers, chunk_size, errors)
+
+    @classmethod
+    def aiter_records(cls, records, chunk_size=100, errors=None,
+                      executor=None):
+        """validate records in chunks without stalling the event loop
+
+           An async generator of lists of instances; see typedclass.aio.
+        """
+        from typedclass import aio
+
+        return aio.aiter_records(
+            cls, records, chunk_size, errors, executor)
+
+    @classmethod
+    def construct(cls, **values):
+        """build an instance from trusted values without validation
+
+           The values (for instance, those of an instance reloaded from
+           a cache) are stored as is: there is no type coercion, no None
+           or required check and no hooks are run. Missing fields still
+           get their defaults, and names that aren't fields go to the
+           Kwargs dict; so construct(**instance.as_dict(serialize=False))
+           rebuilds instance.
+        """
+        instance = cls.__new__(cls)
+        instance._construct(values)
+        return instance
+
+    @classmethod
+    def construct_records(cls, records):
+        """build an instance from each trusted dict in an iterable
+
+           See construct.
+        """
+        new = cls.__new__
+        result = []
+        for record in records:
+            instance = new(cls)
+            instance._construct(record)
+            result.append(instance)
+        return result
+
+    def copy(self):
+        """return a copy of self without validating its values again
+
+           The copy holds the same values: nested Typed values are shared
+           and List values are shared until either list is changed (a
+           List in the copy can be changed without touching self). Use
+           copy.deepcopy for a copy that shares nothing.
+        """
+        new = self._copy()
+        if self._t:
+            new._watch()
+        return new
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        new._restore({
+            name: deepcopy(value, memo) for name, value in self._v.items()
+        })
+        return new
+
+    def replace(self, **changes):
+        """return a copy of self (see copy) with changes applied
+
+           Only the changed values are validated, as the constructor would
+           do it (including after_init hooks and __after_init__); names
+           that aren't fields go to the Kwargs dict (or are rejected).
+        """
+        new = self._copy()
+        for name, value in changes.items():
+            if field := self._n.get(name):
+                new._setfield(field, value)
+                field.after_init(new)
+            elif self._k:
+                new._v[self._k][name] = value
+            else:
+                _undefined(changes, self._n)
+        if self._t:
+            new._watch()
+        new.__after_init__()
+        return new
+
+    def __reduce__(self):
+        """pickle self as its class and a tuple of its values
+
+           The values are in field order (Field.NO_DEFAULT for a field
+           that isn't set), followed by the Kwargs dict; they aren't
+           validated again when unpickled. List values are pickled as
+           plain lists, and cached serializations, change tracking and
+           owners are left out.
+        """
+        list_base = (_list or _import_list())._ListBase
+        values = self._v
+        missing = Field.NO_DEFAULT
+        state = []
+        for field in self._f:
+            value = values.get(field.name, missing)
+            if isinstance(value, list_base):
+                value = value.store
+            state.append(value)
+        if self._k:
+            state.append(values[self._k])
+        return _unpickle, (self.__class__, tuple(state))
+
+    def _restore(self, values):
+        """store values (a dict like "_v") in self, as they are"""
+        if self._c:
+            for name, value in values.items():
+                self._m[name].__set__(self, value)
+        else:
+            self.__dict__["_v"] = values
+        if self._t:
+            self._watch()
+
+    @classmethod
+    def iter_json(cls, fp, chunk_size=None, errors=None):
+        """incrementally validate a JSON array of records from a file
+
+           fp is a text or binary file; instances are yielded one at a
+           time, or in lists of chunk_size, while the file is read. See
+           from_records for the use of errors.
+        """
+        from typedclass import stream
+
+        return stream.iter_instances(
+            cls, stream.iter_json(fp), chunk_size, errors)
+
+    @classmethod
+    def iter_ndjson(cls, fp, chunk_size=None, errors=None):
+        """incrementally validate newline-delimited JSON records
+
+           Like iter_json, but each line of fp is a JSON record.
+        """
+        from typedclass import stream
+
+        return stream.iter_instances(
+            cls, stream.iter_ndjson(fp), chunk_size, errors)
+
+    @classmethod
+    def _loader(cls):
+        """return the class's compiled record loader"""
+        if load := cls.__dict__.get("_load"):
+            return load
+        if cls.__init__ is cls._init:
+            cls._load = compile_load(cls)
+        else:  # honor a custom __init__
+            names = cls._n.keys()
+
+            def _load(self, data):
+                if isinstance(data, dict):
+                    self.__init__(**{
+                        key: value for key, value in data.items()
+                        if key in names  # ignore keys that aren't fields
+                    })
+                else:
+                    self.__init__(*data)
+            cls._load = _load
+        return cls._load
 
     def __setattr__(self, name, value):
-        field = self._lookup_field(name)
-        value = field.before_set(self, value)
-        if field.is_readonly:
-            raise ReadOnlyFieldError(name)
-        self._setfield(field, value)
-        field.after_set(self)
+        self._lookup_field(name).__set__(self, value)
 
     def _lookup_field(self, name):
-        field = object.__getattribute__(self, name)
-        if not isinstance(field, Field):
-            raise AttributeError(name)
-        return field
+        try:
+            return self._n[name]
+        except KeyError:
+            raise AttributeError(name) from None
 
     def _setfield(self, field, value):
         if value is None:
@@ -219,25 +680,206 @@ class Typed(metaclass=_Model):
                 elif not isinstance(value, field.type):
                     raise InvalidNestedTyped(field.type)
             else:
-                value = field.type(value)
+                value = field.coerce(value)
             self._v[field.name] = value
         except ValueError as err:
-            if hasattr(field.type, "__name__"):
-                type = field.type.__name__
-            else:
-                type = field.type.__class__.__name__
-            error = (
-                f"invalid <{type}> value ({value}) for field '{field.name}'"
-                f": {str(err)}"
-            )
-            err.args = (error,)
+            _annotate(field, value, err)
             raise
 
     def __delattr__(self, name):
-        field = self._lookup_field(name)
-        if field.is_required:
-            raise AttributeError("cannot delete a required field")
-        del self._v[name]
+        self._lookup_field(name).__delete__(self)
+
+    def _own(self, owner, name):
+        """record owner as holding self as the value of field name"""
+        object.__setattr__(
+            self, "_o", _add_owner(getattr(self, "_o", None), owner, name))
+
+    def _changed(self, name):
+        """note a change to field name, and tell self's owners
+
+           The serialized forms of self and of its owners are dropped.
+        """
+        if getattr(self, "_s", None) is not None:
+            object.__setattr__(self, "_s", None)
+        if self._t:
+            if (changed := getattr(self, "_d", None)) is None:
+                object.__setattr__(self, "_d", {name})
+            else:
+                changed.add(name)
+        if owners := getattr(self, "_o", None):
+            _notify(owners)
+
+    def _replaced(self, field, old):
+        """note that field was set (or deleted), replacing old (or None)
+
+           Only the old and new values are looked at: self stops owning
+           old, and owns the new value.
+        """
+        if old is not None:
+            _disown(old, self, field.name)
+        self._changed(field.name)
+        self._watch_field(field, self._v.get(field.name))
+
+    def _clean(self):
+        """forget the changes made while self was being built"""
+        if getattr(self, "_d", None):
+            self._d.clear()
+
+    def _watch_field(self, field, value):
+        if value is None:
+            return
+        if field.is_nested:
+            value._own(self, field.name)
+            value._watch()
+        elif isinstance(value, (_list or _import_list())._ListBase):
+            value._own(self, field.name)
+            if value.spec.is_nested:  # (frozen or not)
+                for item in value:
+                    item._own(self, field.name)
+                    item._watch()
+
+    def _watch(self):
+        """become an owner of the Typed and List values self holds"""
+        values = self._v
+        for field in self._f:
+            self._watch_field(field, values.get(field.name))
+
+    def _serialized(self, kind, build):
+        """return a serialized form of self, cached in "_s" """
+        cache = getattr(self, "_s", None)
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, "_s", cache)
+            self._watch()
+        if (value := cache.get(kind)) is None:
+            value = cache[kind] = build(self)
+        return value
+
+    def changed_fields(self):
+        """names of the fields changed since the instance was built (or
+           since mark_clean), in field order; the class must be tracked
+        """
+        self._check_tracked()
+        changed = getattr(self, "_d", None) or ()
+        return [field.name for field in self._f if field.name in changed]
+
+    def diff(self):
+        """serialized values (as in as_dict) of the changed fields
+
+           A field that was deleted maps to None.
+        """
+        values, result = self._v, {}
+        for name in self.changed_fields():  # only these are serialized
+            value = values.get(name)
+            if value:
+                field = self._n[name]
+                if field.is_nested:
+                    value = value.as_dict()
+                elif serializer := getattr(field.type, "serialize", None):
+                    value = serializer(value)
+            result[name] = value
+        return result
+
+    def mark_clean(self):
+        """forget the changes (here and in nested tracked values)"""
+        self._check_tracked()
+        if getattr(self, "_d", None):
+            self._d.clear()
+        values = self._v
+        for field in self._f:
+            value = values.get(field.name)
+            if value is None:
+                continue
+            if field.is_nested:
+                items = (value,)
+            elif getattr(value, "spec", None) and value.spec.is_nested:
+                items = value
+            else:
+                continue
+            for item in items:
+                if item._t:
+                    item.mark_clean()
+
+    def _check_tracked(self):
+        if not self._t:
+            raise TypeError(
+                f"{self.__class__.__qualname__} is not a tracked class")
+
+
+def _unpickle(cls, state):
+    """rebuild an instance from the state made by Typed.__reduce__"""
+    spec = (_list or _import_list()).List
+    missing = Field.NO_DEFAULT
+    values = {}
+    for field, value in zip(cls._f, state):
+        if value is missing:
+            continue
+        if value is not None and isinstance(field.type, spec):
+            value = field.type.construct(value)
+        values[field.name] = value
+    if cls._k:
+        values[cls._k] = state[-1]
+    instance = cls.__new__(cls)
+    instance._restore(values)
+    return instance
+
+
+def _generic_init(self, *args, **kwargs):
+    """the constructor of a class that isn't compiled yet (see _compile)
+
+       It behaves exactly like the compiled constructor (see
+       compiler.compile_init).
+    """
+    cls = self.__class__
+    if args:
+        _merge(cls._f, args, kwargs)
+    names = cls._n
+    if not cls._c:
+        self.__dict__["_v"] = {}
+    if cls._k:
+        self._v[cls._k] = {
+            name: value for name, value in kwargs.items()
+            if name not in names
+        }
+    elif not kwargs.keys() <= names.keys():
+        _undefined(kwargs, names)
+    missing = Field.NO_DEFAULT
+    for field in cls._f:
+        if field.is_required and field.default is missing and \
+                field.name not in kwargs:
+            raise RequiredAttributeError(field.name)
+    for field in cls._f:
+        if (value := kwargs.get(field.name, field.default)) is not missing:
+            self._setfield(field, value)
+            if field._after_init:
+                field.after_init(self)
+    if cls._t:
+        self._watch()
+    self.__after_init__()
+    if cls._t:
+        self._clean()
+
+
+def _cached_as_dict(self, serialize=True):
+    """as_dict for cached classes
+
+       The serialized dict is shared by the calls that return it (until
+       the instance changes); treat it as read-only.
+    """
+    if not serialize:
+        return Typed.as_dict(self, False)
+    return self._serialized("as_dict", Typed.as_dict)
+
+
+_cached_as_dict.__name__ = "as_dict"
+
+
+def _cached_to_json(self):
+    return self._serialized("to_json", Typed.to_json)
+
+
+_cached_to_json.__name__ = "to_json"
 
 
-RESERVED = dir(Typed)
+Typed._compile()
+RESERVED = frozenset(dir(Typed))
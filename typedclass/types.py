@@ -1,7 +1,18 @@
-from datetime import date, datetime
-import decimal
+import functools
 import json
-import re
+from json.encoder import encode_basestring_ascii
+
+
+# decimal and datetime are imported when a type that needs them is created
+# (see _import), so that programs which don't use them don't load them
+decimal = date = datetime = None
+
+
+def _import():
+    global decimal, date, datetime
+    if decimal is None:
+        import decimal
+        from datetime import date, datetime
 
 
 class Boolean:
@@ -18,11 +29,18 @@ class Boolean:
     def serialize(self, value):
         return 1 if value else 0
 
+    def to_json(self, value):
+        return "1" if value else "0"
+
 
 class Decimal:
     def __init__(self, precision):
+        _import()
         self.precision = int(precision)
 
+    def __reduce__(self):  # (so that unpickling imports decimal)
+        return self.__class__, (self.precision,)
+
     def __call__(self, value):
         try:
             return round(decimal.Decimal(value), self.precision)
@@ -32,46 +50,111 @@ class Decimal:
     def serialize(self, value):
         return f"{value:>.{self.precision}f}"
 
+    def to_json(self, value):
+        return f'"{value:>.{self.precision}f}"'
+
 
 class Integer:
     @classmethod
     def __call__(cls, value):
-        if not re.match(r"\d+$", str(value)):
+        if not str(value).isdecimal():
             raise ValueError("not an integer")
         return int(value)
 
+    @classmethod
+    def to_json(cls, value):
+        return str(value)
+
+
+def _memoize(function, size):
+    """wrap function in a bounded LRU cache (if size is not 0)
+
+       Arguments are cached by type as well as value, so that (for
+       instance) 1 and True are kept apart.
+    """
+    if not size:
+        return function
+    return functools.lru_cache(maxsize=size, typed=True)(function)
+
+
+def _parse_date(value):
+    try:
+        return date.fromisoformat(value)
+    except TypeError as err:
+        raise ValueError(err) from err
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _parse_datetime(value):
+    try:
+        return datetime.fromisoformat(value)
+    except TypeError as err:
+        raise ValueError(err) from err
+    except ValueError:
+        if value[-1:] in ("Z", "z"):  # not supported before python 3.11
+            try:
+                return datetime.fromisoformat(value[:-1] + "+00:00")
+            except ValueError:
+                pass
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+
 
 class ISODate:
-    @classmethod
-    def __call__(cls, value):
+    """date in ISO-8601 format
+
+       Values are parsed with date.fromisoformat, falling back to
+       strptime for the non-padded forms (e.g. 2020-2-3) that it rejects.
+       (To skip parsing repeated values, use Field(ISODate, cache=N).)
+    """
+    def __init__(self):
+        _import()
+
+    def __call__(self, value):
         if not isinstance(value, date):
-            try:
-                value = datetime.strptime(value, "%Y-%m-%d").date()
-            except TypeError as err:
-                raise ValueError(err) from err
+            value = _parse_date(value)
         return value
 
+    def __reduce__(self):  # (so that unpickling imports datetime)
+        return self.__class__, ()
+
     @classmethod
     def serialize(cls, value):
         return value.isoformat()
 
+    @classmethod
+    def to_json(cls, value):
+        return f'"{value.isoformat()}"'
+
 
 class ISODateTime:
-    @classmethod
-    def __call__(cls, value):
+    """datetime in ISO-8601 format
+
+       Accepts "T" or " " separators, fractional seconds and UTC offsets
+       (including "Z").
+    """
+    def __init__(self):
+        _import()
+
+    def __call__(self, value):
         if not isinstance(value, datetime):
-            try:
-                value = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
-            except TypeError as err:
-                raise ValueError(err) from err
+            value = _parse_datetime(value)
         return value
 
+    def __reduce__(self):
+        return self.__class__, ()
+
     @classmethod
     def serialize(cls, value):
         return value.isoformat()
 
+    @classmethod
+    def to_json(cls, value):
+        return f'"{value.isoformat()}"'
+
 
 class Json:
+    is_mutable = True
 
     @classmethod
     def __call__(self, value):
@@ -86,6 +169,10 @@ class Json:
     def serialize(cls, value):
         return json.dumps(value)
 
+    @classmethod
+    def to_json(cls, value):
+        return json.dumps(value, separators=(",", ":"))
+
 
 class Set:
     def __init__(self, *args, name=None):
@@ -98,6 +185,9 @@ class Set:
             raise ValueError(f"must be one of {self.valid}")
         return value
 
+    def to_json(self, value):
+        return json.dumps(value)
+
 
 class String:
     def __init__(self, min=0, max=None):
@@ -117,3 +207,6 @@ class String:
             if len(value) > self.max:
                 raise ValueError(f"length is longer than maximum({self.max})")
         return value
+
+    def to_json(self, value):
+        return encode_basestring_ascii(value)